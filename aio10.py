@@ -0,0 +1,155 @@
+""" asyncio interface to Math10 and CMath10.
+
+    z = await aio10.exp(CMath10(1, 1), prec=10000)
+
+Each call runs in a worker thread under a copy of the caller's
+decimal context (with prec overridden if given), so a long
+computation does not block the event loop.  Cancelling the awaiting
+task stops the worker at the next series iteration, and at most
+max_concurrency() computations run at once; further calls wait
+their turn without occupying a thread.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from decimal import getcontext, localcontext
+import os
+import threading
+import weakref
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10
+from math10 import Math10, cancel_scope
+
+_STATE = {
+    'limit': os.cpu_count() or 1,
+    'executor': None,
+    'semaphores': weakref.WeakKeyDictionary(),
+}
+_STATE_LOCK = threading.Lock()
+
+
+def max_concurrency():
+    """ how many computations may run at the same time """
+    return _STATE['limit']
+
+
+def set_max_concurrency(limit):
+    """ change the concurrency bound; calls already running finish
+        under the old bound """
+    if limit < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    with _STATE_LOCK:
+        executor = _STATE['executor']
+        _STATE['limit'] = limit
+        _STATE['executor'] = None
+        _STATE['semaphores'] = weakref.WeakKeyDictionary()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _executor():
+    """ the shared worker pool, created on first use """
+    with _STATE_LOCK:
+        if _STATE['executor'] is None:
+            _STATE['executor'] = ThreadPoolExecutor(
+                    max_workers=_STATE['limit'],
+                    thread_name_prefix='aio10')
+        return _STATE['executor']
+
+
+def _semaphore(loop):
+    """ the concurrency bound for this event loop """
+    with _STATE_LOCK:
+        semaphores = _STATE['semaphores']
+        if loop not in semaphores:
+            semaphores[loop] = asyncio.Semaphore(_STATE['limit'])
+        return semaphores[loop]
+
+
+def _work(event, ctx, func, args):
+    """ worker thread body """
+    with localcontext(ctx), cancel_scope(event):
+        return func(*args)
+
+
+async def run(func, *args, prec=None):
+    """ await func(*args), computed in a worker thread """
+    ctx = getcontext().copy()
+    if prec is not None:
+        ctx.prec = prec
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphore(loop)
+    await semaphore.acquire()
+    event = threading.Event()
+    try:
+        future = _executor().submit(_work, event, ctx, func, args)
+    except BaseException:
+        semaphore.release()
+        raise
+    # the slot is freed when the worker finishes, not when the
+    # awaiting task gives up, so a cancelled call still counts
+    # against the bound until it has actually stopped
+    future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(semaphore.release))
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        event.set()
+        raise
+
+
+# Math10 inherits decimal's name for the natural logarithm
+_SCALAR_NAMES = {'log': 'ln'}
+
+
+def _apply(name, z):
+    """ z.name() for CMath10 and Math10 arguments alike """
+    if not isinstance(z, CMath10):
+        z = Math10(z)
+        name = _SCALAR_NAMES.get(name, name)
+    return getattr(z, name)()
+
+
+def _make(name):
+    """ build the coroutine function for the method called name """
+    async def call(z, prec=None):
+        return await run(_apply, name, z, prec=prec)
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f""" await z.{name}() in a worker thread """
+    return call
+
+
+async def pi(prec=None):
+    """ await Math10.pi() in a worker thread """
+    return await run(Math10.pi, prec=prec)
+
+
+async def e(prec=None):
+    """ await Math10.e() in a worker thread """
+    return await run(Math10.e, prec=prec)
+
+
+acos = _make('acos')
+acosh = _make('acosh')
+asin = _make('asin')
+asinh = _make('asinh')
+atan = _make('atan')
+atanh = _make('atanh')
+cos = _make('cos')
+cosh = _make('cosh')
+exp = _make('exp')
+log = _make('log')
+log10 = _make('log10')
+sin = _make('sin')
+sinh = _make('sinh')
+sqrt = _make('sqrt')
+tan = _make('tan')
+tanh = _make('tanh')
@@ -0,0 +1,608 @@
+""" Ball arithmetic on top of Math10 and CMath10.
+
+A Ball is a midpoint and a radius; the true value is guaranteed to
+lie in [mid - rad, mid + rad].  A CBall is a pair of Balls, one per
+component.  Every operation widens the radius enough to cover both
+the incoming radii and its own rounding error, so the radius of a
+result says how many of its digits can be trusted.
+
+Midpoints are rounded to the context precision; radii carry only
+RAD_DIGITS digits and are always rounded up.  Arithmetic is bounded
+exactly.  The transcendental functions are evaluated at GUARD extra
+digits, and their evaluation error is bounded by assuming the
+Math10 routines are good to a few units in the last place of that
+working precision.
+
+certify() uses the radius to find the smallest precision that gives
+the requested number of correct digits.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import (Context, Decimal, ROUND_CEILING, ROUND_FLOOR,
+                     getcontext, localcontext)
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10
+from math10 import Math10
+
+# significant digits kept in a radius
+RAD_DIGITS = 5
+
+# extra digits used when evaluating a transcendental function
+GUARD = 10
+
+_UP = Context(prec=RAD_DIGITS, rounding=ROUND_CEILING)
+
+
+def _up(x):
+    """ x rounded up to RAD_DIGITS digits """
+    return _UP.plus(x)
+
+
+def _ulp(x):
+    """ one unit in the last place of x at the current precision """
+    if not x or not x.is_finite():
+        return Decimal(0)
+    return Decimal(1).scaleb(x.adjusted() - getcontext().prec + 1)
+
+
+def _eval_error(value, arg):
+    """ bound on the error of a function evaluated at GUARD extra
+        digits; the arg term covers argument reduction """
+    return _up((abs(value) + abs(arg) + 1)
+               * Decimal(1).scaleb(3 - getcontext().prec - GUARD))
+
+
+def _eval(func, x):
+    """ func(x) at GUARD extra digits, as a plain Decimal """
+    with localcontext() as ctx:
+        ctx.prec += GUARD
+        return Decimal(func(Math10(x)))
+
+
+def _coerce(x):
+    """ an exact Ball from a Ball, Decimal, Math10 or int """
+    if isinstance(x, Ball):
+        return x
+    if isinstance(x, (int, Decimal)):
+        return Ball(x)
+    return NotImplemented
+
+
+class Ball:
+    """ real ball: every value in [mid - rad, mid + rad] """
+    __slots__ = ('mid', 'rad')
+
+    def __init__(self, mid, rad=0):
+        self.mid = Decimal(mid)
+        self.rad = _up(Decimal(rad))
+
+
+    @classmethod
+    def _rounded(cls, mid, rad=0):
+        """ round mid to the context precision and widen rad to match """
+        rounded = +mid
+        return cls(rounded, _UP.add(_UP.add(rad, abs(rounded - mid)),
+                                    _ulp(rounded)))
+
+
+    @classmethod
+    def _interval(cls, lo, hi):
+        """ the smallest ball around [lo, hi] """
+        with localcontext() as ctx:
+            ctx.prec += GUARD
+            mid = (lo + hi) / 2
+            rad = max(hi - mid, mid - lo)
+        return cls._rounded(mid, rad)
+
+
+    def __repr__(self):
+        return f"Ball('{self.mid}', '{self.rad}')"
+
+
+    def lower(self):
+        """ lower end of the ball, rounded down """
+        return Context(prec=getcontext().prec + GUARD,
+                       rounding=ROUND_FLOOR).subtract(self.mid, self.rad)
+
+
+    def upper(self):
+        """ upper end of the ball, rounded up """
+        return Context(prec=getcontext().prec + GUARD,
+                       rounding=ROUND_CEILING).add(self.mid, self.rad)
+
+
+    def contains(self, x):
+        """ is the number x inside the ball? """
+        return self.lower() <= Decimal(x) <= self.upper()
+
+
+    def accurate_digits(self):
+        """ number of significant digits of mid that the radius
+            guarantees """
+        if not self.rad:
+            return getcontext().prec
+        if not self.mid:
+            return 0
+        return max(0, self.mid.adjusted() - self.rad.adjusted() - 1)
+
+
+    def to_math10(self):
+        """ the midpoint as a Math10 """
+        return Math10(self.mid)
+
+# ----- arithmetic ----- #
+
+    def __neg__(self):
+        return Ball(-self.mid, self.rad)
+
+
+    def __add__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return Ball._rounded(self.mid + other.mid,
+                             _UP.add(self.rad, other.rad))
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return Ball._rounded(self.mid - other.mid,
+                             _UP.add(self.rad, other.rad))
+
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+
+    def __mul__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        rad = _UP.add(_UP.add(_UP.multiply(abs(self.mid), other.rad),
+                              _UP.multiply(abs(other.mid), self.rad)),
+                      _UP.multiply(self.rad, other.rad))
+        return Ball._rounded(self.mid * other.mid, rad)
+
+    __rmul__ = __mul__
+
+
+    def reciprocal(self):
+        """ 1 / self """
+        low = abs(self.mid) - self.rad
+        if low <= 0:
+            raise ZeroDivisionError("ball contains zero")
+        down = Context(prec=RAD_DIGITS, rounding=ROUND_FLOOR)
+        # |1/x - 1/m| <= r / (|m| (|m| - r)) on the ball
+        rad = _UP.divide(self.rad, down.multiply(abs(self.mid),
+                                                 down.plus(low)))
+        return Ball._rounded(1 / self.mid, rad)
+
+
+    def __truediv__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        if not other.rad:
+            return Ball._rounded(self.mid / other.mid,
+                                 _UP.divide(self.rad, abs(other.mid)))
+        return self * other.reciprocal()
+
+
+    def __rtruediv__(self, other):
+        return _coerce(other) * self.reciprocal()
+
+
+    def sqr(self):
+        """ self * self, without the spurious negative part """
+        lo, hi = self.lower(), self.upper()
+        if lo <= 0 <= hi:
+            top = max(-lo, hi)
+            with localcontext() as ctx:
+                ctx.prec += GUARD
+                ctx.rounding = ROUND_CEILING
+                return Ball._interval(Decimal(0), top * top)
+        return self * self
+
+# ----- constants ----- #
+
+    @classmethod
+    def pi(cls):
+        """ ball around pi """
+        with localcontext() as ctx:
+            ctx.prec += GUARD
+            value = Decimal(Math10.pi())
+        return cls._rounded(value, _eval_error(value, 0))
+
+
+    @classmethod
+    def e(cls):
+        """ ball around e """
+        with localcontext() as ctx:
+            ctx.prec += GUARD
+            value = Decimal(1).exp()
+        return cls._rounded(value, _eval_error(value, 0))
+
+# ----- functions ----- #
+
+    def _monotone(self, func, increasing=True):
+        """ image of the ball under a monotone function """
+        lo, hi = self.lower(), self.upper()
+        f_lo, f_hi = _eval(func, lo), _eval(func, hi)
+        if not increasing:
+            f_lo, f_hi, lo, hi = f_hi, f_lo, hi, lo
+        return Ball._interval(f_lo - _eval_error(f_lo, lo),
+                              f_hi + _eval_error(f_hi, hi))
+
+
+    def _lipschitz(self, func, slope):
+        """ image under a function whose |derivative| <= slope """
+        value = _eval(func, self.mid)
+        rad = _UP.add(_UP.multiply(slope, self.rad),
+                      _eval_error(value, self.mid))
+        return Ball._rounded(value, rad)
+
+
+    def _check(self, low=None, high=None, name="Math10", strict=False):
+        """ domain check: the whole ball must lie between low and high """
+        lo, hi = self.lower(), self.upper()
+        if strict:
+            bad = ((low is not None and lo <= low)
+                   or (high is not None and hi >= high))
+        else:
+            bad = ((low is not None and lo < low)
+                   or (high is not None and hi > high))
+        if bad:
+            raise ValueError(f"{name} domain error: {self!r}")
+
+
+    def exp(self):
+        """ exponential """
+        return self._monotone(Math10.exp)
+
+
+    def ln(self):
+        """ natural logarithm """
+        self._check(0, name="ln", strict=True)
+        return self._monotone(Math10.ln)
+
+
+    def log10(self):
+        """ decimal logarithm """
+        self._check(0, name="log10", strict=True)
+        return self._monotone(Math10.log10)
+
+
+    def sqrt(self):
+        """ square root; a ball reaching just below zero is clipped """
+        lo, hi = self.lower(), self.upper()
+        if hi < 0:
+            raise ValueError(f"sqrt domain error: {self!r}")
+        if lo < 0:
+            lo = Decimal(0)
+        root_lo, root_hi = _eval(Math10.sqrt, lo), _eval(Math10.sqrt, hi)
+        return Ball._interval(root_lo - _eval_error(root_lo, lo),
+                              root_hi + _eval_error(root_hi, hi))
+
+
+    def sin(self):
+        """ sine """
+        return self._lipschitz(Math10.sin, 1)
+
+
+    def cos(self):
+        """ cosine """
+        return self._lipschitz(Math10.cos, 1)
+
+
+    def tan(self):
+        """ tangent; fails if the ball might contain a pole """
+        lo, hi = self.lower(), self.upper()
+        # an interval shorter than pi holds at most one zero of cos,
+        # and a simple zero changes the sign
+        if hi - lo >= 3 or (_eval(Math10.cos, lo) > 0) != \
+                (_eval(Math10.cos, hi) > 0):
+            raise ValueError(f"tan: ball may contain a pole: {self!r}")
+        return self._monotone(Math10.tan)
+
+
+    def asin(self):
+        """ inverse sine """
+        self._check(-1, 1, name="asin")
+        return self._monotone(Math10.asin)
+
+
+    def acos(self):
+        """ inverse cosine """
+        self._check(-1, 1, name="acos")
+        return self._monotone(Math10.acos, increasing=False)
+
+
+    def atan(self):
+        """ inverse tangent """
+        return self._monotone(Math10.atan)
+
+
+    def sinh(self):
+        """ hyperbolic sine """
+        return self._monotone(Math10.sinh)
+
+
+    def cosh(self):
+        """ hyperbolic cosine """
+        lo, hi = self.lower(), self.upper()
+        if lo >= 0:
+            return self._monotone(Math10.cosh)
+        if hi <= 0:
+            return self._monotone(Math10.cosh, increasing=False)
+        top = _eval(Math10.cosh, max(-lo, hi))
+        return Ball._interval(Decimal(1),
+                              top + _eval_error(top, max(-lo, hi)))
+
+
+    def tanh(self):
+        """ hyperbolic tangent """
+        return self._monotone(Math10.tanh)
+
+
+    def asinh(self):
+        """ inverse hyperbolic sine """
+        return self._monotone(Math10.asinh)
+
+
+    def acosh(self):
+        """ inverse hyperbolic cosine """
+        self._check(1, name="acosh")
+        return self._monotone(Math10.acosh)
+
+
+    def atanh(self):
+        """ inverse hyperbolic tangent """
+        self._check(-1, 1, name="atanh", strict=True)
+        return self._monotone(Math10.atanh)
+
+
+def _ccoerce(z):
+    """ a CBall from a CBall, Ball, CMath10 or real number """
+    if isinstance(z, CBall):
+        return z
+    if isinstance(z, CMath10):
+        return CBall(z.real, z.imag)
+    if isinstance(z, (Ball, int, Decimal)):
+        return CBall(z, 0)
+    return NotImplemented
+
+
+class CBall:
+    """ complex ball: a rectangle given by a Ball per component """
+    __slots__ = ('real', 'imag')
+
+    def __init__(self, real, imag=0):
+        self.real = real if isinstance(real, Ball) else Ball(real)
+        self.imag = imag if isinstance(imag, Ball) else Ball(imag)
+
+
+    def __repr__(self):
+        return f"CBall({self.real!r}, {self.imag!r})"
+
+
+    def contains(self, z):
+        """ is the CMath10 (or complex) z inside the rectangle? """
+        return self.real.contains(z.real) and self.imag.contains(z.imag)
+
+
+    def accurate_digits(self):
+        """ digits guaranteed in both components, measured against
+            the magnitude so that a tiny component does not count """
+        scale = max(abs(self.real.mid), abs(self.imag.mid))
+        rad = max(self.real.rad, self.imag.rad)
+        if not rad:
+            return getcontext().prec
+        if not scale:
+            return 0
+        return max(0, scale.adjusted() - rad.adjusted() - 1)
+
+
+    def to_cmath10(self):
+        """ the midpoint as a CMath10 """
+        return CMath10(self.real.mid, self.imag.mid)
+
+# ----- arithmetic ----- #
+
+    def __neg__(self):
+        return CBall(-self.real, -self.imag)
+
+
+    def __add__(self, other):
+        other = _ccoerce(other)
+        if other is NotImplemented:
+            return other
+        return CBall(self.real + other.real, self.imag + other.imag)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other):
+        other = _ccoerce(other)
+        if other is NotImplemented:
+            return other
+        return CBall(self.real - other.real, self.imag - other.imag)
+
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+
+    def __mul__(self, other):
+        other = _ccoerce(other)
+        if other is NotImplemented:
+            return other
+        return CBall(self.real * other.real - self.imag * other.imag,
+                     self.real * other.imag + self.imag * other.real)
+
+    __rmul__ = __mul__
+
+
+    def __truediv__(self, other):
+        other = _ccoerce(other)
+        if other is NotImplemented:
+            return other
+        den = other.real.sqr() + other.imag.sqr()
+        return CBall(
+            (self.real * other.real + self.imag * other.imag) / den,
+            (self.imag * other.real - self.real * other.imag) / den)
+
+
+    def __rtruediv__(self, other):
+        return _ccoerce(other).__truediv__(self)
+
+
+    def norm(self):
+        """ |z|^2 as a Ball """
+        return self.real.sqr() + self.imag.sqr()
+
+
+    def abs(self):
+        """ |z| as a Ball """
+        return self.norm().sqrt()
+
+
+    def phase(self):
+        """ arg z as a Ball; fails on the negative real axis branch
+            cut unless the imaginary part is an exact (signed) zero """
+        x, y = self.real, self.imag
+        if x.lower() > 0:
+            return (y / x).atan()
+        if y.lower() > 0:
+            return Ball.pi() / 2 - (x / y).atan()
+        if y.upper() < 0:
+            return -Ball.pi() / 2 - (x / y).atan()
+        if not y.rad and not y.mid and x.upper() < 0:
+            return Ball.pi() if not y.mid.is_signed() else -Ball.pi()
+        raise ValueError(f"phase: ball meets the branch cut: {self!r}")
+
+# ----- functions ----- #
+
+    def exp(self):
+        """ exp(x + iy) = exp(x) (cos y + i sin y) """
+        mag = self.real.exp()
+        return CBall(mag * self.imag.cos(), mag * self.imag.sin())
+
+
+    def log(self):
+        """ natural logarithm """
+        return CBall(self.norm().ln() / 2, self.phase())
+
+
+    def log10(self):
+        """ decimal logarithm """
+        return self.log() / Ball(10).ln()
+
+
+    def sqrt(self):
+        """ principal square root """
+        r = self.abs()
+        x, y = self.real, self.imag
+        re_part = ((r + x) / 2).sqrt()
+        im_part = ((r - x) / 2).sqrt()
+        if y.lower() >= 0 and not y.mid.is_signed():
+            return CBall(re_part, im_part)
+        if y.upper() <= 0:
+            return CBall(re_part, -im_part)
+        if x.lower() > 0:
+            return CBall(re_part, y / (2 * re_part))
+        raise ValueError(f"sqrt: ball meets the branch cut: {self!r}")
+
+
+    def sin(self):
+        """ sin(x + iy) = sin x cosh y + i cos x sinh y """
+        x, y = self.real, self.imag
+        return CBall(x.sin() * y.cosh(), x.cos() * y.sinh())
+
+
+    def cos(self):
+        """ cos(x + iy) = cos x cosh y - i sin x sinh y """
+        x, y = self.real, self.imag
+        return CBall(x.cos() * y.cosh(), -(x.sin() * y.sinh()))
+
+
+    def tan(self):
+        """ complex tangent """
+        return self.sin() / self.cos()
+
+
+    def sinh(self):
+        """ sinh(x + iy) = sinh x cos y + i cosh x sin y """
+        x, y = self.real, self.imag
+        return CBall(x.sinh() * y.cos(), x.cosh() * y.sin())
+
+
+    def cosh(self):
+        """ cosh(x + iy) = cosh x cos y + i sinh x sin y """
+        x, y = self.real, self.imag
+        return CBall(x.cosh() * y.cos(), x.sinh() * y.sin())
+
+
+    def tanh(self):
+        """ complex hyperbolic tangent """
+        return self.sinh() / self.cosh()
+
+
+    def asin(self):
+        """ asin z = -i log(iz + sqrt(1 - z^2)) """
+        i = CBall(0, 1)
+        return -i * (i * self + (1 - self * self).sqrt()).log()
+
+
+    def acos(self):
+        """ acos z = -i log(z + i sqrt(1 - z^2)) """
+        i = CBall(0, 1)
+        return -i * (self + i * (1 - self * self).sqrt()).log()
+
+
+    def atan(self):
+        """ atan z = (i/2) log((1 - iz) / (1 + iz)) """
+        i = CBall(0, 1)
+        iz = i * self
+        return i * ((1 - iz) / (1 + iz)).log() / 2
+
+
+    def asinh(self):
+        """ asinh z = log(z + sqrt(z^2 + 1)) """
+        return (self + (self * self + 1).sqrt()).log()
+
+
+    def acosh(self):
+        """ acosh z = log(z + sqrt(z^2 - 1)) """
+        return (self + (self * self - 1).sqrt()).log()
+
+
+    def atanh(self):
+        """ atanh z = log((1 + z) / (1 - z)) / 2 """
+        return ((1 + self) / (1 - self)).log() / 2
+
+
+def certify(func, arg, digits, guard=4):
+    """ evaluate func on the exact ball around arg (a number or
+        CMath10), raising the precision until the result has digits
+        correct digits; returns the ball, computed at the smallest
+        precision tried that was good enough """
+    while guard <= 8 * digits + 64:
+        with localcontext() as ctx:
+            ctx.prec = digits + guard
+            ball = func(_ccoerce(arg) if isinstance(arg, CMath10)
+                        else Ball(arg))
+            if ball.accurate_digits() >= digits:
+                return ball
+        guard *= 2
+    raise ValueError(f"cannot certify {digits} digits")
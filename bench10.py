@@ -0,0 +1,687 @@
+""" Benchmarks for math10, cmath10 and the modules built on them.
+
+Usage: python bench10.py [name ...]
+
+With no names every benchmark runs.  Each benchmark prints a small
+table; the numbers are wall-clock seconds from time.perf_counter.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import getcontext, localcontext
+from decimal import Decimal
+import os
+import pickle
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# ----- Local libraries ----- #
+import cheb10
+import cmath10
+import core10
+from cmath10 import CMath10, format_many, fsum, isclose_many
+from cmath10 import CorrectlyRoundedAdapter, FastPathAdapter, StdLibAdapter
+from fft10 import fft_columns
+from linalg10 import Matrix
+import serial10
+from sweep10 import sweep, sweep_columns
+from math10 import Math10, clear_constant_cache
+from math10 import StdLibAdapter as StdLibAdapter10
+from parallel10 import evaluate_many, gil_enabled
+
+
+def timed(func, *args):
+    """ return (seconds, result) for one call of func(*args) """
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def bench_threads(count=64, prec=60, workers=(1, 2, 4, 8)):
+    """ scaling of evaluate_many with the number of worker threads """
+    print(f"threads: {count} x CMath10.exp at prec {prec}, "
+          f"GIL enabled: {gil_enabled()}")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        args = [CMath10(k, 1) / CMath10(count, 0) for k in range(count)]
+        evaluate_many(CMath10.exp, args, 1)    # warm the constant cache
+        base = None
+        for n in workers:
+            seconds, _ = timed(evaluate_many, CMath10.exp, args, n)
+            base = base or seconds
+            print(f"  workers {n:3d}: {seconds:8.4f}s  "
+                  f"speedup {base / seconds:5.2f}")
+
+
+def bench_fast_path(prec=12, repeat=200):
+    """ float fast path against the decimal paths at HP-35 precision """
+    names = ['exp', 'log', 'sqrt', 'sin', 'cos', 'tan', 'atan', 'sinh']
+    args = [CMath10('0.5', '0.25'), CMath10(-2, '1.5'), CMath10('3.7', 0)]
+    print(f"fast path: prec {prec}, {repeat} x {len(args)} calls per cell")
+    print("  function  decimal   correct   fast      speedup")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        for name in names:
+            row = []
+            for adapter in (StdLibAdapter, CorrectlyRoundedAdapter,
+                            FastPathAdapter):
+                func = getattr(adapter, name)
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    for z in args:
+                        func(z)
+                row.append(time.perf_counter() - start)
+            print(f"  {name:8s} {row[0]:8.4f}s {row[1]:8.4f}s "
+                  f"{row[2]:8.4f}s {row[0] / row[2]:6.1f}x")
+
+
+def bench_axis(prec=32, repeat=50):
+    """ real- and imaginary-axis dispatch against the general path;
+        the general column nudges the argument off the axis by 1e-40 """
+    names = ['exp', 'log', 'sqrt', 'sin', 'cos', 'tan', 'sinh', 'cosh',
+             'tanh', 'asin', 'acos', 'atan', 'asinh', 'atanh']
+    print(f"axis: prec {prec}, {repeat} calls per cell")
+    print("  function  real      general   saving  imag      general   saving")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        tiny = '1e-40'
+        cases = [(CMath10('0.5', 0), CMath10('0.5', tiny)),
+                 (CMath10(0, '0.5'), CMath10(tiny, '0.5'))]
+        for name in names:
+            row = []
+            for axis, general in cases:
+                for z in (axis, general):
+                    func = getattr(z, name)
+                    start = time.perf_counter()
+                    for _ in range(repeat):
+                        func()
+                    row.append(time.perf_counter() - start)
+            print(f"  {name:8s} {row[0]:8.4f}s {row[1]:8.4f}s "
+                  f"{row[1] / row[0]:5.1f}x {row[2]:8.4f}s {row[3]:8.4f}s "
+                  f"{row[3] / row[2]:5.1f}x")
+
+
+def bench_mixed(prec=32, repeat=2000):
+    """ scalar operands used directly against promotion to CMath10 """
+    z = CMath10('0.3', '0.7')
+    cases = [('2*z', lambda: 2 * z, lambda: CMath10(2, 0) * z),
+             ('z/2', lambda: z / 2, lambda: z / CMath10(2, 0)),
+             ('z+1', lambda: z + 1, lambda: z + CMath10(1, 0)),
+             ('2/z', lambda: 2 / z, lambda: CMath10(2, 0) / z)]
+    print(f"mixed: prec {prec}, {repeat} calls per cell")
+    print("  expr  scalar    promoted  saving")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        for label, scalar, promoted in cases:
+            row = []
+            for func in (scalar, promoted):
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    func()
+                row.append(time.perf_counter() - start)
+            print(f"  {label:5s} {row[0]:8.4f}s {row[1]:8.4f}s "
+                  f"{row[1] / row[0]:5.1f}x")
+
+
+class _Counted(CMath10):
+    """ CMath10 that counts its constructions """
+    made = 0
+
+
+    def __init__(self, *args, **kwargs):
+        _Counted.made += 1
+        super().__init__(*args, **kwargs)
+
+
+class _Fresh(_Counted):
+    """ _Counted that builds its constants afresh on every use """
+
+
+    @classmethod
+    def interned(cls, real, imag=0):
+        return cls(real, imag)
+
+
+def bench_alloc(prec=32, repeat=200):
+    """ CMath10 constructions per call of the inverse functions, with
+        interned constants and with constants built on every call """
+    names = ['acos', 'asin', 'atan', 'asinh', 'acosh', 'atanh']
+    print(f"alloc: prec {prec}, {repeat} calls per cell")
+    print("  function  interned        fresh           saving")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        for name in names:
+            row = []
+            for cls in (_Counted, _Fresh):
+                z = cls('0.6', '0.8')
+                getattr(z, name)()        # intern the constants
+                _Counted.made = 0
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    getattr(z, name)()
+                row.append((_Counted.made / repeat,
+                            time.perf_counter() - start))
+            print(f"  {name:8s} {row[0][0]:5.1f} {row[0][1]:8.4f}s "
+                  f"{row[1][0]:5.1f} {row[1][1]:8.4f}s "
+                  f"{row[1][1] / row[0][1]:5.2f}x")
+
+
+def bench_isclose(prec=50, count=2000):
+    """ isclose on squared magnitudes against three square roots """
+    print(f"isclose: prec {prec}, {count} comparisons per cell")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        zs = [CMath10(k, 1) / CMath10(7, 3) for k in range(count)]
+        ws = [z + CMath10(0, '1e-12') for z in zs]
+        cases = [
+            ('sqrt', lambda: [(z - w).scalar_abs() <= CMath10.Scalar('1e-9') *
+                              max(z.scalar_abs(), w.scalar_abs())
+                              for z, w in zip(zs, ws)]),
+            ('isclose', lambda: [z.isclose(w) for z, w in zip(zs, ws)]),
+            ('isclose_many', lambda: isclose_many(zs, ws)),
+        ]
+        base = None
+        for label, func in cases:
+            seconds, _ = timed(func)
+            base = base or seconds
+            print(f"  {label:12s} {seconds:8.4f}s  speedup {base / seconds:5.2f}")
+
+
+def bench_fsum(prec=28, count=20000):
+    """ exact fsum against repeated add over a generator """
+    print(f"fsum: prec {prec}, {count} terms")
+    with localcontext() as ctx:
+        ctx.prec = prec
+
+        def terms():
+            return (CMath10(k, -k) / CMath10(count, 7) for k in range(count))
+
+        def naive():
+            total = CMath10(0, 0)
+            for z in terms():
+                total = total.add(z)
+            return total
+
+        base, total = timed(naive)
+        print(f"  add   {base:8.4f}s  {total}")
+        seconds, total = timed(lambda: fsum(terms()))
+        print(f"  fsum  {seconds:8.4f}s  {total}  speedup {base / seconds:5.2f}")
+
+
+def _dft(values):
+    """ the O(n^2) DFT from CMath10.exp and mul """
+    n = len(values)
+    turn = CMath10(0, -2) * CMath10.pi() / n
+    return [fsum(x.mul((turn * (j * k % n)).exp())
+                 for k, x in enumerate(values)) for j in range(n)]
+
+
+def bench_fft(prec=30, sizes=(16, 64, 256, 1024, 4096, 16384, 65536),
+              dft_limit=64):
+    """ radix-2 and Bluestein FFT; the first call builds the twiddle
+        table, the second finds it cached """
+    print(f"fft: prec {prec}")
+    print("  n        first     cached    dft")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        for n in list(sizes) + [100, 1000, 10000]:
+            real = [CMath10.Scalar(k % 17) / 7 for k in range(n)]
+            imag = [CMath10.Scalar(k % 5) for k in range(n)]
+            clear_constant_cache()
+            first, _ = timed(fft_columns, real, imag)
+            cached, _ = timed(fft_columns, real, imag)
+            dft = ''
+            if n <= dft_limit:
+                seconds, _ = timed(_dft, [CMath10(x, y)
+                                          for x, y in zip(real, imag)])
+                dft = f"{seconds:8.4f}s"
+            print(f"  {n:6d} {first:8.4f}s {cached:8.4f}s  {dft}")
+
+
+def _naive_matmul(rows):
+    """ square matrix product with CMath10.mul and add """
+    return [[_add_loop(row, [other[j] for other in rows])
+             for j in range(len(rows))] for row in rows]
+
+
+def _add_loop(xs, ys):
+    """ sum of xs[k] * ys[k] by repeated CMath10.add """
+    total = CMath10(0, 0)
+    for x, y in zip(xs, ys):
+        total = total.add(x.mul(y))
+    return total
+
+
+def bench_linalg(prec=30, sizes=(50, 100, 200, 300), naive_limit=50):
+    """ matmul, LU and solve; the naive column multiplies with
+        CMath10.mul and add """
+    print(f"linalg: prec {prec}")
+    print("  n     matmul    lu        solve     naive matmul")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        for n in sizes:
+            a = Matrix([[CMath10((i * 7 + j * 3) % 11 + n * (i == j),
+                                 (i - j) % 5) / 3
+                         for j in range(n)] for i in range(n)])
+            product, _ = timed(a.__matmul__, a)
+            factor, lu = timed(a.lu)
+            solve, _ = timed(lu.solve, [1] * n)
+            naive = ''
+            if n <= naive_limit:
+                seconds, _ = timed(_naive_matmul, a.rows())
+                naive = f"{seconds:8.4f}s"
+            print(f"  {n:4d} {product:8.4f}s {factor:8.4f}s "
+                  f"{solve:8.4f}s {naive}")
+
+
+def bench_serial(prec=30, count=100000):
+    """ serial10 files against pickle: size, write and read time, and
+        one random access through the memory-mapped reader """
+    print(f"serial: prec {prec}, {count} values")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        values = [CMath10(k, 1) / 7 for k in range(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'values.c10')
+        write, _ = timed(serial10.write, path, values)
+        read, _ = timed(serial10.read, path)
+        with serial10.Reader(path) as reader:
+            lookup, _ = timed(reader.__getitem__, count // 2)
+        size = os.path.getsize(path)
+    dump, data = timed(pickle.dumps, values)
+    load, _ = timed(pickle.loads, data)
+    print(f"  serial10 {size:9d} bytes  write {write:7.4f}s  "
+          f"read {read:7.4f}s  one value {lookup * 1e6:6.1f}us")
+    print(f"  pickle   {len(data):9d} bytes  write {dump:7.4f}s  "
+          f"read {load:7.4f}s")
+
+
+_LITERAL = re.compile(r"\(([^()]*?)([+-][^+-]*?)i\)")
+
+
+def _regex_parse(lines):
+    """ the ad-hoc way: a regex per line, then CMath10(Decimal, Decimal) """
+    out = []
+    for line in lines:
+        match = _LITERAL.match(line)
+        out.append(CMath10(Decimal(match.group(1)), Decimal(match.group(2))))
+    return out
+
+
+def _old_str(z):
+    """ __str__ as it was, building the tolerance every call """
+    sgn = "+" if z.imag >= 0 else ""
+    tol = Decimal(10) ** -z.precision
+    real = 0 if abs(z.real) < tol else z.real
+    imag = 0 if abs(z.imag) < tol else z.imag
+    return "(" + str(real) + sgn + str(imag) + "i)"
+
+
+def bench_strings(prec=20, count=1000000):
+    """ parsing and formatting a file of '(a+bi)' lines """
+    print(f"strings: prec {prec}, {count} lines")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        values = [CMath10(k, -k) / 7 for k in range(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'values.txt')
+        with open(path, 'w', encoding='utf-8') as stream:
+            for line in format_many(values):
+                stream.write(line + "\n")
+        with open(path, encoding='utf-8') as stream:
+            regex, _ = timed(_regex_parse, stream)
+        with open(path, encoding='utf-8') as stream:
+            parse, _ = timed(CMath10.parse_many, stream)
+    old, _ = timed(lambda: [_old_str(z) for z in values])
+    each, _ = timed(lambda: [str(z) for z in values])
+    bulk, _ = timed(format_many, values)
+    print(f"  parse   regex {regex:7.3f}s  parse_many  {parse:7.3f}s")
+    print(f"  format  old   {old:7.3f}s  str {each:7.3f}s  "
+          f"format_many {bulk:7.3f}s")
+
+
+def _digits(z):
+    """ the larger coefficient length of z's two parts """
+    return max(len(z.real.as_tuple().digits), len(z.imag.as_tuple().digits))
+
+
+def bench_chain(prec=30, steps=10000, report=1000):
+    """ a long iteration z = tanh(z * w + c): operand size and time per
+        step stay flat because every result is rounded to prec """
+    print(f"chain: prec {prec}, {steps} steps of z = tanh(z * w + c)")
+    print("   step  digits   us/step")
+    with localcontext() as ctx:
+        ctx.prec = prec
+        z, w, c = CMath10('0.1', '0.2'), CMath10('0.7', '0.3'), CMath10(1, -1)
+        start = time.perf_counter()
+        for step in range(1, steps + 1):
+            z = (z * w + c).tanh()
+            if step % report == 0:
+                now = time.perf_counter()
+                print(f"  {step:5d}  {_digits(z):6d}  {(now - start) / report * 1e6:8.1f}")
+                start = now
+
+
+def _kernel_times(z, w, repeat):
+    """ best of five seconds for repeat products and repeat quotients """
+    mul = min(timed(lambda: [z * w for _ in range(repeat)])[0]
+              for _ in range(5))
+    div = min(timed(lambda: [z / w for _ in range(repeat)])[0]
+              for _ in range(5))
+    return mul, div
+
+
+def bench_kernels(precs=(100, 200, 300, 400, 1000, 3000, 10000)):
+    """ four-multiplication products and two-division quotients against
+        the Gauss and reciprocal kernels, which take over at
+        cmath10.GAUSS_DIGITS and cmath10.RECIPROCAL_DIGITS """
+    thresholds = cmath10.GAUSS_DIGITS, cmath10.RECIPROCAL_DIGITS
+    print("kernels: us per operation")
+    print("    prec   mul 4x    Gauss  speedup     div 2x    recip  speedup")
+    for prec in precs:
+        repeat = max(10, 200000 // prec)
+        with localcontext() as ctx:
+            ctx.prec = prec
+            z = CMath10(1, 3) / CMath10(7, 2)
+            w = CMath10(2, -5) / CMath10(3, 11)
+            try:
+                cmath10.GAUSS_DIGITS = cmath10.RECIPROCAL_DIGITS = sys.maxsize
+                old = _kernel_times(z, w, repeat)
+            finally:
+                cmath10.GAUSS_DIGITS, cmath10.RECIPROCAL_DIGITS = 0, 0
+            new = _kernel_times(z, w, repeat)
+            cmath10.GAUSS_DIGITS, cmath10.RECIPROCAL_DIGITS = thresholds
+        old = [t / repeat * 1e6 for t in old]
+        new = [t / repeat * 1e6 for t in new]
+        print(f"  {prec:6d} {old[0]:8.1f} {new[0]:8.1f} {old[0] / new[0]:7.2f}x"
+              f"  {old[1]:9.1f} {new[1]:8.1f} {old[1] / new[1]:7.2f}x")
+
+
+def _per_call(func, arg, repeat):
+    """ best of five microseconds per call of func(arg) """
+    best = min(timed(lambda: [func(arg) for _ in range(repeat)])[0]
+               for _ in range(5))
+    return best / repeat * 1e6
+
+
+def bench_facade(precs=(16, 50), repeat=2000):
+    """ per-call cost of the core10 functions and of the Math10 and
+        StdLibAdapter wrappers around them """
+    print(f"facade: us per call, best of 5 x {repeat} calls")
+    print("  prec  function   core10   Math10  adapter")
+    for prec in precs:
+        with localcontext() as ctx:
+            ctx.prec = prec
+            x = Math10('0.7')
+            core10.pi()                   # fill the constant cache
+            for name in ('cos', 'atan', 'cosh'):
+                row = [_per_call(func, x, repeat)
+                       for func in (getattr(core10, name), getattr(Math10, name),
+                                    getattr(StdLibAdapter10, name))]
+                print(f"  {prec:4d}  {name:8s} {row[0]:7.1f}  {row[1]:7.1f}  "
+                      f"{row[2]:7.1f}")
+
+
+def _import_seconds(module, runs):
+    """ median cumulative import time of module in fresh interpreters """
+    times = []
+    for _ in range(runs):
+        report = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                                 f"import {module}"], capture_output=True,
+                                text=True, check=True).stderr
+        for line in report.splitlines():
+            fields = [f.strip() for f in line.split('|')]
+            if fields[-1] == module:
+                times.append(int(fields[1]) / 1e6)
+    return statistics.median(times)
+
+
+def bench_constants(precs=(1000, 10000, 40000), runs=15):
+    """ first-call latency of pi, e, ln2 and ln10 read from the stored
+        digits against computing them, and cmath10's import time """
+    computed = {'pi': core10._compute_pi,      # pylint: disable=W0212
+                'e': lambda: Decimal(1).exp(),
+                'ln2': lambda: Decimal(2).ln(),
+                'ln10': lambda: Decimal(10).ln()}
+    print(f"constants: import cmath10 {_import_seconds('cmath10', runs) * 1e3:.1f} ms"
+          f" (median of {runs})")
+    print("    prec  constant    stored   computed")
+    for prec in precs:
+        with localcontext() as ctx:
+            ctx.prec = prec
+            for name, compute in computed.items():
+                stored, _ = timed(core10.stored_constant, name)
+                if prec <= 10000:
+                    slow = f"{timed(compute)[0]:9.4f}s"
+                else:
+                    slow = "  (skipped)"
+                print(f"  {prec:6d}  {name:8s} {stored:8.5f}s {slow}")
+
+
+def bench_chebyshev(count=300):
+    """ sin, cos and atan from the Chebyshev tables against the series
+        at the table precisions, and exp against decimal's own """
+    print("chebyshev: function digits degree  max ulp  series us  table us  speedup")
+    for digits in cheb10.TABLE_DIGITS:
+        for name, (degree, worst, series, table) in cheb10.report(digits, count).items():
+            print(f"  {name:>8s} {digits:6d} {degree:6d} {float(worst):8.3f} "
+                  f"{series * 1e6:10.1f} {table * 1e6:9.1f} {series / table:7.2f}x")
+
+
+def bench_anchors(precs=(32, 64, 256, 1000), repeat=50):
+    """ sin, cos and exp from the anchor tables against the plain
+        series (and decimal's exp), and the one-off cost of the tables """
+    x = Decimal('2.718281828459045')
+    print("anchors:  prec  function  plain us  anchored us  speedup")
+    for prec in precs:
+        with localcontext() as ctx:
+            ctx.prec = prec
+            clear_constant_cache()
+            built, _ = timed(lambda: (core10.sin(x), core10.exp(x)))
+            for name in ('sin', 'cos', 'exp'):
+                func = getattr(core10, name)
+                anchored = _per_call(func, x, repeat)
+                saved = core10.ANCHOR_DIGITS
+                core10.ANCHOR_DIGITS = 0
+                try:
+                    plain = _per_call(func, x, repeat)
+                finally:
+                    core10.ANCHOR_DIGITS = saved
+                print(f"         {prec:5d}  {name:8s} {plain:9.1f} {anchored:12.1f}"
+                      f" {plain / anchored:7.2f}x")
+            print(f"         {prec:5d}  first call, building the tables: "
+                  f"{built * 1e3:.2f} ms")
+
+
+def _quotients():
+    """ {name: (new function, old quotient function, argument)} """
+    x, z = Decimal('0.9'), CMath10('0.9', '0.4')
+
+    def real_tan(x):
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return core10.sin(x) / core10.cos(x)
+
+    def real_tanh(x):
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return core10.sinh(x) / core10.cosh(x)
+
+    def complex_tan(z):
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return z.sin() / z.cos()
+
+    def complex_tanh(z):
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return z.sinh() / z.cosh()
+
+    return {'tan': (core10.tan, real_tan, x),
+            'tanh': (core10.tanh, real_tanh, x),
+            'ctan': (CMath10.tan, complex_tan, z),
+            'ctanh': (CMath10.tanh, complex_tanh, z)}
+
+
+def bench_tangents(precs=(16, 50, 200, 1000), repeat=50):
+    """ tan and tanh, real and complex, from one continued fraction
+        or exp against the quotients of sines and cosines """
+    print("tangents: prec  function  quotient us  single us  speedup")
+    for prec in precs:
+        with localcontext() as ctx:
+            ctx.prec = prec
+            for name, (single, quotient, arg) in _quotients().items():
+                old = _per_call(quotient, arg, repeat)
+                new = _per_call(single, arg, repeat)
+                print(f"         {prec:5d}  {name:8s} {old:11.1f} {new:10.1f}"
+                      f" {old / new:7.2f}x")
+
+
+def _plain_near_zero():
+    """ {name: the formula expm1 and log1p replaced} """
+
+    def sinh(x):
+        return (x.exp() - (-x).exp()) / 2
+
+    def asinh(x):
+        return (x + (1 + x * x).sqrt()).ln()
+
+    def atanh(x):
+        return ((1 + x) / (1 - x)).ln() / 2
+
+    return {'sinh': sinh, 'asinh': asinh, 'atanh': atanh}
+
+
+def bench_near_zero(precs=(30, 1000), exponents=(-10, -100, -500), repeat=20):
+    """ sinh, asinh and atanh of small x at the base precision against
+        the old formulas at the precision they need for the same digits """
+    print("nearzero: the old formulas need prec - log10|x| digits")
+    print("  prec       x      function  old us (at prec)  new us  speedup")
+    for prec in precs:
+        for exponent in exponents:
+            x = Decimal(3).scaleb(exponent)
+            for name, plain in _plain_near_zero().items():
+                with localcontext() as ctx:
+                    ctx.prec = prec - exponent
+                    old = _per_call(plain, x, repeat)
+                    ctx.prec = prec
+                    new = _per_call(getattr(core10, name), x, repeat)
+                print(f"  {prec:4d}  {str(x):>10s}  {name:8s} {old:9.1f} ({prec - exponent:4d})"
+                      f" {new:9.1f} {old / new:8.2f}x")
+
+
+def bench_sweep(precs=(30, 100, 1000), count=2000):
+    """ sweep_columns along a grid against one evaluation per point """
+    print(f"sweep: {count} points of f(start + k h)")
+    print("  prec  function     direct   sweep   speedup")
+    cases = {'exp': (Math10.exp, Decimal('-3.7'), Decimal('0.001')),
+             'sin': (Math10.sin, Decimal('-3.7'), Decimal('0.001')),
+             'cexp': (CMath10.exp, CMath10(Decimal('-1.3'), 2),
+                      CMath10(Decimal('0.0007'), Decimal('0.001'))),
+             'csin': (CMath10.sin, CMath10(Decimal('-1.3'), 2),
+                      CMath10(Decimal('0.0007'), Decimal('0.001')))}
+    for prec in precs:
+        points = count if prec < 1000 else count // 10
+        for name, (func, start, step) in cases.items():
+            with localcontext() as ctx:
+                ctx.prec = prec
+                grid = list(sweep(lambda z: z, start, step, points))
+                direct, _ = timed(lambda f, g: [f(z) for z in g], func, grid)
+                swept, _ = timed(sweep_columns, func, start, step, points)
+            print(f"  {prec:4d}  {name:8s} {direct:8.3f}s {swept:6.3f}s "
+                  f"{direct / swept:8.1f}x")
+
+
+def _traced(func, *args):
+    """ (seconds, peak MB) for one call of func(*args) with an empty
+        constant cache """
+    clear_constant_cache()
+    tracemalloc.start()
+    try:
+        seconds, _ = timed(func, *args)
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def _traced_without_agm(func):
+    """ _traced(func) with the AGM thresholds above the precision """
+    thresholds = ('AGM_DIGITS', 'AGM_PI_DIGITS', 'AGM_EXP_DIGITS')
+    saved = [getattr(core10, name) for name in thresholds]
+    for name in thresholds:
+        setattr(core10, name, getcontext().prec)
+    try:
+        return _traced(func)
+    finally:
+        for name, value in zip(thresholds, saved):
+            setattr(core10, name, value)
+
+
+def bench_agm(precs=(10 ** 4, 10 ** 5, 10 ** 6), old_limit=10 ** 4):
+    """ pi, ln 2 and e from the AGM (and Newton for exp) up to a million
+        digits, with the peak traced memory, against the series and
+        decimal's ln and exp up to old_limit digits """
+    print("agm: seconds (peak MB); pi past the stored digits")
+    print("     prec  function      agm                 old")
+    functions = {'pi': core10._compute_pi,        # pylint: disable=W0212
+                 'ln(2)': lambda: core10.ln(Decimal(2)),
+                 'exp(1)': lambda: core10.exp(Decimal(1))}
+    for prec in precs:
+        for name, func in functions.items():
+            with localcontext() as ctx:
+                ctx.prec = prec
+                seconds, peak = _traced(func)
+                old = ''
+                if prec <= old_limit:
+                    old_seconds, old_peak = _traced_without_agm(func)
+                    old = f"{old_seconds:9.2f}s ({old_peak:7.1f})"
+            print(f"  {prec:7d}  {name:8s} {seconds:9.2f}s ({peak:7.1f})  {old}",
+                  flush=True)
+    clear_constant_cache()
+
+
+BENCHMARKS = {
+    'threads': bench_threads,
+    'fast': bench_fast_path,
+    'axis': bench_axis,
+    'mixed': bench_mixed,
+    'alloc': bench_alloc,
+    'isclose': bench_isclose,
+    'fsum': bench_fsum,
+    'fft': bench_fft,
+    'linalg': bench_linalg,
+    'serial': bench_serial,
+    'strings': bench_strings,
+    'chain': bench_chain,
+    'kernels': bench_kernels,
+    'facade': bench_facade,
+    'constants': bench_constants,
+    'chebyshev': bench_chebyshev,
+    'anchors': bench_anchors,
+    'tangents': bench_tangents,
+    'nearzero': bench_near_zero,
+    'sweep': bench_sweep,
+    'agm': bench_agm,
+}
+
+
+def main():
+    """ run the benchmarks named on the command line, or all of them """
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    main()
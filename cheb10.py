@@ -0,0 +1,218 @@
+""" Generator for the Chebyshev tables that core10 evaluates at low
+    precision, and a report on their error and speed.
+
+    python cheb10.py             # write chebyshev10.txt and report
+
+After argument reduction each function is a smooth function g(s) of
+s in [-1, 1]:
+
+    sin   sin(r) / r     r^2 = (s + 1) / 2 * (pi/4)^2
+    cos   cos(r)
+    atan  atan(y) / y    y^2 = (s + 1) / 2 * tan(pi/8)^2
+    exp   exp(r)         r = s * ln2 / 2
+
+chebyshev() samples g at the Chebyshev nodes, with core10 working
+GENERATE_GUARD digits beyond the table, and cuts the expansion where
+the rest of it cannot reach the last digit.  report() gives the
+largest error found, in units of the last place, and the speed of
+the tables against the series.
+
+exp is generated and reported but not written: decimal's own exp is
+in C, and the table evaluated in Python does not catch it.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import ROUND_HALF_EVEN, Decimal, localcontext
+import functools
+import random
+import time
+
+# ----- Local libraries ----- #
+import core10
+
+# precisions with a table of their own
+TABLE_DIGITS = (12, 16)
+
+# functions whose tables are written and evaluated by core10
+STORED = ('sin', 'cos', 'atan')
+
+# digits beyond the table for the node values
+GENERATE_GUARD = 20
+
+# digits kept in each coefficient beyond the table
+COEFFICIENT_GUARD = 6
+
+
+# ----- reduced functions ----- #
+
+def _reduced_sin(s):
+    """ sin(r) / r """
+    r = ((s + 1) / 2).sqrt() * core10.pi() / 4
+    return core10.sin(r) / r
+
+
+def _reduced_cos(s):
+    """ cos(r) """
+    return core10.cos(((s + 1) / 2).sqrt() * core10.pi() / 4)
+
+
+def _reduced_atan(s):
+    """ atan(y) / y """
+    y = ((s + 1) / 2).sqrt() * (Decimal(2).sqrt() - 1)
+    return core10.atan(y) / y
+
+
+def _reduced_exp(s):
+    """ exp(r) """
+    return (s * core10.ln2() / 2).exp()
+
+
+REDUCED = {'sin': _reduced_sin, 'cos': _reduced_cos,
+           'atan': _reduced_atan, 'exp': _reduced_exp}
+
+
+# ----- generating ----- #
+
+def chebyshev(name, digits):
+    """ the Chebyshev coefficients of the reduced function name that
+        give digits digits, each rounded to COEFFICIENT_GUARD more """
+    reduced = REDUCED[name]
+    n = 2 * digits + 8
+    with localcontext() as ctx:
+        ctx.prec = digits + GENERATE_GUARD
+        angles = [core10.pi() * (2 * k + 1) / (2 * n) for k in range(n)]
+        values = [reduced(core10.cos(angle)) for angle in angles]
+        coefficients = [2 * sum(value * core10.cos(j * angle)
+                                for value, angle in zip(values, angles)) / n
+                        for j in range(n)]
+        coefficients[0] /= 2
+        # the terms left out add up to less than a hundredth of a unit
+        bound = Decimal(10) ** -(digits + 2)
+        tail = Decimal(0)
+        degree = n - 1
+        while degree > 0 and tail + abs(coefficients[degree]) < bound:
+            tail += abs(coefficients[degree])
+            degree -= 1
+        ctx.prec = digits + COEFFICIENT_GUARD
+        return tuple(+c for c in coefficients[:degree + 1])
+
+
+def write_tables(path=None, digits=TABLE_DIGITS):
+    """ write the STORED tables at each of digits to path """
+    path = path or core10._data_paths(core10.CHEBYSHEV_FILE)[0]  # pylint: disable=W0212
+    with open(path, 'w', encoding='ascii') as stream:
+        stream.write("# core10 Chebyshev tables: "
+                     "function, digits, coefficients of T0, T1, ...\n")
+        for name in STORED:
+            for table_digits in digits:
+                coefficients = chebyshev(name, table_digits)
+                stream.write(f"{name} {table_digits} "
+                             f"{' '.join(map(str, coefficients))}\n")
+
+
+# ----- reporting ----- #
+
+def _exp_table(x, coefficients):
+    """ exp(x) = 2^k exp(r) for |r| <= ln2 / 2, from the table """
+    with localcontext() as ctx:
+        prec = ctx.prec
+        ctx.prec += core10.CHEBYSHEV_GUARD
+        log2 = core10.ln2()
+        k = int((x / log2).to_integral_value(ROUND_HALF_EVEN))
+        r = x - k * log2
+        result = core10.clenshaw(coefficients, r * 2 / log2) * Decimal(2) ** k
+        ctx.prec = prec
+        return +result
+
+
+def _samples(name, count):
+    """ count arguments spread over the interesting range of name """
+    rng = random.Random(name)
+    if name == 'atan':
+        return [Decimal(rng.choice((-1, 1)) * 10 ** rng.uniform(-3, 3))
+                for _ in range(count)]
+    return [Decimal(rng.uniform(-20, 20)) for _ in range(count)]
+
+
+def _per_call(function, arguments):
+    """ seconds per call of function over the arguments, best of 3 """
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for x in arguments:
+            function(x)
+        best = min(best, time.perf_counter() - start)
+    return best / len(arguments)
+
+
+def _functions(name, digits):
+    """ (coefficients, table function, series function) for name """
+    if name == 'exp':
+        coefficients = chebyshev('exp', digits)
+        return (coefficients, functools.partial(_exp_table, coefficients=coefficients),
+                Decimal.exp)
+    function = getattr(core10, name)
+    with localcontext() as ctx:
+        ctx.prec = digits
+        return core10.chebyshev_table(name), function, function
+
+
+def _worst(table, series, arguments, digits):
+    """ the largest error of table against series, in ulps """
+    worst = Decimal(0)
+    with localcontext() as ctx:
+        for x in arguments:
+            ctx.prec = digits
+            value = table(x)
+            ctx.prec = digits + GENERATE_GUARD
+            exact = series(x)
+            ulp = Decimal(1).scaleb(exact.adjusted() - digits + 1)
+            worst = max(worst, abs(value - exact) / ulp)
+    return worst
+
+
+def _measure(name, digits, count):
+    """ (degree, max error in ulps, series seconds, table seconds) """
+    coefficients, table, series = _functions(name, digits)
+    arguments = _samples(name, count)
+    worst = _worst(table, series, arguments, digits)
+    saved = core10.CHEBYSHEV_DIGITS
+    with localcontext() as ctx:
+        ctx.prec = digits
+        table_seconds = _per_call(table, arguments)
+        core10.CHEBYSHEV_DIGITS = 0
+        try:
+            series_seconds = _per_call(series, arguments)
+        finally:
+            core10.CHEBYSHEV_DIGITS = saved
+    return len(coefficients) - 1, worst, series_seconds, table_seconds
+
+
+def report(digits, count=1000):
+    """ {name: (degree, max error in ulps, series seconds, table
+        seconds)} at digits digits, for each function in REDUCED """
+    return {name: _measure(name, digits, count) for name in REDUCED}
+
+
+def main():
+    """ write the tables beside this module and report on them """
+    write_tables()
+    core10._chebyshev_tables.cache_clear()     # pylint: disable=W0212
+    print(f"wrote {core10._data_paths(core10.CHEBYSHEV_FILE)[0]}")  # pylint: disable=W0212
+    print(f"{'function':>8} {'digits':>6} {'degree':>6} {'max ulp':>8} "
+          f"{'series us':>10} {'table us':>9} {'speedup':>8}")
+    for digits in TABLE_DIGITS:
+        for name, (degree, worst, series, table) in report(digits).items():
+            print(f"{name:>8} {digits:>6} {degree:>6} {float(worst):8.3f} "
+                  f"{series * 1e6:10.1f} {table * 1e6:9.1f} "
+                  f"{series / table:7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,25 +12,145 @@ Copyright (C) 2025 NYGeek LLC
 
 ToDo list in README.md
 
+Precision comes from the calling thread's decimal context; CMath10
+never writes to the context, so threads computing at different
+precisions do not disturb one another.
+
 """
 
 # ----- Python libraries ----- #
-from decimal import Decimal, getcontext, localcontext
+import cmath
+from decimal import Context, Decimal, getcontext, localcontext
+import itertools
 import warnings
 
 # ----- Local libraries ----- #
 # from trace_debug import DebugTrace
-from math10 import Math10
+import core10
+from math10 import (EXACT_CONTEXT, FLOAT_FAST_DIGITS, FLOAT_ULPS, Math10,
+                    correctly_rounded, finalized, float_arg, float_result)
 
 # ----- Main CMath10 class ----- #
 
+# operand types used directly as the real part of a complex number
+_REAL_TYPES = (int, Decimal)
+
+# interned constants, keyed on (class, real, imag) so that each
+# subclass gets instances of its own type
+_INTERNED = {}
+
+# precision (digits) from which a complex product takes three real
+# multiplications instead of four
+GAUSS_DIGITS = 300
+
+# precision from which a complex quotient multiplies by one reciprocal
+# of |w|**2 instead of dividing twice
+RECIPROCAL_DIGITS = 400
+
+# guard digits for the reciprocal, and the error bound of a quotient
+# part in units of the last of them.  The part is rounded four times at
+# p = prec + RECIPROCAL_GUARD digits: the denominator, its reciprocal,
+# the numerator and their product, each with a relative error of at
+# most e = 5 * 10**-p.  Together that is (1 + e)**3 / (1 - e) - 1, just
+# over 4e, and as the part is below 10**p units of its last place, the
+# error is just over 20 of them.
+RECIPROCAL_GUARD = 5
+RECIPROCAL_ULPS = 21
+
+
+def _round(x):
+    """ x rounded to the current context, keeping the sign of zero """
+    return getcontext().create_decimal(x)
+
+
+def _nonzero(parts):
+    """ True if every part is finite and nonzero, so the kernels below
+        cannot meet a signed zero, an infinity or a NaN """
+    return all(parts) and all(map(Decimal.is_finite, parts))
+
+
+def _gauss(a, b, c, d, ctx):
+    """ the real and imaginary parts of (a + bi)(c + di), rounded once
+        in ctx, from three multiplications: k1 - k3 and k1 + k2, with
+        k1 = c(a + b), k2 = a(d - c), k3 = b(c + d) all exact """
+    add, mul = EXACT_CONTEXT.add, EXACT_CONTEXT.multiply
+    k1 = mul(c, add(a, b))
+    return (ctx.subtract(k1, mul(b, add(c, d))),
+            ctx.add(k1, mul(a, EXACT_CONTEXT.subtract(d, c))))
+
+
+def _reciprocal_quotient(a, b, c, d):
+    """ the parts of (a + bi) / (c + di), each rounded to the current
+        context, from one reciprocal of c**2 + d**2 and multiplications;
+        a part falls back to an exact division when the reciprocal's
+        error could change its rounding """
+    ctx = getcontext()
+    mul = EXACT_CONTEXT.multiply
+    denominator = EXACT_CONTEXT.add(mul(c, c), mul(d, d))
+    work = Context(prec=ctx.prec + RECIPROCAL_GUARD)
+    reciprocal = work.divide(1, work.plus(denominator))
+
+    def part(numerator):
+        quotient = work.multiply(work.plus(numerator), reciprocal)
+        err = Decimal(RECIPROCAL_ULPS).scaleb(quotient.adjusted() - work.prec + 1)
+        low = ctx.plus(EXACT_CONTEXT.subtract(quotient, err))
+        if low != ctx.plus(EXACT_CONTEXT.add(quotient, err)):
+            return ctx.divide(numerator, denominator)
+        return low
+
+    real, imag = _gauss(a, b, c, d.copy_negate(), EXACT_CONTEXT)
+    return part(real), part(imag)
+
+
+def _split(text):
+    """ the real and imaginary component strings of a complex literal """
+    text = text.replace(" ", "").strip()
+    if text[:1] == "(" and text[-1:] == ")":
+        text = text[1:-1]
+    if text[-1:] not in ("i", "j", "I", "J"):
+        return text, "0"
+    body = text[:-1]
+    # the last sign that does not belong to an exponent
+    k = len(body)
+    while True:
+        k = max(body.rfind("+", 0, k), body.rfind("-", 0, k))
+        if k <= 0 or body[k - 1] not in "eE":
+            break
+    real, imag = (body[:k], body[k:]) if k > 0 else ("0", body)
+    if imag in ("", "+", "-"):
+        imag += "1"
+    return real, imag
+
+
+def _format(real, imag, precision):
+    """ '(a+bi)', with zeros and components below 10**-precision
+        written as 0 (compared by exponent, so nothing is computed) """
+    if not real or real.adjusted() < -precision:
+        real = 0
+    if not imag or imag.adjusted() < -precision:
+        imag = 0
+    text = str(imag)
+    sign = "" if text[0] == "-" else "+"
+    return f"({real}{sign}{text}i)"
+
+
+def format_many(values):
+    """ [str(z) for z in values], without the per-value method calls """
+    return [_format(z.real, z.imag, z.precision) for z in values]
+
+
 class CMath10:
-    """ Class to implement the Complex Decimal Math machinery. """
+    """ Class to implement the Complex Decimal Math machinery.
+        Instances are immutable. """
     Scalar = Math10
+    __slots__ = ('real', 'imag', 'precision')
 
 
-    def __init__(self, real, imag=None, precision=32):
-        """ Initialize a complex decimal. """
+    def __init__(self, real, imag=None, precision=None):
+        """ Initialize a complex decimal.
+            precision only controls how small a component must be
+            for __str__ to show it as 0; it defaults to the current
+            context precision. """
         # print(f"DEBUG CMath10(real: {real}, imag: {imag})")
         if isinstance(real, CMath10):
             warnings.warn(
@@ -38,117 +158,266 @@ class CMath10:
                 DeprecationWarning,
                 stacklevel=2
             )
-            self.real = real.real
-            self.imag = real.imag
+            real, imag_part = real.real, real.imag
             if imag is not None:
                 warnings.warn(
                     "Complex10() argument 'imag' must be a real number, not complex",
                     DeprecationWarning,
                     stacklevel=2
                 )
-                self += self.__class__(0,1) * imag
-        else:
-            if imag is None:
+                # as complex(): real + imag * i
+                shift = self.interned(0, 1) * imag
+                real, imag_part = real + shift.real, imag_part + shift.imag
+            imag = imag_part
+        elif imag is None:
+            if isinstance(real, str):
+                real, imag = _split(real)
+            else:
                 imag = 0
-            self.real = self.Scalar(real)
-            self.imag = self.Scalar(imag)
+        if precision is None:
+            precision = getcontext().prec
+        self.real = self.Scalar(real)
+        self.imag = self.Scalar(imag)
         self.precision = precision
-        getcontext().prec = precision
+
+
+    def __setattr__(self, name, value):
+        """ each attribute is set once, by __init__ """
+        if hasattr(self, name):
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+
+    def __delattr__(self, name):
+        """ CMath10 values are immutable """
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+
+    def __reduce__(self):
+        """ pickle and copy through the constructor """
+        return (self.__class__, (self.real, self.imag, self.precision))
+
+
+    def __hash__(self):
+        """ equal values hash equal, including CMath10(x, 0) == x """
+        if not self.imag:
+            return hash(self.real)
+        return hash((self.real, self.imag))
+
+
+    @classmethod
+    def interned(cls, real, imag=0):
+        """ the shared cls(real, imag), for small exact constants """
+        key = (cls, real, imag)
+        value = _INTERNED.get(key)
+        if value is None:
+            value = _INTERNED.setdefault(key, cls(real, imag))
+        return value
 
 
     def __str__(self):
-        """ return a string representation of the number """
-        sgn = "+" if self.imag >= 0 else ""
-        tol = Decimal(10) ** -self.precision
-        _real = 0 if abs(self.real) < tol else self.real
-        _imag = 0 if abs(self.imag) < tol else self.imag
-        return "(" + str(_real) + sgn + str(_imag) + "i)"
+        """ return a string representation of the number; components
+            smaller than 10**-precision are shown as 0 """
+        return _format(self.real, self.imag, self.precision)
 
 
     def __repr__(self):
-        """ return the representation of CMath10 object """
-        return f"CMath10('{str(self)}')"
+        """ return the representation of CMath10 object, which parses
+            back to an equal value """
+        imag = str(self.imag)
+        sign = "" if imag[0] == "-" else "+"
+        return f"{self.__class__.__name__}('({self.real}{sign}{imag}i)')"
+
+
+    @classmethod
+    def from_string(cls, text):
+        """ parse '(a+bi)', 'a+bj', 'bi' or 'a' (any case of i or j);
+            the components go straight to decimal, never via float """
+        return cls(*_split(text))
+
+
+    @classmethod
+    def parse_many(cls, lines):
+        """ from_string for each non-blank line of an iterable of
+            strings (an open file, for example) """
+        return [cls(*_split(line)) for line in lines if line.strip()]
 
 
     def copy(self):
         """ return a clone of this item """
-        return CMath10(self.real, self.imag)
+        return CMath10(self.real, self.imag, self.precision)
 
 
     def isclose(self, z, rel_tol=1e-9, abs_tol=0.0):
-        """ are two numbers close? """
-        if self == z:
-            return True
-        rel_tol = self.Scalar(rel_tol)
-        abs_tol = self.Scalar(abs_tol)
-        diff = (self-z).scalar_abs()
-        ref = max(self.scalar_abs(), z.scalar_abs())
-        return diff <= max(rel_tol * ref, abs_tol)
+        """ are two numbers close?  PEP 485 on the complex magnitude,
+            compared squared so that no square roots are needed """
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return _close(self, z, *_squared_tolerances(rel_tol, abs_tol))
 
 
+    @finalized
     def abs(self):
         """ aka mag """
         magnitude = self.scalar_abs()
         return self.__class__(magnitude, 0)
 
 # ----- Basic complex arithmetic ----- #
+#
+# Each operation also accepts a real operand (int, Decimal or Math10),
+# which is used directly instead of being promoted to a CMath10.
 
     def add(self, z):
         """ Implement self + b """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            real = self.real + z.real
-            imag = self.imag + z.imag
-        return self.__class__(real, imag)
+        if isinstance(z, _REAL_TYPES):
+            return self.__class__(self.real + z, _round(self.imag))
+        return self.__class__(self.real + z.real, self.imag + z.imag)
 
 
     def __add__(self, z):
+        if not isinstance(z, _OPERAND_TYPES):
+            return NotImplemented
+        return self.add(z)
+
+
+    def __radd__(self, z):
+        if not isinstance(z, _REAL_TYPES):
+            return NotImplemented
         return self.add(z)
 
 
     def sub(self, z):
         """ Implement self - b """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            real = self.real - z.real
-            imag = self.imag - z.imag
-        return self.__class__(real, imag)
+        if isinstance(z, _REAL_TYPES):
+            return self.__class__(self.real - z, _round(self.imag))
+        return self.__class__(self.real - z.real, self.imag - z.imag)
 
 
     def __sub__(self, z):
+        if not isinstance(z, _OPERAND_TYPES):
+            return NotImplemented
         return self.sub(z)
 
 
+    def __rsub__(self, z):
+        if not isinstance(z, _REAL_TYPES):
+            return NotImplemented
+        return self.__class__(z - self.real, _round(self.imag.copy_negate()))
+
+
     def mul(self, z):
-        """ Implement self * b """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            real = (self.real * z.real) - (self.imag * z.imag)
-            imag = (self.real * z.imag) + (self.imag * z.real)
+        """ Implement self * b; each component is rounded once.  From
+            GAUSS_DIGITS on, a complex product takes three real
+            multiplications """
+        if isinstance(z, _REAL_TYPES):
+            return self.__class__(self.real * z, self.imag * z)
+        parts = (self.real, self.imag, z.real, z.imag)
+        ctx = getcontext()
+        if ctx.prec >= GAUSS_DIGITS and _nonzero(parts):
+            real, imag = _gauss(*parts, ctx)
+            return self.__class__(real, imag)
+        mul = EXACT_CONTEXT.multiply
+        real = ctx.subtract(mul(self.real, z.real), mul(self.imag, z.imag))
+        imag = ctx.add(mul(self.real, z.imag), mul(self.imag, z.real))
         return self.__class__(real, imag)
 
 
     def __mul__(self, z):
+        if not isinstance(z, _OPERAND_TYPES):
+            return NotImplemented
+        return self.mul(z)
+
+
+    def __rmul__(self, z):
+        if not isinstance(z, _REAL_TYPES):
+            return NotImplemented
         return self.mul(z)
 
 
     def div(self, z):
-        """ Implement self / b """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            denominator = (z.real * z.real) + (z.imag * z.imag)
-            real = ((self.real * z.real) + (self.imag * z.imag))/denominator
-            imag = ((self.imag * z.real) - (self.real * z.imag))/denominator
-        return self.__class__(real, imag)
+        """ Implement self / b; numerators and denominator are exact,
+            so each component is rounded once.  From RECIPROCAL_DIGITS
+            on, one reciprocal of |b|**2 replaces the two divisions """
+        if isinstance(z, _REAL_TYPES):
+            return self.__class__(self.real / z, self.imag / z)
+        parts = (self.real, self.imag, z.real, z.imag)
+        if getcontext().prec >= RECIPROCAL_DIGITS and _nonzero(parts):
+            return self.__class__(*_reciprocal_quotient(*parts))
+        mul, add = EXACT_CONTEXT.multiply, EXACT_CONTEXT.add
+        denominator = add(mul(z.real, z.real), mul(z.imag, z.imag))
+        real = add(mul(self.real, z.real), mul(self.imag, z.imag))
+        imag = EXACT_CONTEXT.subtract(mul(self.imag, z.real),
+                                      mul(self.real, z.imag))
+        return self.__class__(real / denominator, imag / denominator)
 
 
     def __truediv__(self, z):
+        if not isinstance(z, _OPERAND_TYPES):
+            return NotImplemented
         return self.div(z)
 
 
+    def __rtruediv__(self, z):
+        """ z / self for a real z: z * conj(self) / |self|^2 """
+        if not isinstance(z, _REAL_TYPES):
+            return NotImplemented
+        mul = EXACT_CONTEXT.multiply
+        denominator = EXACT_CONTEXT.add(mul(self.real, self.real),
+                                        mul(self.imag, self.imag))
+        if not denominator:
+            raise ZeroDivisionError("complex division by zero")
+        return self.__class__(mul(z, self.real) / denominator,
+                              mul(z, self.imag).copy_negate() / denominator)
+
+
+    def __neg__(self):
+        return self.__class__(self.real.copy_negate(),
+                              self.imag.copy_negate())
+
+
+    @finalized
+    def __pow__(self, w, modulo=None):
+        """ self ** w; integer powers by repeated squaring, anything
+            else as exp(w log self) """
+        if modulo is not None or not isinstance(w, _OPERAND_TYPES):
+            return NotImplemented
+        if isinstance(w, int):
+            with localcontext() as ctx:
+                ctx.prec += 2 + len(str(abs(w)))
+                result = self.interned(1, 0)
+                base = self
+                n = abs(w)
+                while n:
+                    if n & 1:
+                        result = result.mul(base)
+                    base = base.mul(base)
+                    n >>= 1
+                if w < 0:
+                    result = 1 / result
+            return result
+        if not self.real and not self.imag:
+            if w == 0:
+                return self.interned(1, 0)
+            if isinstance(w, _REAL_TYPES) and w > 0:
+                return self.interned(0, 0)
+            raise ZeroDivisionError("0 to a negative or complex power")
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return self.log().mul(w).exp()
+
+
+    def __eq__(self, z):
+        if isinstance(z, CMath10):
+            return self.real == z.real and self.imag == z.imag
+        if isinstance(z, _REAL_TYPES):
+            return self.real == z and not self.imag
+        return NotImplemented
+
+
 # ----- complex constants ----- #
 
     @classmethod
+    @finalized
     def pi(cls):
         """ (pi, 0) """
         real = cls.Scalar.pi()
@@ -157,6 +426,7 @@ class CMath10:
 
 
     @classmethod
+    @finalized
     def e(cls):
         """ (e, 0) """
         real = cls.Scalar.e()
@@ -166,73 +436,120 @@ class CMath10:
 
 # ----- complex higher math ----- #
 
+    @finalized
     def acos(self):
         """ inverse cosine of a complex number """
+        if not self.imag and abs(self.real) <= 1:
+            return self.__class__(self.Scalar(self.real).acos(), -self.imag)
+        if not self.real:
+            return self.__class__(self.Scalar.pi() / 2,
+                                  -self.Scalar(self.imag).asinh())
         with localcontext() as ctx:
             ctx.prec += 2
             zz = self.mul(self)
-            i = self.__class__(0,1)
-            one = self.__class__(1,0)
+            i = self.interned(0, 1)
+            one = self.interned(1, 0)
             result = one.sub(zz).sqrt().mul(i).add(self).log().div(i)
             return result
 
 
+    @finalized
     def asin(self):
         """ inverse sine of a complex number """
+        if not self.imag and abs(self.real) <= 1:
+            return self.__class__(self.Scalar(self.real).asin(), self.imag)
+        if not self.real:
+            return self.__class__(self.real, self.Scalar(self.imag).asinh())
         with localcontext() as ctx:
             ctx.prec += 2
             zz = self.mul(self)
-            i = self.__class__(0,1)
-            one = self.__class__(1,0)
+            i = self.interned(0, 1)
+            one = self.interned(1, 0)
             result = self.mul(i).add(one.sub(zz).sqrt()).log().div(i)
-            return self.__class__(result)
+            return result
 
 
+    @finalized
     def atan(self):
         """ inverse tangent of a complex number """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).atan(), self.imag)
+        if not self.real and abs(self.imag) < 1:
+            return self.__class__(self.real, self.Scalar(self.imag).atanh())
         with localcontext() as ctx:
             ctx.prec += 2
-            i = self.__class__(0,1)
-            one = self.__class__(1,0)
-            two = self.__class__(2,0)
+            i = self.interned(0, 1)
+            one = self.interned(1, 0)
+            two = self.interned(2, 0)
             result = (one.sub(i.mul(self)).\
                     div(one.add(i.mul(self)))).log().mul(i).div(two)
-            return self.__class__(result)
+            return result
 
 
+    @finalized
     def asinh(self):
         """ inverse hyperbolic sine: asinh(z) = log(z + sqrt(z² + 1)) """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).asinh(), self.imag)
+        if not self.real and abs(self.imag) <= 1:
+            return self.__class__(self.real, self.Scalar(self.imag).asin())
         with localcontext() as ctx:
             ctx.prec += 2
-            one = self.__class__(1, 0)
+            one = self.interned(1, 0)
             zz_plus_one = self.mul(self).add(one)
             result = self.add(zz_plus_one.sqrt()).log()
-            return self.__class__(result)
+            return result
 
 
+    @finalized
     def acosh(self):
         """ inverse hyperbolic cosine: acosh(z) = log(z + sqrt(z² - 1)) """
+        if not self.imag and self.real >= 1:
+            return self.__class__(self.Scalar(self.real).acosh(), self.imag)
         with localcontext() as ctx:
             ctx.prec += 2
-            one = self.__class__(1, 0)
+            one = self.interned(1, 0)
             zz_minus_one = self.mul(self).sub(one)
             result = self.add(zz_minus_one.sqrt()).log()
-            return self.__class__(result)
+            return result
 
 
+    @finalized
     def atanh(self):
-        """ inverse hyperbolic tangent: atanh(z) = (1/2) * log((1+z)/(1-z))
-        """
+        """ inverse hyperbolic tangent: atanh(z) = (1/2) log((1+z)/(1-z)),
+            whose real part is log1p(4x / ((1-x)² + y²)) / 4 and whose
+            imaginary part is atan2(2y, 1 - x² - y²) / 2, with the
+            squares summed exactly """
+        if not self.imag and abs(self.real) < 1:
+            return self.__class__(self.Scalar(self.real).atanh(), self.imag)
+        if not self.real:
+            return self.__class__(self.real, self.Scalar(self.imag).atan())
+        x, y = self.real, self.imag
+        if not y and abs(x) == 1:
+            raise ValueError("Math10 domain error")
+        add, mul = EXACT_CONTEXT.add, EXACT_CONTEXT.multiply
+        x2, y2 = mul(x, x), mul(y, y)
+        one_minus = EXACT_CONTEXT.subtract(1, x)
         with localcontext() as ctx:
             ctx.prec += 2
-            one = self.__class__(1, 0)
-            two = self.__class__(2, 0)
-            result = one.add(self).div(one.sub(self)).log().div(two)
-            return self.__class__(result)
+            if x2.adjusted() < -2 * ctx.prec:
+                # x² moves the angle by about x², far below its last
+                # place, while 1 - x² - y² of order x² would overflow atan2
+                x2 = 0
+            real = self.Scalar(4 * x / add(mul(one_minus, one_minus), y2)).log1p() / 4
+            imag = self.Scalar.atan2(
+                    2 * y, EXACT_CONTEXT.subtract(EXACT_CONTEXT.subtract(1, x2), y2)) / 2
+        return self.__class__(real, imag)
 
 
+    @finalized
     def exp(self):
         """ exp(a+bi) = exp(a)*(cos(b)+isin(b)) """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).exp(), self.imag)
+        if not self.real:
+            return self.__class__(self.Scalar(self.imag).cos(),
+                                  self.Scalar(self.imag).sin())
         with localcontext() as ctx:
             ctx.prec += 2
             mag = self.Scalar(self.real).exp()
@@ -241,22 +558,84 @@ class CMath10:
         return self.__class__(real, imag)
 
 
+    @finalized
     def log(self):
         """ natural logarithm of z """
+        if not self.imag and self.real > 0:
+            return self.__class__(self.Scalar(self.real).ln(), self.imag)
+        if not self.imag and self.real < 0:
+            # the cut: the sign of a zero imaginary part is ignored
+            return self.__class__(self.Scalar(-self.real).ln(),
+                                  self.Scalar.pi())
+        if not self.real and self.imag:
+            half_pi = self.Scalar.pi() / 2
+            return self.__class__(self.Scalar(abs(self.imag)).ln(),
+                                  half_pi if self.imag > 0 else -half_pi)
         # note: in cmath log is natural log, log10 is decimal log
         # note: in decimal.py ln is natural log
-        real = self.Scalar(self.scalar_abs()).ln()
+        if not self.real and not self.imag:
+            return self.__class__(self.Scalar(0).ln(), 0)
+        # ln|z| = log1p(|z|² - 1) / 2, with |z|² - 1 exact, keeps its
+        # digits when |z| is near 1
+        mul = EXACT_CONTEXT.multiply
+        norm_minus_one = EXACT_CONTEXT.subtract(
+                EXACT_CONTEXT.add(mul(self.real, self.real), mul(self.imag, self.imag)), 1)
+        with localcontext() as ctx:
+            ctx.prec += 2
+            real = self.Scalar(norm_minus_one).log1p() / 2
         imag = self.Scalar.atan2(self.imag, self.real)
         return self.__class__(real, imag)
 
 
+    @finalized
+    def expm1(self):
+        """ exp(z) - 1: with m = expm1(x), h = sin(y/2) and c = cos(y/2),
+            m - 2h²(1 + m) + 2hc(1 + m) i, which keeps its digits for
+            small z """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).expm1(), self.imag)
+        with localcontext() as ctx:
+            ctx.prec += 2
+            m = self.Scalar(self.real).expm1()
+            half = self.Scalar(self.imag / 2)
+            h, c = half.sin(), half.cos()
+            real = m - 2 * h * h * (1 + m)
+            imag = 2 * h * c * (1 + m)
+        return self.__class__(real, imag)
+
+
+    @finalized
+    def log1p(self):
+        """ log(1 + z): ln|1 + z| is log1p(2x + x² + y²) / 2, with the
+            argument summed exactly, and the phase is atan2(y, 1 + x) """
+        if not self.imag and self.real > -1:
+            return self.__class__(self.Scalar(self.real).log1p(), self.imag)
+        x, y = self.real, self.imag
+        add, mul = EXACT_CONTEXT.add, EXACT_CONTEXT.multiply
+        one_plus = add(1, x)
+        if not one_plus and not y:
+            # log(0), as log() reports it
+            return self.__class__(one_plus, y).log()
+        with localcontext() as ctx:
+            ctx.prec += 2
+            real = self.Scalar(add(mul(x, add(2, x)), mul(y, y))).log1p() / 2
+        imag = self.Scalar.atan2(y, one_plus)
+        return self.__class__(real, imag)
+
+
+    @finalized
     def log10(self):
         """ decimal logarithm of z """
+        if not self.imag and self.real > 0:
+            return self.__class__(self.Scalar(self.real).log10(), self.imag)
         # note: in cmath log is natural log, log10 is decimal log
         # note: in decimal.py ln is natural log
-        return self.log().div(self.__class__(10,0).log())
+        with localcontext() as ctx:
+            ctx.prec += 2
+            return self.log().div(core10.ln10())
 
 
+    @finalized
     def phase(self):
         """ phase of z, aka arg z """
         return self.__class__(
@@ -264,24 +643,44 @@ class CMath10:
                 self.Scalar(0))
 
 
+    @finalized
     def sqrt(self):
         """ square root of z """
+        if not self.imag:
+            if self.real >= 0:
+                return self.__class__(self.Scalar(self.real).sqrt(), 0)
+            # the cut: the sign of a zero imaginary part is ignored
+            return self.__class__(0, self.Scalar(-self.real).sqrt())
+        if not self.real:
+            with localcontext() as ctx:
+                ctx.prec += 2
+                part = (abs(self.imag) / 2).sqrt()
+            return self.__class__(part, part if self.imag > 0 else -part)
         # Principal square root.  There is another, of course
         with localcontext() as ctx:
             ctx.prec += 2
-            r = self.scalar_abs()
-            sign = 1 if self.imag >= 0 else -1
-            re_part = (r + self.real) / 2
-            im_radicand = (r - self.real) / 2
-            # Clamp to 0 to avoid InvalidOperation when im_radicand is tiny negative (rounding)
-            if im_radicand < 0:
-                im_radicand = self.Scalar(0)
-            result = self.__class__(re_part.sqrt(), sign * im_radicand.sqrt())
-            return result
+            # t = sqrt((|z| + |x|) / 2) has no cancellation; the other
+            # part is y / 2t, rather than the difference |z| - |x|
+            t = ((self.scalar_abs() + abs(self.real)) / 2).sqrt()
+            other = abs(self.imag) / (2 * t)
+            if self.real > 0:
+                return self.__class__(t, other.copy_sign(self.imag))
+            return self.__class__(other, t.copy_sign(self.imag))
 
 
+    @finalized
     def cos(self):
         """ complex cosine """
+        # on an axis the zero part is -sin(x) sinh(y), negative when
+        # sin(x) and y share a sign
+        if not self.imag:
+            real = self.Scalar(self.real).cos()
+            negative = core10.sin_sign(self.real) < 0
+            zero = Decimal(0).copy_sign(self.imag if negative else self.imag.copy_negate())
+            return self.__class__(real, zero)
+        if not self.real:
+            zero = Decimal(0).copy_sign(self.imag if self.real.is_signed() else -self.imag)
+            return self.__class__(self.Scalar(self.imag).cosh(), zero)
         with localcontext() as ctx:
             ctx.prec += 2
             real = self.Scalar(self.real).cos() * \
@@ -291,8 +690,13 @@ class CMath10:
             return self.__class__(real, imag)
 
 
+    @finalized
     def cosh(self):
         """ complex hyperbolic cosine: cosh(re + i*im) = cosh(re)cos(im) + i*sinh(re)sin(im) """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).cosh(), self.imag)
+        if not self.real:
+            return self.__class__(self.Scalar(self.imag).cos(), self.real)
         with localcontext() as ctx:
             ctx.prec += 2
             re = self.real
@@ -302,8 +706,13 @@ class CMath10:
             return self.__class__(real, imag)
 
 
+    @finalized
     def sin(self):
         """ complex sine """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).sin(), self.imag)
+        if not self.real:
+            return self.__class__(self.real, self.Scalar(self.imag).sinh())
         with localcontext() as ctx:
             ctx.prec += 2
             real = self.Scalar(self.real).sin() * \
@@ -313,8 +722,13 @@ class CMath10:
             return self.__class__(real, imag)
 
 
+    @finalized
     def sinh(self):
         """ complex hyperbolic sine: sinh(re + i*im) = sinh(re)cos(im) + i*cosh(re)sin(im) """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).sinh(), self.imag)
+        if not self.real:
+            return self.__class__(self.real, self.Scalar(self.imag).sin())
         with localcontext() as ctx:
             ctx.prec += 2
             re = self.real
@@ -324,22 +738,33 @@ class CMath10:
             return self.__class__(real, imag)
 
 
+    @finalized
     def tan(self):
-        """ complex tangent """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            return (self.sin() / self.cos())
+        """ complex tangent, from one complex tanh """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).tan(), self.imag)
+        if not self.real:
+            return self.__class__(self.real, self.Scalar(self.imag).tanh())
+        # tan(z) = -i tanh(iz)
+        real, imag = core10.complex_tanh(-self.imag, self.real)
+        return self.__class__(imag, -real)
 
 
+    @finalized
     def tanh(self):
-        """ complex hyperbolic tangent """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            return (self.sinh() / self.cosh())
+        """ complex hyperbolic tangent, from tanh of the real part and tan
+            of the imaginary part, by a formula stable near the poles and
+            for large parts (see core10.complex_tanh) """
+        if not self.imag:
+            return self.__class__(self.Scalar(self.real).tanh(), self.imag)
+        if not self.real:
+            return self.__class__(self.real, self.Scalar(self.imag).tan())
+        return self.__class__(*core10.complex_tanh(self.real, self.imag))
 
 
 # ----- scalar result on complex numbers ----- #
 
+    @finalized
     def scalar_abs(self):
         """ aka mag """
         with localcontext() as ctx:
@@ -350,6 +775,7 @@ class CMath10:
         return result
 
 
+    @finalized
     def scalar_arg(self):
         """ argument """
         with localcontext() as ctx:
@@ -358,6 +784,157 @@ class CMath10:
         return self.Scalar(result)
 
 
+# ----- closeness ----- #
+
+def _squared_tolerances(rel_tol, abs_tol):
+    """ (rel_tol², abs_tol²) for _close """
+    rel_tol, abs_tol = Decimal(rel_tol), Decimal(abs_tol)
+    return rel_tol * rel_tol, abs_tol * abs_tol
+
+
+def _close(a, b, rel2, abs2):
+    """ |a - b|² <= max(rel2 max(|a|², |b|²), abs2), which is PEP 485's
+        |a - b| <= max(rel_tol max(|a|, |b|), abs_tol) squared """
+    if a == b:
+        return True
+    ar, ai = a.real, a.imag
+    br, bi = (b.real, b.imag) if isinstance(b, CMath10) else (b, 0)
+    if not all(Decimal(x).is_finite() for x in (ar, ai, br, bi)):
+        return False
+    dr, di = ar - br, ai - bi
+    ref = max(ar * ar + ai * ai, br * br + bi * bi)
+    return dr * dr + di * di <= max(rel2 * ref, abs2)
+
+
+def isclose_many(zs, ws, rel_tol=1e-9, abs_tol=0.0):
+    """ [z.isclose(w, rel_tol, abs_tol) for z, w in zip(zs, ws)], with
+        the tolerances prepared once; ws may be a single value, which
+        every z is compared against; otherwise zs and ws must have the
+        same length """
+    if isinstance(ws, _OPERAND_TYPES):
+        pairs = zip(zs, itertools.repeat(ws))
+    else:
+        pairs = itertools.zip_longest(zs, ws)
+    with localcontext() as ctx:
+        ctx.prec += 2
+        tolerances = _squared_tolerances(rel_tol, abs_tol)
+        results = []
+        for z, w in pairs:
+            if z is None or w is None:
+                raise ValueError("isclose_many() arguments have different lengths")
+            results.append(_close(z, w, *tolerances))
+        return results
+
+
+# ----- exact summation ----- #
+
+def _parts(z):
+    """ (real, imag) of a CMath10 or real operand """
+    if isinstance(z, CMath10):
+        return z.real, z.imag
+    return z, 0
+
+
+def fsum(values):
+    """ sum of the CMath10 (or real) values, each component accumulated
+        exactly and rounded once to the current context """
+    add = EXACT_CONTEXT.add
+    real = imag = Decimal(0)
+    for z in values:
+        z_real, z_imag = _parts(z)
+        real = add(real, z_real)
+        imag = add(imag, z_imag)
+    ctx = getcontext()
+    return CMath10(ctx.plus(real), ctx.plus(imag))
+
+
+def dot(a, b):
+    """ sum of a[k] * b[k] (no conjugation), each component accumulated
+        exactly and rounded once to the current context; a and b must
+        have the same length """
+    add, multiply = EXACT_CONTEXT.add, EXACT_CONTEXT.multiply
+    real = imag = Decimal(0)
+    for x, y in itertools.zip_longest(a, b):
+        if x is None or y is None:
+            raise ValueError("dot() arguments have different lengths")
+        x_real, x_imag = _parts(x)
+        y_real, y_imag = _parts(y)
+        real = add(real, multiply(x_real, y_real))
+        real = EXACT_CONTEXT.subtract(real, multiply(x_imag, y_imag))
+        imag = add(imag, multiply(x_real, y_imag))
+        imag = add(imag, multiply(x_imag, y_real))
+    ctx = getcontext()
+    return CMath10(ctx.plus(real), ctx.plus(imag))
+
+
+# ----- float fast path ----- #
+
+def _negative_real(w):
+    """ on the cut (-inf, 0] of log and sqrt """
+    return w.imag == 0 and w.real <= 0
+
+
+def _off_real_unit(w):
+    """ on the cuts (-inf, -1], [1, inf) of asin, acos and atanh """
+    return w.imag == 0 and abs(w.real) >= 1
+
+
+def _acosh_cut(w):
+    """ on the cut (-inf, 1] of acosh, or in the closed left half plane,
+        where log(z + sqrt(z^2 - 1)) can take the other branch from
+        cmath """
+    return w.real <= 0 or (w.imag == 0 and w.real <= 1)
+
+
+def _off_imag_unit(w):
+    """ on the cuts (-inf i, -i], [i, inf i) of asinh and atan """
+    return w.real == 0 and abs(w.imag) >= 1
+
+
+def _float_component(value, err, exact_zero):
+    """ one component of a float result, rounded if certain """
+    if value == 0 and exact_zero:
+        return Decimal(0)
+    return float_result(value, err) if value else None
+
+
+def complex_fast_path(func, deriv, on_cut, z, fallback):
+    """ func(complex(z)) rounded to the current context when the
+        precision is low enough and the rounding can be certified,
+        fallback(z) otherwise.
+
+        deriv(w) is func'(w).  Points on a branch cut (on_cut(w)) go
+        to the fallback, since signed zeros are not carried across. """
+    if getcontext().prec > FLOAT_FAST_DIGITS:
+        return fallback(z)
+    re_part, im_part = float_arg(z.real), float_arg(z.imag)
+    if re_part is None or im_part is None:
+        return fallback(z)
+    # CMath10 does not distinguish -0 from 0
+    w = complex(re_part or 0.0, im_part or 0.0)
+    if on_cut is not None and on_cut(w):
+        return fallback(z)
+    try:
+        fw = func(w)
+        slope = abs(w * deriv(w))
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return fallback(z)
+    # each input component is within 2**-53 of z, and cmath is
+    # trusted to FLOAT_ULPS rounding units of |f| per component
+    err = 2 * (1.5 * slope + FLOAT_ULPS * abs(fw)) * 2.0 ** -53
+    # a zero component of an axis argument is exactly zero
+    exact_zero = not w.real or not w.imag
+    real = _float_component(fw.real, err, exact_zero)
+    imag = _float_component(fw.imag, err, exact_zero)
+    if real is None or imag is None:
+        return fallback(z)
+    return z.__class__(real, imag)
+
+
+# every operand type the arithmetic operators accept
+_OPERAND_TYPES = _REAL_TYPES + (CMath10,)
+
+
 # ----- StdLibAdapter class ----- #
 
 class StdLibAdapter:
@@ -493,6 +1070,16 @@ class StdLibAdapter:
         """ functional form of log """
         return z.log()
 
+    @staticmethod
+    def expm1(z):
+        """ functional form of expm1 """
+        return z.expm1()
+
+    @staticmethod
+    def log1p(z):
+        """ functional form of log1p """
+        return z.log1p()
+
 
     @staticmethod
     def log10(z):
@@ -500,6 +1087,258 @@ class StdLibAdapter:
         return z.log10()
 
 
+class CorrectlyRoundedAdapter(StdLibAdapter):
+    """ StdLibAdapter whose results are correctly rounded to the
+        context precision (see math10.correctly_rounded) """
+
+    @staticmethod
+    def add(a, b):
+        """ correctly rounded add """
+        return correctly_rounded(lambda: a.add(b))
+
+    @staticmethod
+    def sub(a, b):
+        """ correctly rounded sub """
+        return correctly_rounded(lambda: a.sub(b))
+
+    @staticmethod
+    def mul(a, b):
+        """ correctly rounded mul """
+        return correctly_rounded(lambda: a.mul(b))
+
+    @staticmethod
+    def div(a, b):
+        """ correctly rounded div """
+        return correctly_rounded(lambda: a.div(b))
+
+    @staticmethod
+    def abs(z):
+        """ correctly rounded abs """
+        return correctly_rounded(z.abs)
+
+    @staticmethod
+    def phase(z):
+        """ correctly rounded phase """
+        return correctly_rounded(z.phase, absolute=True)
+
+    @staticmethod
+    def e():
+        """ correctly rounded e """
+        return correctly_rounded(StdLibAdapter.e)
+
+    @staticmethod
+    def pi():
+        """ correctly rounded pi """
+        return correctly_rounded(StdLibAdapter.pi)
+
+    @staticmethod
+    def acos(z):
+        """ correctly rounded acos """
+        return correctly_rounded(z.acos, absolute=True)
+
+    @staticmethod
+    def acosh(z):
+        """ correctly rounded acosh """
+        return correctly_rounded(z.acosh, absolute=True)
+
+    @staticmethod
+    def asin(z):
+        """ correctly rounded asin """
+        return correctly_rounded(z.asin, absolute=True)
+
+    @staticmethod
+    def asinh(z):
+        """ correctly rounded asinh """
+        return correctly_rounded(z.asinh, absolute=True)
+
+    @staticmethod
+    def atan(z):
+        """ correctly rounded atan """
+        return correctly_rounded(z.atan, absolute=True)
+
+    @staticmethod
+    def atanh(z):
+        """ correctly rounded atanh """
+        return correctly_rounded(z.atanh, absolute=True)
+
+    @staticmethod
+    def cos(z):
+        """ correctly rounded cos """
+        return correctly_rounded(z.cos, absolute=True)
+
+    @staticmethod
+    def cosh(z):
+        """ correctly rounded cosh """
+        return correctly_rounded(z.cosh, absolute=True)
+
+    @staticmethod
+    def exp(z):
+        """ correctly rounded exp """
+        return correctly_rounded(z.exp)
+
+    @staticmethod
+    def log(z):
+        """ correctly rounded log """
+        return correctly_rounded(z.log, absolute=True)
+
+    @staticmethod
+    def expm1(z):
+        """ correctly rounded expm1 """
+        return correctly_rounded(z.expm1, absolute=True)
+
+    @staticmethod
+    def log1p(z):
+        """ correctly rounded log1p """
+        return correctly_rounded(z.log1p, absolute=True)
+
+    @staticmethod
+    def log10(z):
+        """ correctly rounded log10 """
+        return correctly_rounded(z.log10, absolute=True)
+
+    @staticmethod
+    def sin(z):
+        """ correctly rounded sin """
+        return correctly_rounded(z.sin, absolute=True)
+
+    @staticmethod
+    def sinh(z):
+        """ correctly rounded sinh """
+        return correctly_rounded(z.sinh, absolute=True)
+
+    @staticmethod
+    def sqrt(z):
+        """ correctly rounded sqrt """
+        return correctly_rounded(z.sqrt)
+
+    @staticmethod
+    def tan(z):
+        """ correctly rounded tan """
+        return correctly_rounded(z.tan, absolute=True)
+
+    @staticmethod
+    def tanh(z):
+        """ correctly rounded tanh """
+        return correctly_rounded(z.tanh, absolute=True)
+
+class FastPathAdapter(CorrectlyRoundedAdapter):
+    """ CorrectlyRoundedAdapter that tries the float cmath library
+        first when the precision is FLOAT_FAST_DIGITS or less, and
+        keeps the float result only if its rounding is certain """
+
+    @staticmethod
+    def acos(z):
+        """ acos, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.acos, lambda w: -1 / cmath.sqrt(1 - w * w), _off_real_unit,
+                z, CorrectlyRoundedAdapter.acos)
+
+    @staticmethod
+    def acosh(z):
+        """ acosh, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.acosh, lambda w: 1 / cmath.sqrt(w * w - 1), _acosh_cut,
+                z, CorrectlyRoundedAdapter.acosh)
+
+    @staticmethod
+    def asin(z):
+        """ asin, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.asin, lambda w: 1 / cmath.sqrt(1 - w * w), _off_real_unit,
+                z, CorrectlyRoundedAdapter.asin)
+
+    @staticmethod
+    def asinh(z):
+        """ asinh, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.asinh, lambda w: 1 / cmath.sqrt(1 + w * w), _off_imag_unit,
+                z, CorrectlyRoundedAdapter.asinh)
+
+    @staticmethod
+    def atan(z):
+        """ atan, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.atan, lambda w: 1 / (1 + w * w), _off_imag_unit,
+                z, CorrectlyRoundedAdapter.atan)
+
+    @staticmethod
+    def atanh(z):
+        """ atanh, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.atanh, lambda w: 1 / (1 - w * w), _off_real_unit,
+                z, CorrectlyRoundedAdapter.atanh)
+
+    @staticmethod
+    def cos(z):
+        """ cos, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.cos, lambda w: -cmath.sin(w), None,
+                z, CorrectlyRoundedAdapter.cos)
+
+    @staticmethod
+    def cosh(z):
+        """ cosh, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.cosh, cmath.sinh, None,
+                z, CorrectlyRoundedAdapter.cosh)
+
+    @staticmethod
+    def exp(z):
+        """ exp, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.exp, cmath.exp, None,
+                z, CorrectlyRoundedAdapter.exp)
+
+    @staticmethod
+    def log(z):
+        """ log, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.log, lambda w: 1 / w, _negative_real,
+                z, CorrectlyRoundedAdapter.log)
+
+    @staticmethod
+    def log10(z):
+        """ log10, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.log10, lambda w: 1 / (w * cmath.log(10)), _negative_real,
+                z, CorrectlyRoundedAdapter.log10)
+
+    @staticmethod
+    def sin(z):
+        """ sin, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.sin, cmath.cos, None,
+                z, CorrectlyRoundedAdapter.sin)
+
+    @staticmethod
+    def sinh(z):
+        """ sinh, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.sinh, cmath.cosh, None,
+                z, CorrectlyRoundedAdapter.sinh)
+
+    @staticmethod
+    def sqrt(z):
+        """ sqrt, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.sqrt, lambda w: 1 / (2 * cmath.sqrt(w)), _negative_real,
+                z, CorrectlyRoundedAdapter.sqrt)
+
+    @staticmethod
+    def tan(z):
+        """ tan, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.tan, lambda w: 1 / cmath.cos(w) ** 2, None,
+                z, CorrectlyRoundedAdapter.tan)
+
+    @staticmethod
+    def tanh(z):
+        """ tanh, through float when that is exact enough """
+        return complex_fast_path(
+                cmath.tanh, lambda w: 1 / cmath.cosh(w) ** 2, None,
+                z, CorrectlyRoundedAdapter.tanh)
+
+
 def main():
     """ simple smoke test """
     print("Smoke test is now in smoke.py.")
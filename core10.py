@@ -0,0 +1,1258 @@
+""" The functional core under Math10: the series and identities as
+    plain functions that take and return Decimal.
+
+    x = Decimal('0.5')
+    y = core10.atan(x)           # a Decimal, at the context precision
+
+Each function works a few digits beyond the current context and
+rounds its result once to it (keeping the sign of a zero).  Nothing
+here builds a Math10; math10.Math10 and its adapters wrap only the
+final result.  The arguments must be Decimals (a Math10 is one), as
+int arithmetic would drop into float.
+
+The constant cache and the cancellation checkpoints live here too,
+since every series uses them; math10 re-exports them.
+
+pi, e, ln2 and ln10 are read from constants10.txt, which holds
+STORED_DIGITS digits of each.  The file is mapped into memory the
+first time a constant is needed, and only the digits the precision
+asks for are sliced out and rounded; beyond the stored length the
+constant is computed.  python core10.py regenerates the file.
+
+Up to CHEBYSHEV_DIGITS (the HP-35's 10 to 12 digits, or a double's
+16), sin, cos and atan reduce the argument and evaluate a Chebyshev
+polynomial from chebyshev10.txt in place of the series; cheb10
+writes those tables.
+
+Above that, up to ANCHOR_DIGITS, sin and cos start from the nearest
+of a table of anchor angles k pi/2**ANCHOR_BITS and sum only the
+short series of what is left, and exp does the same from powers of
+e**(1/2**ANCHOR_BITS).  The anchors are built the first time each
+precision needs them and cached with the constants.
+
+Above AGM_DIGITS ln is computed from the arithmetic-geometric mean,
+ln s = pi / 2 AGM(1, 4/s) for s past 10**(prec/2), and above
+AGM_EXP_DIGITS exp by Newton's method on it; pi (and ln 10) beyond
+the stored digits come from the AGM too.  Both stay correctly rounded
+half-even, as decimal's own ln and exp are, by retrying with more
+guard digits while the rounding is in doubt.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+from decimal import ROUND_HALF_EVEN
+from decimal import Context, Decimal, getcontext, localcontext
+from decimal import Inexact, InvalidOperation, MAX_EMAX, MAX_PREC, MIN_EMIN
+import functools
+import mmap
+import os
+import sys
+import threading
+import time
+
+
+# ----- Exact arithmetic ----- #
+
+# Sums and products of decimals are exact when the precision is large
+# enough; this context never rounds (Inexact is trapped to prove it),
+# and only as many digits are stored as the exact result needs.
+EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN,
+                        traps=[InvalidOperation, Inexact])
+
+
+# ----- Constant cache ----- #
+
+_CONSTANTS = {}
+_CONSTANTS_LOCK = threading.Lock()
+
+
+def cached_constant(name, compute):
+    """ return the constant called name at the current precision,
+        calling compute() only the first time it is needed """
+    ctx = getcontext()
+    key = (name, ctx.prec, ctx.rounding)
+    value = _CONSTANTS.get(key)
+    if value is None:
+        # compute outside the lock; if two threads race, the first
+        # value stored wins and both return the same object
+        value = compute()
+        with _CONSTANTS_LOCK:
+            value = _CONSTANTS.setdefault(key, value)
+    return value
+
+
+def clear_constant_cache():
+    """ forget every cached constant """
+    with _CONSTANTS_LOCK:
+        _CONSTANTS.clear()
+
+
+# ----- Cancellation ----- #
+
+# How many checkpoints pass between voluntary yields of the GIL
+YIELD_EVERY = 64
+
+_LOCAL = threading.local()
+
+
+class _CancelScope:  # pylint: disable=R0903
+    """ cancellation state for the work running in one thread """
+
+    def __init__(self, event):
+        self.event = event
+        self.count = 0
+
+
+    def check(self):
+        """ raise if cancelled; now and then let other threads run """
+        if self.event.is_set():
+            raise CancelledError
+        self.count += 1
+        if self.count % YIELD_EVERY == 0:
+            time.sleep(0)
+
+
+@contextmanager
+def cancel_scope(event):
+    """ make the series loops in this thread raise CancelledError
+        once event (a threading.Event) is set """
+    outer = getattr(_LOCAL, 'scope', None)
+    _LOCAL.scope = _CancelScope(event)
+    try:
+        yield
+    finally:
+        _LOCAL.scope = outer
+
+
+def checkpoint():
+    """ called once per series iteration; a no-op outside cancel_scope """
+    scope = getattr(_LOCAL, 'scope', None)
+    if scope is not None:
+        scope.check()
+
+
+# ----- Stored constants ----- #
+
+# one line per constant: name, adjusted exponent, digits (truncated)
+CONSTANTS_FILE = 'constants10.txt'
+
+# digits of each constant written by write_constants()
+STORED_DIGITS = 50000
+
+# digits read beyond the precision, to decide the rounding
+STORED_GUARD = 20
+
+
+def _data_paths(filename):
+    """ where a data file may be: beside this module, or where the
+        installed package puts its data """
+    return [os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         filename),
+            os.path.join(sys.prefix, 'share', 'cmath10', filename)]
+
+
+@functools.lru_cache(maxsize=None)
+def _stored_index():
+    """ {name: (data, start, count, adjusted)} for the constants file,
+        mapped into memory on the first call; {} if there is no file """
+    for path in _data_paths(CONSTANTS_FILE):
+        try:
+            with open(path, 'rb') as stream:
+                data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            continue
+        index = {}
+        pos = 0
+        while pos < len(data):
+            end = data.find(b'\n', pos)
+            end = len(data) if end < 0 else end
+            if end > pos and data[pos:pos + 1] != b'#':
+                name_end = data.find(b' ', pos, end)
+                digits = data.find(b' ', name_end + 1, end) + 1
+                index[data[pos:name_end].decode('ascii')] = (
+                        data, digits, end - digits,
+                        int(data[name_end + 1:digits - 1]))
+            pos = end + 1
+        return index
+    return {}
+
+
+def stored_constant(name):
+    """ the constant called name, correctly rounded to the current
+        context from its stored digits, or None if they do not reach
+        far enough to decide the rounding """
+    entry = _stored_index().get(name)
+    if entry is None:
+        return None
+    data, start, count, adjusted = entry
+    ctx = getcontext()
+    k = min(count, ctx.prec + STORED_GUARD)
+    if k <= ctx.prec:
+        return None
+    # the constant lies between the truncated digits and one unit more
+    exponent = adjusted - k + 1
+    low = Decimal(f"{data[start:start + k].decode('ascii')}E{exponent}")
+    high = Context(prec=k + 1).add(low, Decimal(f"1E{exponent}"))
+    rounded = ctx.plus(low)
+    return rounded if rounded == ctx.plus(high) else None
+
+
+def _constant(name, compute):
+    """ the cached constant called name, from the stored digits when
+        they reach the current precision, else from compute() """
+
+    def value():
+        stored = stored_constant(name)
+        return compute() if stored is None else stored
+
+    return cached_constant(name, value)
+
+
+# ----- Constants ----- #
+
+def _round(x):
+    """ x rounded to the current context, keeping the sign of zero """
+    return getcontext().create_decimal(x)
+
+
+def _compute_pi():
+    """ pi at the current precision """
+    if getcontext().prec > AGM_PI_DIGITS:
+        return _agm_rounded(_agm_pi)
+    # docs.python.org/3/library/decimal.html#recipes
+    with localcontext() as ctx:
+        ctx.prec += 2
+        three = Decimal(3)
+        lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+        while s != lasts:
+            checkpoint()
+            lasts = s
+            n, na = n+na, na+8
+            d, da = d+da, da+32
+            t = (t * n) / d
+            s += t
+    return +s
+
+
+def pi():
+    """ pi """
+    return _constant('pi', _compute_pi)
+
+
+def e():
+    """ e """
+    return _constant('e', lambda: exp(Decimal(1)))
+
+
+def ln2():
+    """ the natural logarithm of 2 """
+    return _constant('ln2', lambda: ln(Decimal(2)))
+
+
+def _compute_ln10():
+    """ ln 10 at the current precision """
+    if getcontext().prec <= AGM_DIGITS:
+        return Decimal(10).ln()
+    return _agm_rounded(_agm_ln10)
+
+
+def ln10():
+    """ the natural logarithm of 10 """
+    return _constant('ln10', _compute_ln10)
+
+
+# ----- AGM ----- #
+
+# Above AGM_DIGITS ln comes from the arithmetic-geometric mean, and so
+# does pi above AGM_PI_DIGITS when the stored digits do not reach;
+# above AGM_EXP_DIGITS, where the exp anchors stop, exp comes from
+# Newton's method on that ln.  Each AGM step costs a square root and a
+# product, and about 2 log2(prec) steps are needed, where decimal's ln
+# and exp and the pi series take time quadratic in the digits or worse.
+AGM_DIGITS = 250
+AGM_PI_DIGITS = 100
+AGM_EXP_DIGITS = 2000
+
+# guard digits beyond the digits of the precision; doubled on each retry
+AGM_GUARD = 4
+
+# the AGM results are within this many units of their last digit
+AGM_ULPS = 20
+
+# the square root and exp start from decimal's own at this many digits
+SQRT_START_DIGITS = 100
+EXP_START_DIGITS = 500
+
+
+def _sqrt(x):
+    """ the square root of x > 0 at the current precision, by Newton's
+        method for 1/sqrt(x) at doubling precisions, which needs only
+        products, and one last step on the root itself """
+    prec = getcontext().prec
+    if prec <= 2 * SQRT_START_DIGITS:
+        return x.sqrt()
+    precs = []
+    q = prec + 2
+    while q > SQRT_START_DIGITS:
+        precs.append(q)
+        q = q // 2 + 2
+    with localcontext() as ctx:
+        ctx.prec = q
+        y = 1 / x.sqrt()
+        for q in reversed(precs):
+            ctx.prec = q
+            y += y * (1 - +x * y * y) / 2
+        root = x * y
+        root += y * (x - root * root) / 2
+    return +root
+
+
+def _agm(a, b):
+    """ the arithmetic-geometric mean of a and b at the current
+        precision: once they agree to half the digits, their mean is
+        good to all of them """
+    close = Decimal(1).scaleb(-(getcontext().prec // 2) - 1)
+    while abs(a - b) > close * a:
+        checkpoint()
+        a, b = (a + b) / 2, _sqrt(a * b)
+    return (a + b) / 2
+
+
+def _agm_pi():
+    """ (pi, error bound) at the current precision, by Gauss-Legendre """
+    close = Decimal(1).scaleb(-(getcontext().prec // 2) - 1)
+    a, b, t, power = Decimal(1), _sqrt(Decimal('0.5')), Decimal('0.25'), 1
+    while True:
+        checkpoint()
+        last = abs(a - b) <= close
+        mean = (a + b) / 2
+        b = _sqrt(a * b)
+        t -= power * (a - mean) ** 2
+        a = mean
+        power *= 2
+        if last:
+            break
+    value = (a + b) ** 2 / (4 * t)
+    return value, Decimal(AGM_ULPS).scaleb(-getcontext().prec + 1)
+
+
+def _shared_prec(prec):
+    """ prec rounded up to one of a ladder of precisions 1/128 to 1/64
+        apart, so that nearby precisions share the cached pi and ln 10 """
+    step = 1 << max(0, prec.bit_length() - 7)
+    return -(-prec // step) * step
+
+
+def _agm_scale(adjusted):
+    """ the power of 10 that puts a number with this adjusted exponent
+        past 10 ** (prec/2), where ln s = pi / 2 AGM(1, 4/s) to the
+        precision """
+    return getcontext().prec // 2 + 3 - adjusted
+
+
+def _agm_ln10():
+    """ (ln 10, error bound) at the current precision, from
+        ln 10**k = pi / 2 AGM(1, 4/10**k) """
+    k = _agm_scale(0)
+    value = pi() / (2 * _agm(Decimal(1), Decimal(4).scaleb(-k))) / k
+    return value, Decimal(AGM_ULPS).scaleb(-getcontext().prec + 1)
+
+
+def _agm_log(x):
+    """ (ln x, error bound) at the current precision or a little more
+        for finite x > 0: ln x = ln(x 10**k) - k ln 10 with x 10**k large """
+    with localcontext() as ctx:
+        ctx.prec = _shared_prec(ctx.prec)
+        k = _agm_scale(x.adjusted())
+        log_s = pi() / (2 * _agm(Decimal(1), 4 / x.scaleb(k, EXACT_CONTEXT)))
+        value = log_s - k * ln10()
+        return value, Decimal(AGM_ULPS).scaleb(log_s.adjusted() - ctx.prec + 1)
+
+
+def _agm_exp(x):
+    """ (e ** x, error bound) at the current precision for finite x:
+        x = k ln10 + r, and e ** r by Newton's method on ln from
+        decimal's exp at EXP_START_DIGITS, doubling the digits at each
+        step """
+    prec = getcontext().prec
+    with localcontext() as ctx:
+        ctx.prec = max(0, x.adjusted() + 1) + 10
+        k = int((x / ln10()).to_integral_value(ROUND_HALF_EVEN))
+        # enough digits of ln 10 to leave prec digits in the remainder
+        ctx.prec = prec + max(0, x.adjusted() + 1)
+        r = x - k * ln10() if k else +x
+        precs = []
+        q = prec
+        while q > EXP_START_DIGITS:
+            precs.append(q)
+            q = q // 2 + AGM_GUARD
+        ctx.prec = q
+        y = Decimal.exp(r)
+        for q in reversed(precs):
+            ctx.prec = q
+            log_y, _ = _agm_log(y)
+            y += y * (r - log_y)
+    return y.scaleb(k), Decimal(AGM_ULPS).scaleb(y.adjusted() + k - prec + 1)
+
+
+def _agm_rounded(compute):
+    """ the value from compute(), which gives (value, error bound) at
+        the current precision, rounded half-even to the caller's
+        context: worked with AGM_GUARD more digits, doubled until the
+        error bound cannot change the rounding """
+    ctx = getcontext()
+    guard = AGM_GUARD + len(str(ctx.prec))
+    while True:
+        with localcontext() as work:
+            work.prec = ctx.prec + guard
+            value, err = compute()
+        result = _half_even(value, err)
+        if result is not None:
+            return result
+        guard *= 2
+
+
+def _half_even(value, err):
+    """ value rounded half-even to the current context, or None when an
+        error of err either way could change that rounding """
+    low, high = EXACT_CONTEXT.subtract(value, err), EXACT_CONTEXT.add(value, err)
+    even = getcontext().copy()
+    even.rounding = ROUND_HALF_EVEN
+    result = even.plus(low)
+    return result if result == even.plus(high) else None
+
+
+def ln(x):
+    """ the natural logarithm, correctly rounded with ROUND_HALF_EVEN as
+        decimal's own ln is: from the AGM above AGM_DIGITS, worked to
+        the extra digits that ln loses for x near 1 """
+    if getcontext().prec <= AGM_DIGITS or not x.is_finite() or x <= 0 or x == 1:
+        return Decimal.ln(x)
+    lost = max(0, -EXACT_CONTEXT.subtract(x, 1).adjusted())
+
+    def compute():
+        with localcontext() as ctx:
+            ctx.prec += lost
+            return _agm_log(x)
+
+    return _agm_rounded(compute)
+
+
+# ----- Chebyshev tables ----- #
+
+# one line per table: function, digits, Chebyshev coefficients
+CHEBYSHEV_FILE = 'chebyshev10.txt'
+
+# precisions up to this use the tables for sin, cos and atan
+CHEBYSHEV_DIGITS = 16
+
+# guard digits for the argument reduction and the table evaluation
+CHEBYSHEV_GUARD = 3
+
+
+@functools.lru_cache(maxsize=None)
+def _chebyshev_tables():
+    """ {function: [(digits, coefficients), ...]} in increasing digits,
+        read from the tables file on the first call; {} if there is
+        no file """
+    for path in _data_paths(CHEBYSHEV_FILE):
+        try:
+            with open(path, encoding='ascii') as stream:
+                lines = stream.read().splitlines()
+        except OSError:
+            continue
+        tables = {}
+        for line in lines:
+            if line and not line.startswith('#'):
+                name, digits, *coefficients = line.split()
+                tables.setdefault(name, []).append(
+                        (int(digits), tuple(map(Decimal, coefficients))))
+        for entries in tables.values():
+            entries.sort()
+        return tables
+    return {}
+
+
+def chebyshev_table(name):
+    """ the coefficients of the smallest table for the function name
+        that reaches the current precision, or None """
+    prec = getcontext().prec
+    if prec > CHEBYSHEV_DIGITS:
+        return None
+    for digits, coefficients in _chebyshev_tables().get(name, ()):
+        if digits >= prec:
+            return coefficients
+    return None
+
+
+def clenshaw(coefficients, s):
+    """ the sum of coefficients[j] * T_j(s), for -1 <= s <= 1, by
+        Clenshaw's recurrence in the current context """
+    b1 = b2 = Decimal(0)
+    s2 = s + s
+    for c in coefficients[:0:-1]:
+        b1, b2 = s2 * b1 - b2 + c, b1
+    return s * b1 - b2 + coefficients[0]
+
+
+def _quarter_turns(x):
+    """ (k, r) with x = k pi/2 + r and |r| <= pi/4, r good to the
+        current precision even when x is close to a multiple of pi/2 """
+    prec = getcontext().prec
+    # enough digits of pi/2 to leave prec digits in the remainder
+    extra = max(0, x.adjusted() + 1)
+    with localcontext() as ctx:
+        for _ in range(2):
+            ctx.prec = prec + extra
+            half_pi = pi() / 2
+            k = int((x / half_pi).to_integral_value(ROUND_HALF_EVEN))
+            if not k:
+                return 0, x
+            r = x - k * half_pi
+            # once more with the digits the subtraction cancelled
+            lost = -r.adjusted() if r else prec
+            if lost <= 0:
+                break
+            extra += lost
+    return k, r
+
+
+def _sin_cos_table(x, quarter):
+    """ sin(x + quarter * pi/2) from the tables, or None when they do
+        not reach the precision; sin(r) = r S(s) and cos(r) = C(s) for
+        |r| <= pi/4 and s = 32 r^2 / pi^2 - 1 """
+    sines, cosines = chebyshev_table('sin'), chebyshev_table('cos')
+    if sines is None or cosines is None or not x.is_finite():
+        return None
+    with localcontext() as ctx:
+        ctx.prec += CHEBYSHEV_GUARD
+        k, r = _quarter_turns(x)
+        r = ctx.create_decimal(r)
+        s = r * r * cached_constant('chebyshev-sin', lambda: 32 / pi() ** 2) - 1
+        quadrant = (k + quarter) % 4
+        if quadrant % 2:
+            result = clenshaw(cosines, s)
+        else:
+            result = r * clenshaw(sines, s)
+        if quadrant >= 2:
+            result = -result
+    return _round(result)
+
+
+def _atan_table(x):
+    """ atan(x) from the table, or None when it does not reach the
+        precision; atan(y) = y A(s) for |y| <= tan(pi/8) and
+        s = y^2 / tan(pi/8)^2 - 1 """
+    table = chebyshev_table('atan')
+    if table is None or not x.is_finite():
+        return None
+    with localcontext() as ctx:
+        ctx.prec += CHEBYSHEV_GUARD
+        y = abs(x)
+        invert = y > 1
+        if invert:
+            y = 1 / y
+        offset = 0
+        if y > cached_constant('chebyshev-tan', lambda: Decimal(2).sqrt() - 1):
+            # atan(y) = pi/4 + atan((y-1)/(y+1))
+            y = (y - 1) / (y + 1)
+            offset = pi() / 4
+        scale = cached_constant('chebyshev-atan', lambda: 6 + 4 * Decimal(2).sqrt())
+        result = offset + y * clenshaw(table, y * y * scale - 1)
+        if invert:
+            result = pi() / 2 - result
+    return _round(result.copy_sign(x))
+
+
+# ----- Anchor tables ----- #
+
+# sin and cos are tabulated every pi / 2**ANCHOR_BITS up to pi/4, exp
+# every 1 / 2**ANCHOR_BITS up to ln2 / 2: 65 and 179 values
+ANCHOR_BITS = 8
+
+# precisions up to this use the anchors (above CHEBYSHEV_DIGITS, where
+# the Chebyshev tables reach); each precision builds its own tables
+# once, of 244 values in all
+ANCHOR_DIGITS = 2000
+
+# guard digits for the anchored evaluation, and for building the tables
+ANCHOR_GUARD = 5
+
+# exp from the anchors is trusted to this many units in the last place
+ANCHOR_ULPS = 20
+
+# exp uses the anchors only above this: below it decimal's own exp,
+# in C, is faster
+EXP_ANCHOR_DIGITS = 200
+
+# above this the terms of the short series are worked to only the
+# digits that reach the last place of the sum
+SHRINK_DIGITS = 200
+
+
+def _alternating(term, x2, i):
+    """ term - term x2 / ((i+1)(i+2)) + ..., the series of sin(x)
+        (term = x, i = 1) or cos(x) (term = 1, i = 0), summed until
+        the terms stop changing it """
+    ctx = getcontext()
+    if ctx.prec > SHRINK_DIGITS:
+        return _shrinking_sum(term, lambda t, n: -t * +x2 / ((i + 2*n - 1) * (i + 2*n)))
+    total = term
+    while True:
+        checkpoint()
+        term = -term * x2 / ((i + 1) * (i + 2))
+        i += 2
+        if total + term == total:
+            return total
+        total += term
+
+
+def _exp_series(x):
+    """ 1 + x + x^2/2! + ..., summed until the terms stop changing it """
+    if getcontext().prec > SHRINK_DIGITS:
+        return _shrinking_sum(Decimal(1), lambda t, n: t * +x / n)
+    total = term = Decimal(1)
+    i = 0
+    while True:
+        checkpoint()
+        i += 1
+        term = term * x / i
+        if total + term == total:
+            return total
+        total += term
+
+
+def _shrinking_sum(term, step):
+    """ term + step(term, 1) + step(step(term, 1), 2) + ..., with each
+        step worked to only the digits that reach the last place of
+        the sum (so +x in a step rounds x to them), until the terms
+        stop changing it """
+    ctx = getcontext()
+    prec = ctx.prec
+    total = term
+    n = 0
+    with localcontext() as small:
+        while True:
+            checkpoint()
+            n += 1
+            small.prec = max(1, prec + term.adjusted() - total.adjusted() + 2)
+            term = step(term, n)
+            new = ctx.add(total, term)
+            if new == total:
+                return total
+            total = new
+
+
+def _sin_cos_anchors():
+    """ (step, anchors) with step = pi / 2**ANCHOR_BITS and anchors[k]
+        = (sin, cos) of k step up to pi/4, at the current precision """
+
+    def build():
+        with localcontext() as ctx:
+            ctx.prec += ANCHOR_GUARD
+            step = pi() / 2 ** ANCHOR_BITS
+            step2 = step * step
+            sin_step = _alternating(step, step2, 1)
+            cos_step = _alternating(Decimal(1), step2, 0)
+            s, c = Decimal(0), Decimal(1)
+            anchors = [(s, c)]
+            for _ in range(2 ** (ANCHOR_BITS - 2)):
+                s, c = s * cos_step + c * sin_step, c * cos_step - s * sin_step
+                anchors.append((s, c))
+        return +step, tuple((+s, +c) for s, c in anchors)
+
+    return cached_constant('sin-cos-anchors', build)
+
+
+def _exp_anchors():
+    """ anchors[j] = e ** (j / 2**ANCHOR_BITS) for |j| up to
+        2**ANCHOR_BITS ln2 / 2, negative j counting from the end, at
+        the current precision """
+
+    def build():
+        n = int(2 ** ANCHOR_BITS * ln2() / 2) + 1
+        with localcontext() as ctx:
+            ctx.prec += ANCHOR_GUARD
+            up = (1 / Decimal(2 ** ANCHOR_BITS)).exp()
+            down = 1 / up
+            powers, inverses = [Decimal(1)], []
+            for _ in range(n):
+                powers.append(powers[-1] * up)
+                inverses.append((inverses[-1] if inverses else 1) * down)
+        return tuple(+v for v in powers + inverses[::-1])
+
+    return cached_constant('exp-anchors', build)
+
+
+def _sin_cos_near(r):
+    """ (sin(r), cos(r)) for |r| <= pi/4 from the nearest anchor a, by
+        sin(a + d) = sin(a) cos(d) + cos(a) sin(d) and
+        cos(a + d) = cos(a) cos(d) - sin(a) sin(d) """
+    step, anchors = _sin_cos_anchors()
+    j = int((r / step).to_integral_value(ROUND_HALF_EVEN))
+    d = r - j * step if j else r
+    d2 = d * d
+    sin_d, cos_d = _alternating(d, d2, 1), _alternating(Decimal(1), d2, 0)
+    if not j:
+        return sin_d, cos_d
+    sin_a, cos_a = anchors[abs(j)]
+    if j < 0:
+        sin_a = -sin_a
+    return sin_a * cos_d + cos_a * sin_d, cos_a * cos_d - sin_a * sin_d
+
+
+def _sin_cos_anchored(x, quarter):
+    """ sin(x + quarter * pi/2) from the anchors, or None when the
+        precision is beyond ANCHOR_DIGITS """
+    if getcontext().prec > ANCHOR_DIGITS or not x.is_finite():
+        return None
+    with localcontext() as ctx:
+        ctx.prec += ANCHOR_GUARD
+        k, r = _quarter_turns(x)
+        sine, cosine = _sin_cos_near(ctx.create_decimal(r))
+        quadrant = (k + quarter) % 4
+        result = cosine if quadrant % 2 else sine
+        if quadrant >= 2:
+            result = -result
+    return _round(result)
+
+
+def exp(x):
+    """ e ** x, correctly rounded with ROUND_HALF_EVEN as decimal's own
+        exp is: x = k ln2 + j / 2**ANCHOR_BITS + d, from the anchors
+        when their error cannot change the rounding, else by decimal;
+        above AGM_EXP_DIGITS by Newton's method on the AGM ln """
+    ctx = getcontext()
+    if ctx.prec > AGM_EXP_DIGITS and x and x.is_finite() and x.adjusted() < 7:
+        # decimal's exp gives the overflows and underflows
+        tens = int(x * Decimal('0.4343'))
+        if ctx.Emin + 20 < tens < ctx.Emax - 20:
+            return _agm_rounded(lambda: _agm_exp(x))
+    if (not EXP_ANCHOR_DIGITS < ctx.prec <= ANCHOR_DIGITS
+            or not x or not x.is_finite() or x.adjusted() > 2):
+        return Decimal.exp(x)
+    prec = ctx.prec + ANCHOR_GUARD
+    with localcontext() as work:
+        # enough digits of ln2 to leave prec digits in the remainder
+        work.prec = prec + max(0, x.adjusted() + 1)
+        log2 = ln2()
+        k = int((x / log2).to_integral_value(ROUND_HALF_EVEN))
+        r = x - k * log2 if k else x
+        work.prec = prec
+        r = +r
+        scale = 2 ** ANCHOR_BITS
+        j = int((r * scale).to_integral_value(ROUND_HALF_EVEN))
+        value = _exp_series(r - Decimal(j) / scale) * _exp_anchors()[j]
+        if k:
+            value *= Decimal(2) ** k
+    if not ctx.Emin < value.adjusted() < ctx.Emax:
+        return Decimal.exp(x)
+    result = _half_even(value, Decimal(ANCHOR_ULPS).scaleb(value.adjusted() - prec + 1))
+    return Decimal.exp(x) if result is None else result
+
+
+# ----- trigonometric functions ----- #
+
+def cos(x):
+    """ cosine """
+    result = _sin_cos_table(x, 1)
+    if result is None:
+        result = _sin_cos_anchored(x, 1)
+    if result is not None:
+        return result
+    # from docs.python.org/3/library/decimal.html#recipes.
+    with localcontext() as ctx:
+        ctx.prec += 2
+        twopi = 2 * pi()
+        if x > twopi or x < -twopi:
+            x %= twopi
+        i, lasts, s, fact, num, sign = 0, 0, 1, 1, 1, 1
+        while s != lasts:
+            checkpoint()
+            lasts = s
+            i += 2
+            fact *= i * (i-1)
+            num *= x * x
+            sign *= -1
+            s += num / fact * sign
+    return _round(s)
+
+
+def sin(x):
+    """ sine """
+    result = _sin_cos_table(x, 0)
+    if result is None:
+        result = _sin_cos_anchored(x, 0)
+    if result is not None:
+        return result
+    # from docs.python.org/3/library/decimal.html#recipes
+    with localcontext() as ctx:
+        ctx.prec += 2
+        twopi = 2 * pi()
+        if x > twopi or x < -twopi:
+            x %= twopi
+        i, lasts, s, fact, num, sign = 1, 0, x, 1, x, 1
+        while s != lasts:
+            checkpoint()
+            lasts = s
+            i += 2
+            fact *= i * (i-1)
+            num *= x * x
+            sign *= -1
+            s += num / fact * sign
+    return _round(s)
+
+
+def sin_sign(x):
+    """ the sign of sin(x), 1 or -1, from the quarter turn x lies in and
+        the sign of what is left, without evaluating sin; a zero x gives
+        its own sign """
+    if not x:
+        return -1 if x.is_signed() else 1
+    k, r = _quarter_turns(x)
+    quadrant = k % 4
+    if quadrant % 2:
+        return 1 if quadrant == 1 else -1
+    return -1 if r.is_signed() == (quadrant == 0) else 1
+
+
+# guard digits for tan, tanh and the complex tangents
+TAN_GUARD = 3
+
+# a series or continued fraction is used when it needs about this
+# few terms
+SHORT_TERMS = 10
+
+# past this tan(r) is sin(r) / cos(r) from the series, not the anchors
+TAN_ANCHOR_DIGITS = 700
+
+
+def _tan_fraction(r):
+    """ tan(r) for |r| <= 1 by Lambert's continued fraction
+        r / (1 - r^2 / (3 - r^2 / (5 - ...))), with the denominator
+        evaluated forwards by the modified Lentz method until it stops
+        changing """
+    a = -r * r
+    fraction = c = Decimal(1)
+    d = Decimal(0)
+    b = 1
+    while True:
+        checkpoint()
+        b += 2
+        d = 1 / (b + a * d)
+        c = b + a / c
+        new = fraction * (c * d)
+        if new == fraction:
+            return r / fraction
+        fraction = new
+
+
+def _is_short(x, power):
+    """ whether a series or fraction in x**power stops within about
+        SHORT_TERMS terms; each gains power log10(1/|x|) digits """
+    return not x or -power * (x.adjusted() + 1) * SHORT_TERMS >= getcontext().prec
+
+
+def _tan_reduced(r):
+    """ tan(r) for |r| <= pi/4: by the continued fraction for small r,
+        else sin(r) / cos(r) from a single anchor or series """
+    if _is_short(r, 2):
+        return _tan_fraction(r)
+    if getcontext().prec <= TAN_ANCHOR_DIGITS:
+        sine, cosine = _sin_cos_near(r)
+    else:
+        r2 = r * r
+        sine, cosine = _alternating(r, r2, 1), _alternating(Decimal(1), r2, 0)
+    return sine / cosine
+
+
+def tan(x):
+    """ tangent: x = k pi/2 + r, and tan(x) = tan(r) for even k or
+        -1/tan(r) for odd k, reducing x once """
+    if not x or not x.is_finite():
+        return _round(sin(x) / cos(x))
+    with localcontext() as ctx:
+        ctx.prec += TAN_GUARD
+        k, r = _quarter_turns(x)
+        result = _tan_reduced(ctx.create_decimal(r))
+        if k % 2:
+            result = -1 / result
+    return _round(result)
+
+
+def acos(x):
+    """ inverse cosine: pi/2 - asin(x) for |x| <= 1/2, else from the
+        half angle, acos(x) = 2 asin(sqrt((1 - x) / 2)) and pi less
+        that for -x, as 1 - |x| is exact where pi/2 - asin(x) cancels """
+    if abs(x) > 1:
+        raise ValueError("arccos(x) requires |x| <= 1")
+    with localcontext() as ctx:
+        ctx.prec += 2
+        if abs(x) <= Decimal('0.5'):
+            result = pi() / 2 - asin(x)
+        else:
+            half = 2 * asin((EXACT_CONTEXT.subtract(1, abs(x)) / 2).sqrt())
+            result = half if x > 0 else pi() - half
+    return _round(result)
+
+
+def asin(x):
+    """ inverse sine, for |x| <= 1, by the Taylor series
+        arcsin(x) = x + (1/2)(x^3/3) + (1*3)/(2*4)(x^5/5)
+            + (1*3*5)/(2*4*6)(x^7/7) + ...
+        """
+    if abs(x) > 1:
+        raise ValueError("arcsin(x) requires |x| <= 1")
+    if not x:
+        return _round(x)
+    with localcontext() as ctx:
+        ctx.prec += 2
+        # past 1/sqrt(2), so that sqrt(1-x^2) is not reflected again
+        if abs(x) > Decimal('0.75'):
+            # arcsin(x) = sign * (pi/2 - arcsin(sqrt(1-x^2))), with 1-x^2
+            # exact, as it cancels as x nears 1
+            sign = 1 if x >= 0 else -1
+            root = EXACT_CONTEXT.subtract(1, EXACT_CONTEXT.multiply(x, x)).sqrt()
+            result = sign * (pi() / 2 - asin(root))
+        else:
+            # relative to x, so that small arguments keep every digit, and
+            # times 1-x^2, as the terms after the cutoff add up to about
+            # 1/(1-x^2) times it
+            cutoff = (abs(x) * (1 - x*x)).scaleb(-ctx.prec)
+            result = _asin_series(x, cutoff)
+    return _round(result)
+
+
+def _asin_series(x, cutoff):
+    """ the asin series, summed until a term is below cutoff """
+    power = x
+    result = x
+    i = 1
+    while True:
+        checkpoint()
+        power *= x * x * (2*i - 1) * (2*i - 1) / ((2*i) * (2*i + 1))
+        if abs(power) < cutoff:
+            return result
+        result += power
+        i += 1
+
+
+def atan(x):
+    """ inverse tangent by the Taylor series
+        arctan(x) = x - x^3/3 + x^5/5 - x^7/7 + ...  for |x| <= 1
+        For |x| > 1, atan(x) = pi/2 - atan(1/x) for x > 0
+                          or = -pi/2 - atan(1/x) for x < 0
+        """
+    result = _atan_table(x)
+    if result is not None:
+        return result
+    if not x:
+        return _round(x)
+    with localcontext() as ctx:
+        # relative to x, so that small arguments keep every digit
+        cutoff = abs(x).scaleb(-ctx.prec)
+        ctx.prec += 2
+
+        if abs(x) > 1:
+            # the identity above, to improve convergence
+            sign = 1 if x >= 0 else -1
+            result = sign * pi() / 2 - atan(1 / x)
+        elif x in (1, -1):
+            result = pi() / 4 if x > 0 else -pi() / 4
+        elif abs(x) > Decimal('0.5'):
+            # close to ±1, atan(x) = pi/4 + atan((x-1)/(x+1))
+            # converges faster
+            result = pi() / 4 + atan((x-1) / (x+1))
+        else:
+            result = _atan_series(x, cutoff)
+    return _round(result)
+
+
+def _atan_series(x, cutoff):
+    """ the atan series, summed until a term is below cutoff """
+    power = x
+    result = x
+    i = 1
+    while True:
+        checkpoint()
+        power *= -1 * x * x
+        term = power / (2 * i + 1)
+        if abs(term) < cutoff:
+            return result
+        result += term
+        i += 1
+
+
+def atan2(y, x):
+    """ inverse tangent of y/x in radians, in the quadrant of (x, y) """
+    with localcontext() as ctx:
+        ctx.prec += 2
+        if x > 0:
+            # quadrants 1 and 4
+            result = atan(y / x)
+        elif x < 0:
+            if y >= 0:
+                result = atan(y / x) + pi()
+            else:
+                result = atan(y / x) - pi()
+        elif y > 0:
+            result = pi() / 2
+        elif y < 0:
+            result = -pi() / 2
+        else:
+            result = Decimal(0)
+    return _round(result)
+
+
+# ----- exp and log near zero ----- #
+
+def _expm1_series(x):
+    """ x + x^2/2! + x^3/3! + ..., summed until the terms stop changing it """
+    total = term = x
+    n = 1
+    while True:
+        checkpoint()
+        n += 1
+        term = term * x / n
+        if total + term == total:
+            return total
+        total += term
+
+
+def _atanh_series(u):
+    """ u + u^3/3 + u^5/5 + ..., summed until the terms stop changing it """
+    total = power = u
+    u2 = u * u
+    k = 1
+    while True:
+        checkpoint()
+        power *= u2
+        k += 2
+        term = power / k
+        if total + term == total:
+            return total
+        total += term
+
+
+def expm1(x):
+    """ e ** x - 1, to full relative precision however small x is: by
+        the series once x^2 is past half the digits, else from exp
+        worked to the extra digits that subtracting 1 cancels """
+    if not x or not x.is_finite():
+        return Decimal(-1) if x.is_infinite() and x < 0 else _round(x)
+    with localcontext() as ctx:
+        ctx.prec += 2
+        lost = max(0, -x.adjusted())
+        if 2 * lost >= ctx.prec:
+            result = _expm1_series(x)
+        elif not lost:
+            result = exp(x) - 1
+        else:
+            # decimal's own exp is quick for |x| < 1, and builds no
+            # anchor table for the raised precision
+            ctx.prec += lost
+            result = (Decimal.exp(x) if ctx.prec <= AGM_EXP_DIGITS else exp(x)) - 1
+    return _round(result)
+
+
+def log1p(x):
+    """ ln(1 + x), to full relative precision however small x is: by
+        2 atanh(x / (2 + x)) when that series is short, else the
+        correctly rounded ln of 1 + x formed exactly """
+    if not x or x.is_nan():
+        return _round(x)
+    if x <= -1:
+        raise ValueError("Math10 domain error")
+    if x.is_infinite():
+        return x
+    if not _is_short(x, 2):
+        return ln(EXACT_CONTEXT.add(1, x))
+    with localcontext() as ctx:
+        ctx.prec += 2
+        result = 2 * _atanh_series(x / (2 + x))
+    return _round(result)
+
+
+# ----- hyperbolic functions ----- #
+
+def cosh(x):
+    """ hyperbolic cosine """
+    with localcontext() as ctx:
+        ctx.prec += 2
+        result = (x.exp() + x.copy_negate().exp()) / 2
+    return _round(result)
+
+
+def acosh(x):
+    """ inverse hyperbolic cosine: with t = x - 1, which is exact near
+        1, acosh(x) = log1p(t + sqrt(t (t + 2))) """
+    if x < 1:
+        raise ValueError("Math10 domain error")
+    with localcontext() as ctx:
+        ctx.prec += 2
+        t = x - 1
+        result = log1p(t + (t * (t + 2)).sqrt())
+    return _round(result)
+
+
+def sinh(x):
+    """ hyperbolic sine: with m = expm1(|x|), sinh(|x|) = (m + m / (m + 1)) / 2,
+        a sum of two positive terms """
+    if not x or not x.is_finite():
+        return _round(x)
+    with localcontext() as ctx:
+        ctx.prec += 2
+        m = expm1(x.copy_abs())
+        result = (m + m / (m + 1)) / 2
+    return _round(result.copy_sign(x))
+
+
+def asinh(x):
+    """ inverse hyperbolic sine: for a = |x|,
+        asinh(a) = log1p(a + a^2 / (1 + sqrt(1 + a^2))) """
+    if not x or not x.is_finite():
+        return _round(x)
+    with localcontext() as ctx:
+        ctx.prec += 2
+        a = abs(x)
+        a2 = a * a
+        result = log1p(a + a2 / (1 + (1 + a2).sqrt()))
+    return _round(result.copy_sign(x))
+
+
+def _tanh_sech2(x):
+    """ (tanh(x), 1 - tanh(x)^2) in the current context, each to its
+        full relative precision, from one exponential: for |x| < 1/2
+        m = expm1(-2|x|) gives -m / (2 + m) and 4 (1 + m) / (2 + m)^2,
+        else w = exp(-2|x|) gives (1 - w) / (1 + w) and 4w / (1 + w)^2 """
+    a2 = -2 * abs(x)
+    if a2.adjusted() < 0:
+        m = expm1(a2)
+        return (-m / (2 + m)).copy_sign(x), 4 * (1 + m) / (2 + m) ** 2
+    # far out w underflows to zero and tanh is exactly 1
+    w = exp(a2)
+    return ((1 - w) / (1 + w)).copy_sign(x), 4 * w / (1 + w) ** 2
+
+
+def tanh(x):
+    """ hyperbolic tangent, from one exponential """
+    if not x or x.is_nan():
+        return _round(x)
+    if x.is_infinite():
+        return Decimal(1).copy_sign(x)
+    with localcontext() as ctx:
+        ctx.prec += TAN_GUARD
+        result, _ = _tanh_sech2(x)
+    return _round(result)
+
+
+def atanh(x):
+    """ inverse hyperbolic tangent: for a = |x|,
+        atanh(a) = log1p(2a / (1 - a)) / 2 """
+    if x >= 1 or x <= -1:
+        raise ValueError("Math10 domain error")
+    if not x:
+        return _round(x)
+    with localcontext() as ctx:
+        ctx.prec += 2
+        a = abs(x)
+        result = log1p(2 * a / (1 - a)) / 2
+    return _round(result.copy_sign(x))
+
+
+# ----- complex tangents ----- #
+
+def complex_tanh(x, y):
+    """ (real, imag) of tanh(x + iy), for finite x and y, from
+        T = tanh(x), U = 1 - T^2 and t = tan(y):
+            (T (1 + t^2) + i t U) / (1 + T^2 t^2)
+        or, when |t| > 1, the same over t^2 with c = 1/t:
+            (T (c^2 + 1) + i c U) / (c^2 + T^2)
+        so nothing overflows for large x or near the poles of tan.
+        tan(z) is -i tanh(iz): complex_tanh(-y, x) gives (-imag, real)
+        of tan(x + iy). """
+    with localcontext() as ctx:
+        ctx.prec += TAN_GUARD
+        big_t, sech2 = _tanh_sech2(x)
+        k, r = _quarter_turns(y)
+        tangent = _tan_reduced(ctx.create_decimal(r))
+        square = tangent * tangent
+        if k % 2:
+            # tan(y) = -1/tan(r): tangent is -c
+            denominator = square + big_t * big_t
+            real = big_t * (square + 1) / denominator
+            imag = -tangent * sech2 / denominator
+        else:
+            denominator = 1 + big_t * big_t * square
+            real = big_t * (1 + square) / denominator
+            imag = tangent * sech2 / denominator
+    return _round(real), _round(imag)
+
+
+# ----- Writing the constants file ----- #
+
+def _atan_inverse(n, scale, hyperbolic=False):
+    """ scale * atan(1/n), or atanh(1/n), by the fixed-point series """
+    power = scale // n
+    total, k, sign = power, 1, 1
+    n2 = n * n
+    while power:
+        power //= n2
+        sign = sign if hyperbolic else -sign
+        total += sign * (power // (2 * k + 1))
+        k += 1
+    return total
+
+
+def _fixed_constants(scale):
+    """ {name: scale * constant} from integer series; each term's
+        truncation costs at most a unit, so all are within 10**7
+        units of the truth """
+    log2 = (18 * _atan_inverse(26, scale, True)
+            - 2 * _atan_inverse(4801, scale, True)
+            + 8 * _atan_inverse(8749, scale, True))
+    e_sum, term, k = 0, scale, 0
+    while term:
+        e_sum += term
+        k += 1
+        term //= k
+    return {'pi': 16 * _atan_inverse(5, scale) - 4 * _atan_inverse(239, scale),
+            'e': e_sum,
+            'ln2': log2,
+            # ln 10 = 3 ln 2 + ln(5/4), and ln(5/4) = 2 atanh(1/9)
+            'ln10': 3 * log2 + 2 * _atan_inverse(9, scale, True)}
+
+
+def write_constants(path=None, digits=STORED_DIGITS):
+    """ write digits digits of each stored constant to path (by default
+        the constants file beside this module) """
+    path = path or _data_paths(CONSTANTS_FILE)[0]
+    guard = 20
+    lines = ["# core10 constants: name, adjusted exponent, digits (truncated)"]
+    for name, value in _fixed_constants(10 ** (digits + guard)).items():
+        text = str(Decimal(value))
+        tail = text[digits:digits + guard // 2]
+        if tail.strip('0') == '' or tail.strip('9') == '':
+            raise ArithmeticError(f"{name}: too few guard digits to truncate")
+        lines.append(f"{name} {len(text) - digits - guard - 1} {text[:digits]}")
+    with open(path, 'w', encoding='ascii') as stream:
+        stream.write("\n".join(lines) + "\n")
+    _stored_index.cache_clear()
+
+
+def main():
+    """ regenerate the constants file """
+    write_constants()
+    print(f"wrote {STORED_DIGITS} digits of each constant to "
+          f"{_data_paths(CONSTANTS_FILE)[0]}")
+
+
+if __name__ == '__main__':
+    main()
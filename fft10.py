@@ -0,0 +1,224 @@
+""" Discrete Fourier transforms of CMath10 sequences.
+
+    spectrum = fft10.fft([CMath10(1, 0), CMath10(0, 1), 2, 3])
+    values = fft10.ifft(spectrum)
+
+Lengths that are powers of two use an iterative radix-2 transform;
+any other length goes through Bluestein's chirp-z algorithm, which
+turns the transform into a convolution of power-of-two length.  The
+work is done on columns of Decimals (fft_columns / ifft_columns take
+and return them directly) at a few guard digits, and every component
+is rounded once to the current context at the end.  The result is
+accurate to about the context precision relative to the largest
+input, as for a float FFT.
+
+The twiddle factors exp(-2 pi i k / n) are generated by one sin/cos
+recurrence per table (not a transcendental call per factor) and kept
+in the math10 constant cache, keyed on n and the working precision.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import Decimal, getcontext, localcontext
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10
+from math10 import Math10, cached_constant, checkpoint
+
+# Guard digits beyond the digits of the transform length
+GUARD = 3
+
+
+def _guard(n):
+    """ guard digits for a transform of length n """
+    return GUARD + len(str(n))
+
+
+def _twiddles(n):
+    """ (cos, -sin) of 2 pi k / n for k < n/2, at the current precision """
+
+    def compute():
+        with localcontext() as ctx:
+            ctx.prec += len(str(n)) + 2
+            theta = Math10(2 * Math10.pi() / n)
+            c1, s1 = Decimal(theta.cos()), Decimal(theta.sin())
+            # one recurrence sweep; with n a multiple of 8 the first
+            # octant is enough and the rest follows by symmetry
+            count = n // 8 + 1 if n % 8 == 0 else (n + 1) // 2
+            cos, sin = [Decimal(1)], [Decimal(0)]
+            c, s = cos[0], sin[0]
+            for _ in range(1, count):
+                c, s = c * c1 - s * s1, s * c1 + c * s1
+                cos.append(c)
+                sin.append(s)
+        if n % 8 == 0:
+            quarter = n // 4
+            for k in range(n // 8 + 1, quarter + 1):
+                cos.append(sin[quarter - k])
+                sin.append(cos[quarter - k])
+            for k in range(quarter + 1, n // 2):
+                cos.append(-sin[k - quarter])
+                sin.append(cos[k - quarter])
+        return (tuple(+c for c in cos), tuple(-s for s in sin))
+
+    return cached_constant(('fft-twiddles', n), compute)
+
+
+def _bit_reverse(re, im):
+    """ permute both columns into bit-reversed index order """
+    n = len(re)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            re[i], re[j] = re[j], re[i]
+            im[i], im[j] = im[j], im[i]
+
+
+def _radix2(re, im):
+    """ in-place forward transform; len(re) is a power of two """
+    n = len(re)
+    if n < 2:
+        return
+    _bit_reverse(re, im)
+    tw_re, tw_im = _twiddles(n)
+    size = 2
+    while size <= n:
+        half = size // 2
+        step = n // size
+        for k in range(half):
+            checkpoint()
+            wr, wi = tw_re[k * step], tw_im[k * step]
+            for top in range(k, n, size):
+                bottom = top + half
+                xr, xi = re[bottom], im[bottom]
+                if k:
+                    xr, xi = wr * xr - wi * xi, wr * xi + wi * xr
+                re[bottom], im[bottom] = re[top] - xr, im[top] - xi
+                re[top], im[top] = re[top] + xr, im[top] + xi
+        size *= 2
+
+
+def _inverse_radix2(re, im):
+    """ in-place inverse transform, by conjugating the forward one """
+    n = len(re)
+    im[:] = [x.copy_negate() for x in im]
+    _radix2(re, im)
+    re[:] = [x / n for x in re]
+    im[:] = [-x / n for x in im]
+
+
+def _chirp(n):
+    """ the chirp exp(-pi i k^2 / n) and the transformed filter for
+        Bluestein's algorithm, at the current precision """
+
+    def compute():
+        size = 1 << (2 * n - 2).bit_length()
+        tw_re, tw_im = _twiddles(2 * n)
+        c_re, c_im = [], []
+        for k in range(n):
+            index = k * k % (2 * n)
+            if index < n:
+                c_re.append(tw_re[index])
+                c_im.append(tw_im[index])
+            else:
+                c_re.append(-tw_re[index - n])
+                c_im.append(-tw_im[index - n])
+        b_re, b_im = [Decimal(0)] * size, [Decimal(0)] * size
+        for k in range(n):
+            b_re[k], b_im[k] = c_re[k], -c_im[k]
+            b_re[-k], b_im[-k] = c_re[k], -c_im[k]
+        _radix2(b_re, b_im)
+        return tuple(c_re), tuple(c_im), tuple(b_re), tuple(b_im)
+
+    return cached_constant(('fft-chirp', n), compute)
+
+
+def _multiply(a_re, a_im, b_re, b_im, count):
+    """ pointwise complex products of the first count entries """
+    return ([a_re[k] * b_re[k] - a_im[k] * b_im[k] for k in range(count)],
+            [a_re[k] * b_im[k] + a_im[k] * b_re[k] for k in range(count)])
+
+
+def _bluestein(re, im):
+    """ forward transform of any length, as a convolution """
+    n = len(re)
+    c_re, c_im, b_re, b_im = _chirp(n)
+    size = len(b_re)
+    a_re, a_im = _multiply(re, im, c_re, c_im, n)
+    a_re += [Decimal(0)] * (size - n)
+    a_im += [Decimal(0)] * (size - n)
+    _radix2(a_re, a_im)
+    a_re, a_im = _multiply(a_re, a_im, b_re, b_im, size)
+    _inverse_radix2(a_re, a_im)
+    re[:], im[:] = _multiply(a_re, a_im, c_re, c_im, n)
+
+
+def _transform(real, imag, inverse):
+    """ the shared body of fft_columns and ifft_columns """
+    re = [Decimal(x) for x in real]
+    im = [Decimal(x) for x in imag]
+    n = len(re)
+    if len(im) != n:
+        raise ValueError("real and imag columns have different lengths")
+    if n == 0:
+        return [], []
+    ctx = getcontext()
+    with localcontext() as work:
+        work.prec += _guard(1 << (2 * n - 1).bit_length())
+        if inverse:
+            im = [x.copy_negate() for x in im]
+        if n & (n - 1):
+            _bluestein(re, im)
+        else:
+            _radix2(re, im)
+        if inverse:
+            re = [x / n for x in re]
+            im = [-x / n for x in im]
+    return [ctx.plus(x) for x in re], [ctx.plus(x) for x in im]
+
+
+def fft_columns(real, imag):
+    """ forward transform of the columns real[k] + i imag[k], returned
+        as (real, imag) lists of Decimals:
+        X[j] = sum of x[k] exp(-2 pi i j k / n) """
+    return _transform(real, imag, inverse=False)
+
+
+def ifft_columns(real, imag):
+    """ inverse of fft_columns, including the 1/n """
+    return _transform(real, imag, inverse=True)
+
+
+def _columns(values):
+    """ real and imag columns of CMath10 (or real) values """
+    real, imag = [], []
+    for z in values:
+        if isinstance(z, CMath10):
+            real.append(z.real)
+            imag.append(z.imag)
+        else:
+            real.append(z)
+            imag.append(0)
+    return real, imag
+
+
+def fft(values):
+    """ forward transform of a sequence of CMath10 (or real) values """
+    real, imag = fft_columns(*_columns(values))
+    return [CMath10(x, y) for x, y in zip(real, imag)]
+
+
+def ifft(values):
+    """ inverse transform of a sequence of CMath10 (or real) values """
+    real, imag = ifft_columns(*_columns(values))
+    return [CMath10(x, y) for x, y in zip(real, imag)]
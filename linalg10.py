@@ -0,0 +1,299 @@
+""" Dense complex decimal matrices: product, LU, solve, det, inverse.
+
+    a = Matrix([[CMath10(2, 1), 1], [3, CMath10(0, -1)]])
+    x = a.solve([1, 2])          # list of CMath10
+    d = a.det()
+
+A Matrix keeps its entries as two row-major lists of Decimals (real
+and imaginary parts), so the kernels never build intermediate
+CMath10 objects.  Every inner product is accumulated exactly in
+math10.EXACT_CONTEXT (with fused multiply-adds) and rounded once:
+matmul() is therefore correctly rounded entry by entry, and LU uses
+the Crout ordering, in which each entry of L and U is one such inner
+product.  The factors are kept at a few guard digits; results are
+rounded to the current context.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import Decimal, getcontext, localcontext
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10
+from math10 import EXACT_CONTEXT, checkpoint
+
+# Guard digits for the LU factors, beyond the digits of n
+GUARD = 3
+
+_ZERO = Decimal(0)
+
+
+def _parts(z):
+    """ (real, imag) Decimals of a CMath10 or real entry """
+    if isinstance(z, CMath10):
+        return Decimal(z.real), Decimal(z.imag)
+    return Decimal(z), _ZERO
+
+
+def _dot(c, x, y):
+    """ c - sum of x[k] * y[k], exactly; c is a (real, imag) pair and x
+        and y are (real row, imag row) pairs """
+    fma = EXACT_CONTEXT.fma
+    rr = ii = ri = _ZERO
+    for xr, xi, yr, yi in zip(*x, *y):
+        rr = fma(xr, yr, rr)
+        ii = fma(xi, yi, ii)
+        ri = fma(xr, yi, ri)
+        ri = fma(xi, yr, ri)
+    subtract = EXACT_CONTEXT.subtract
+    return (subtract(c[0], subtract(rr, ii)), subtract(c[1], ri))
+
+
+def _divide(a_re, a_im, b_re, b_im):
+    """ (a_re + a_im i) / (b_re + b_im i) in the current context """
+    if not b_im:
+        return a_re / b_re, a_im / b_re
+    norm = b_re * b_re + b_im * b_im
+    return ((a_re * b_re + a_im * b_im) / norm,
+            (a_im * b_re - a_re * b_im) / norm)
+
+
+class Matrix:
+    """ A dense matrix of complex decimals. """
+
+
+    def __init__(self, rows):
+        """ rows is a sequence of equal-length sequences of CMath10
+            (or real) entries """
+        self.re, self.im = [], []
+        for row in rows:
+            parts = [_parts(z) for z in row]
+            self.re.append([x for x, _ in parts])
+            self.im.append([y for _, y in parts])
+        width = len(self.re[0]) if self.re else 0
+        if any(len(row) != width for row in self.re):
+            raise ValueError("rows have different lengths")
+        self.shape = (len(self.re), width)
+
+
+    @classmethod
+    def from_parts(cls, re, im):
+        """ a Matrix sharing the given rows of real and imaginary
+            Decimals, which are not copied """
+        matrix = cls([])
+        matrix.re, matrix.im = re, im
+        matrix.shape = (len(re), len(re[0]) if re else 0)
+        return matrix
+
+
+    @classmethod
+    def identity(cls, n):
+        """ the n x n identity """
+        return cls([[int(i == j) for j in range(n)] for i in range(n)])
+
+
+    def __getitem__(self, index):
+        """ m[i, j] as a CMath10 """
+        i, j = index
+        return CMath10(self.re[i][j], self.im[i][j])
+
+
+    def rows(self):
+        """ the entries as a list of lists of CMath10 """
+        return [[CMath10(x, y) for x, y in zip(row_re, row_im)]
+                for row_re, row_im in zip(self.re, self.im)]
+
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.re == other.re and self.im == other.im
+
+
+    __hash__ = None
+
+
+    def __repr__(self):
+        return f"Matrix({self.rows()!r})"
+
+
+    def transpose(self):
+        """ the transpose (not the conjugate transpose) """
+        return self.from_parts([list(col) for col in zip(*self.re)],
+                               [list(col) for col in zip(*self.im)])
+
+
+    def __matmul__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return matmul(self, other)
+
+
+    def lu(self):
+        """ the LU factorization, for repeated solves """
+        return LU(self)
+
+
+    def solve(self, b):
+        """ x with self @ x == b; b is a Matrix or a vector """
+        return self.lu().solve(b)
+
+
+    def det(self):
+        """ the determinant """
+        return self.lu().det()
+
+
+    def inverse(self):
+        """ the inverse matrix """
+        return self.lu().inverse()
+
+
+def matmul(a, b):
+    """ the product a @ b, each entry correctly rounded to the current
+        context """
+    if a.shape[1] != b.shape[0]:
+        raise ValueError(f"cannot multiply {a.shape} by {b.shape}")
+    minus = getcontext().minus
+    # column access is row access in the transpose
+    cols_re = [list(col) for col in zip(*b.re)]
+    cols_im = [list(col) for col in zip(*b.im)]
+    out_re, out_im = [], []
+    for row_re, row_im in zip(a.re, a.im):
+        checkpoint()
+        new_re, new_im = [], []
+        for col_re, col_im in zip(cols_re, cols_im):
+            re, im = _dot((_ZERO, _ZERO), (row_re, row_im), (col_re, col_im))
+            new_re.append(minus(re))
+            new_im.append(minus(im))
+        out_re.append(new_re)
+        out_im.append(new_im)
+    if not cols_re:
+        out_re = out_im = [[] for _ in a.re]
+    return Matrix.from_parts(out_re, out_im)
+
+
+class LU:
+    """ P A = L U with partial pivoting; L has a unit diagonal and is
+        stored below the diagonal of the same arrays as U """
+
+
+    def __init__(self, matrix):
+        """ factor the square matrix at a few guard digits """
+        n = matrix.shape[0]
+        if matrix.shape[1] != n:
+            raise ValueError(f"matrix is not square: {matrix.shape}")
+        self.prec = getcontext().prec + GUARD + len(str(n))
+        self.re = [list(row) for row in matrix.re]
+        self.im = [list(row) for row in matrix.im]
+        self.perm = list(range(n))
+        self.sign = 1
+        with localcontext() as ctx:
+            ctx.prec = self.prec
+            for k in range(n):
+                checkpoint()
+                self._column(k)
+                self._row(k)
+
+
+    def _column(self, k):
+        """ column k of U's diagonal and of L, choosing the pivot """
+        re, im = self.re, self.im
+        n = len(re)
+        u_re = [re[m][k] for m in range(k)]
+        u_im = [im[m][k] for m in range(k)]
+        best, pivot = -1, k
+        for i in range(k, n):
+            x, y = _dot((re[i][k], im[i][k]), (re[i][:k], im[i][:k]), (u_re, u_im))
+            re[i][k], im[i][k] = +x, +y
+            size = re[i][k] * re[i][k] + im[i][k] * im[i][k]
+            if size > best:
+                best, pivot = size, i
+        if not best:
+            raise ValueError("matrix is singular")
+        if pivot != k:
+            re[k], re[pivot] = re[pivot], re[k]
+            im[k], im[pivot] = im[pivot], im[k]
+            self.perm[k], self.perm[pivot] = self.perm[pivot], self.perm[k]
+            self.sign = -self.sign
+        for i in range(k + 1, n):
+            re[i][k], im[i][k] = _divide(re[i][k], im[i][k], re[k][k], im[k][k])
+
+
+    def _row(self, k):
+        """ row k of U to the right of the diagonal """
+        re, im = self.re, self.im
+        for j in range(k + 1, len(re)):
+            u_re = [re[m][j] for m in range(k)]
+            u_im = [im[m][j] for m in range(k)]
+            x, y = _dot((re[k][j], im[k][j]), (re[k][:k], im[k][:k]), (u_re, u_im))
+            re[k][j], im[k][j] = +x, +y
+
+
+    def _solve_columns(self, b_re, b_im):
+        """ solve for one right-hand side, at the working precision """
+        re, im = self.re, self.im
+        n = len(re)
+        x_re = [b_re[p] for p in self.perm]
+        x_im = [b_im[p] for p in self.perm]
+        for i in range(n):
+            x, y = _dot((x_re[i], x_im[i]), (re[i][:i], im[i][:i]),
+                        (x_re[:i], x_im[:i]))
+            x_re[i], x_im[i] = +x, +y
+        for i in reversed(range(n)):
+            x, y = _dot((x_re[i], x_im[i]), (re[i][i + 1:], im[i][i + 1:]),
+                        (x_re[i + 1:], x_im[i + 1:]))
+            x_re[i], x_im[i] = _divide(x, y, re[i][i], im[i][i])
+        return x_re, x_im
+
+
+    def solve(self, b):
+        """ x with A @ x == b; b is a Matrix (the result is a Matrix)
+            or a vector (the result is a list of CMath10) """
+        n = len(self.re)
+        plus = getcontext().plus
+        if isinstance(b, Matrix):
+            if b.shape[0] != n:
+                raise ValueError(f"cannot solve {n} rows for {b.shape}")
+            cols = zip(zip(*b.re), zip(*b.im))
+        else:
+            parts = [_parts(z) for z in b]
+            if len(parts) != n:
+                raise ValueError(f"cannot solve {n} rows for {len(parts)}")
+            cols = [([x for x, _ in parts], [y for _, y in parts])]
+        out_re, out_im = [], []
+        with localcontext() as ctx:
+            ctx.prec = self.prec
+            for col_re, col_im in cols:
+                checkpoint()
+                x_re, x_im = self._solve_columns(col_re, col_im)
+                out_re.append([plus(x) for x in x_re])
+                out_im.append([plus(y) for y in x_im])
+        if not isinstance(b, Matrix):
+            return [CMath10(x, y) for x, y in zip(out_re[0], out_im[0])]
+        if not out_re:
+            return Matrix.from_parts([[] for _ in range(n)],
+                                     [[] for _ in range(n)])
+        return Matrix.from_parts(out_re, out_im).transpose()
+
+
+    def det(self):
+        """ the determinant, the signed product of U's diagonal """
+        plus = getcontext().plus
+        with localcontext() as ctx:
+            ctx.prec = self.prec
+            x, y = Decimal(self.sign), _ZERO
+            for k, (row_re, row_im) in enumerate(zip(self.re, self.im)):
+                a, b = row_re[k], row_im[k]
+                x, y = x * a - y * b, x * b + y * a
+        return CMath10(plus(x), plus(y))
+
+
+    def inverse(self):
+        """ the inverse matrix """
+        return self.solve(Matrix.identity(len(self.re)))
@@ -9,19 +9,202 @@ Copyright (C) 2025 NYGeek LLC
 
 ToDo list in README.md
 
+The series themselves are plain Decimal functions in core10; the
+Math10 methods and the adapters here wrap only their final results.
+
+Thread safety: decimal contexts are per thread, so each thread
+computes at its own precision.  The only shared state is the
+constant cache in core10, which is keyed on precision and rounding
+and updated under a lock.
+
 """
 
 # ----- Python libraries ----- #
-from decimal import Decimal, localcontext
+from decimal import (Context, Decimal, ROUND_CEILING, ROUND_FLOOR,
+                     getcontext, localcontext)
+import functools
+import itertools
+import math
+import sys
+
+# ----- Local libraries ----- #
+import core10
+# the constant cache and cancellation are part of math10's interface
+from core10 import (EXACT_CONTEXT, cached_constant,  # pylint: disable=W0611
+                    cancel_scope, checkpoint, clear_constant_cache)
+
+
+# ----- Result finalization ----- #
+
+def finalize(value):
+    """ value (a Math10, CMath10 or Decimal) with each component rounded
+        once to the current context; the type and signed zeros are
+        kept, which unary plus would not do """
+    create = getcontext().create_decimal
+    if isinstance(value, Decimal):
+        return value.__class__(create(value))
+    return value.__class__(create(value.real), create(value.imag))
+
+
+def finalized(method):
+    """ decorator: the method's result goes through finalize(), so the
+        guard digits of its working precision never leak out; an
+        operator's NotImplemented is passed through """
+    @functools.wraps(method)
+    def wrapper(*args):
+        result = method(*args)
+        if result is NotImplemented:
+            return result
+        return finalize(result)
+    return wrapper
+
+
+# ----- Correct rounding (Ziv's strategy) ----- #
+
+# guard digits for the first attempt; each retry doubles them
+ZIV_GUARD = 5
+
+# the series are trusted to this many units in the last guard digit
+ZIV_ULPS = 10
+
+
+def round_if_certain(value, err):
+    """ value rounded to the current context, or None if some number
+        within err of value would round differently """
+    prec = getcontext().prec + 10
+    low = +Context(prec=prec, rounding=ROUND_FLOOR).subtract(value, err)
+    high = +Context(prec=prec, rounding=ROUND_CEILING).add(value, err)
+    if low != high:
+        return None
+    return low
+
+
+def ziv_round(value, working_prec, scale):
+    """ value (computed at working_prec digits, with an error of up
+        to ZIV_ULPS units in the last place of 10**scale) rounded to
+        the current context, or None if the error could change the
+        rounding.  Zero is taken to be exact. """
+    if not value or not value.is_finite():
+        return +value
+    return round_if_certain(
+            value, Decimal(ZIV_ULPS).scaleb(scale - working_prec + 1))
+
+
+def correctly_rounded(compute, absolute=False):
+    """ return compute() correctly rounded to the current precision,
+        computing with ZIV_GUARD extra digits and retrying with more
+        only when the result is too close to a rounding boundary to
+        decide.
+
+        compute() may return a Decimal or a complex value with .real
+        and .imag, whose error is measured against its larger part.
+        With absolute=True the error is measured against 1 when the
+        result is smaller, for functions whose argument reduction or
+        cancellation loses digits when the result is small. """
+    prec = getcontext().prec
+    guard = ZIV_GUARD
+    while True:
+        with localcontext() as ctx:
+            ctx.prec = prec + guard
+            value = compute()
+        parts = [value] if isinstance(value, Decimal) \
+                else [Decimal(value.real), Decimal(value.imag)]
+        scale = max((v.adjusted() for v in parts if v and v.is_finite()),
+                    default=0)
+        if absolute:
+            scale = max(scale, 0)
+        rounded = [ziv_round(v, prec + guard, scale) for v in parts]
+        if None not in rounded:
+            break
+        if guard > max(4 * prec, 100):
+            # an exact midpoint never resolves; its round-half rule
+            # is the right answer
+            rounded = [+v for v in parts]
+            break
+        guard *= 2
+    return value.__class__(*rounded)
+
+
+# ----- Binary floating point fast path ----- #
+
+# contexts at or below this precision may try the float fast path
+FLOAT_FAST_DIGITS = 15
+
+# libm results are trusted to this many rounding units
+FLOAT_ULPS = 4
+
+
+def float_arg(x):
+    """ x as a float, or None if the conversion is not within one
+        rounding unit (overflow, underflow, subnormal) """
+    value = float(x)
+    if not math.isfinite(value) or (value and
+                                    abs(value) < sys.float_info.min):
+        return None
+    return value
+
+
+def float_result(value, err):
+    """ the float value, with absolute error at most err (a float),
+        correctly rounded to the current context; None if that cannot
+        be certified """
+    if not math.isfinite(value) or not math.isfinite(err):
+        return None
+    return round_if_certain(Decimal(value), Decimal(err))
+
+
+def float_fast_path(func, cond, x, fallback):
+    """ func(float(x)) rounded to the current context when the
+        precision is low enough and the rounding can be certified,
+        fallback(x) otherwise.
+
+        cond(xf, fx) is the condition number x f'(x) / f(x) """
+    if getcontext().prec > FLOAT_FAST_DIGITS:
+        return fallback(x)
+    try:
+        xf = float_arg(x)
+        if xf is None or not xf:
+            return fallback(x)
+        fx = func(xf)
+        err = 2 * (abs(cond(xf, fx)) + FLOAT_ULPS) * abs(fx) * 2.0 ** -53
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return fallback(x)
+    rounded = float_result(fx, err) if fx else None
+    if rounded is None:
+        return fallback(x)
+    return Math10(rounded)
+
+
+# ----- Exact summation ----- #
+
+# EXACT_CONTEXT (from core10) never rounds a sum or product
+
+def fsum(values):
+    """ sum of the int or Decimal values, accumulated exactly and
+        rounded once to the current context """
+    add = EXACT_CONTEXT.add
+    total = Decimal(0)
+    for value in values:
+        total = add(total, value)
+    return Math10(getcontext().plus(total))
+
+
+def dot(a, b):
+    """ sum of a[k] * b[k], accumulated exactly and rounded once to the
+        current context; a and b must have the same length """
+    add, multiply = EXACT_CONTEXT.add, EXACT_CONTEXT.multiply
+    total = Decimal(0)
+    for x, y in itertools.zip_longest(a, b):
+        if x is None or y is None:
+            raise ValueError("dot() arguments have different lengths")
+        total = add(total, multiply(x, y))
+    return Math10(getcontext().plus(total))
 
 
 class Math10(Decimal):
     """ Class to implement trig and other math functions using
         decimal.py numbers. """
-
-    def __init__(self, rel_tol=1e-15):
-        super().__init__()
-        self.rel_tol = rel_tol
+    __slots__ = ()
 
 
     def isclose(self, z, rel_tol=1e-9, abs_tol=0.0):
@@ -41,245 +224,106 @@ class Math10(Decimal):
     @classmethod
     def pi(cls):
         """ return pi """
-        # docs.python.org/3/library/decimal.html#recipes
-        with localcontext() as ctx:
-            ctx.prec += 2
-            three = Decimal(3)
-            lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
-            while s != lasts:
-                lasts = s
-                n, na = n+na, na+8
-                d, da = d+da, da+32
-                t = (t * n) / d
-                s += t
-        return cls(+s)
+        return cls(core10.pi())
 
 
     @classmethod
     def e(cls):
         """ return e """
-        return cls('1').exp()
+        return cls(core10.e())
 
-# ----- trigonometric functions ----- #
 
-    def cos(self):
-        """ return cosine """
-        # from docs.python.org/3/library/decimal.html#recipes.
-        with localcontext() as ctx:
-            ctx.prec += 2
+    def exp(self, context=None):
+        """ e ** self, correctly rounded as decimal's own exp """
+        if context is None:
+            return self.__class__(core10.exp(self))
+        with localcontext(context):
+            return self.__class__(core10.exp(self))
 
-            twopi = 2 * self.pi()
-            x = self
 
-            if ((x > twopi) or (x < -twopi)):
-                x %= twopi
+    def ln(self, context=None):
+        """ natural logarithm, correctly rounded as decimal's own ln """
+        if context is None:
+            return self.__class__(core10.ln(self))
+        with localcontext(context):
+            return self.__class__(core10.ln(self))
 
-            i, lasts, s, fact, num, sign = 0, 0, 1, 1, 1, 1
-            while s != lasts:
-                lasts = s
-                i += 2
-                fact *= i * (i-1)
-                num *= x * x
-                sign *= -1
-                s += num / fact * sign
 
-        return self.__class__(+s)
+    def expm1(self):
+        """ e ** self - 1, without cancellation for small self """
+        return self.__class__(core10.expm1(self))
 
 
-    def sin(self):
-        """ return sin """
-        # from docs.python.org/3/library/decimal.html#recipes
-        with localcontext() as ctx:
-            ctx.prec += 2
+    def log1p(self):
+        """ ln(1 + self), without cancellation for small self """
+        return self.__class__(core10.log1p(self))
+
+# ----- trigonometric functions ----- #
+
+    def cos(self):
+        """ return cosine """
+        return self.__class__(core10.cos(self))
 
-            twopi = 2 * Math10.pi()
-            x = self
-            if ((x > twopi) or (x < -twopi)):
-                x %= twopi
-            i, lasts, s, fact, num, sign = 1, 0, x, 1, x, 1
-            while s != lasts:
-                lasts = s
-                i += 2
-                fact *= i * (i-1)
-                num *= x * x
-                sign *= -1
-                s += num / fact * sign
 
-        return self.__class__(+s)
+    def sin(self):
+        """ return sin """
+        return self.__class__(core10.sin(self))
 
 
     def tan(self):
-        """ sin(x) / cos(x) """
-        return self.__class__(self.sin() / self.cos())
+        """ return tangent """
+        return self.__class__(core10.tan(self))
 
 
     def acos(self):
         """ inverse cosine """
-        result = (self.pi() / 2) - self.asin()
-        return self.__class__(result)
+        return self.__class__(core10.acos(self))
 
 
     def asin(self):
-        """ inverse sine
-            Compute arcsin(x) using Taylor series.
-            Valid for |x| <= 1
-            arcsin(x) = x + (1/2)(x^3/3) + (1*3)/(2*4)(x^5/5)
-                + (1*3*5)/(2*4*6)(x^7/7) + ...
-            """
-        with localcontext() as ctx:
-            cutoff = Decimal(10) ** -ctx.prec
-            ctx.prec += 2
-
-            x = self
-            if abs(x) > 1:
-                raise ValueError("arcsin(x) requires |x| <= 1")
-            if abs(x) > Decimal('0.7'):
-                sign = 1 if x >= 0 else -1
-                # arcsin(x) = sign * (pi/2 - arcsin(sqrt(1-x^2)))
-                result = sign * (self.pi() / 2 - \
-                    self.__class__((1 - x*x).sqrt()).asin())
-                return self.__class__(+result)
-            power = x
-            result = x
-            i = 1
-            while True:
-                power *= x * x * (2*i - 1) * (2*i - 1) / ((2*i) * (2*i + 1))
-                term = power
-                if abs(term) < cutoff:
-                    break
-                result += term
-                i += 1
-
-        return self.__class__(+result)
+        """ inverse sine """
+        return self.__class__(core10.asin(self))
 
 
     def atan(self):
-        """ Compute arctan(x) using Taylor series.
-        arctan(x) = x - x^3/3 + x^5/5 - x^7/7 + ...  for |x| <= 1
-        For |x| > 1, use atan(x) = pi/2 - atan(1/x) for x > 0
-                           or = -pi/2 - atan(1/x) for x < 0
-        """
-        with localcontext() as ctx:
-            cutoff = Decimal(10) ** -ctx.prec
-            ctx.prec += 2
-
-            x = self
-
-            # For |x| > 1, use the identity to improve convergence
-            if abs(x) > 1:
-                sign = 1 if x >= 0 else -1
-                result = sign * self.__class__.pi() / 2 \
-                        - self.__class__(1/x).atan()
-                return self.__class__(+result)
-
-            # For values close to ±1, use atan(x) =
-            #   pi/4 + atan((x-1)/(x+1)) to improve convergence (holds for all x here)
-            if abs(x) > Decimal('0.5'):
-                pi_4 = self.__class__.pi() / 4
-                if x == self.__class__(1):
-                    return pi_4
-                if x == self.__class__(-1):
-                    return -pi_4
-                result = pi_4 + self.__class__((x-1)/(x+1)).atan()
-                return self.__class__(+result)
-
-            power = x
-            result = x
-            i = 1
-            while True:
-                power *= -1 * x * x
-                term = power / (2 * i + 1)
-                if abs(term) < cutoff:
-                    break
-                result += term
-                i += 1
-
-        return self.__class__(+result)
+        """ inverse tangent """
+        return self.__class__(core10.atan(self))
 
 
     @classmethod
     def atan2(cls, y, x):
         """ inverse tangent y/x in radians """
-        y = cls(y)
-        x = cls(x)
-
-        with localcontext() as ctx:
-            ctx.prec += 2
-
-            pi = cls.pi()
-            zero = cls(0)
-
-            if x > zero:
-                # quadrants 1 and 4
-                result = cls(y/x).atan()
-            elif x < zero:
-                if y >= zero:
-                    result = cls(y/x).atan() + pi
-                else:
-                    result = cls(y/x).atan() - pi
-            else: # x is zero
-                if y > zero:
-                    result = pi / 2
-                elif y < zero:
-                    result = -1 * cls(pi) / 2
-                else:
-                    result = zero
-
-        return cls(result)
+        return cls(core10.atan2(Decimal(y), Decimal(x)))
 
 
     def cosh(self):
         """ hyperbolic cosine """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            result = (self.exp() + (-1 * self).exp()) / 2
-            return self.__class__(result)
+        return self.__class__(core10.cosh(self))
 
 
     def acosh(self):
         """ inverse hyperbolic cosine """
-        if self < self.__class__(1):
-            raise ValueError("Math10 domain error")
-        with localcontext() as ctx:
-            ctx.prec += 2
-            one = self.__class__(1)
-            result = (self + ((self * self) - one).sqrt()).ln()
-            return self.__class__(result)
+        return self.__class__(core10.acosh(self))
 
 
     def sinh(self):
         """ hyperbolic sine """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            result = (self.exp() - (-1 * self).exp()) / 2
-            return self.__class__(result)
+        return self.__class__(core10.sinh(self))
 
 
     def asinh(self):
         """ inverse hyperbolic sin """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            one = self.__class__(1)
-            result = (self + (one + (self * self)).sqrt()).ln()
-            return self.__class__(result)
+        return self.__class__(core10.asinh(self))
 
 
     def tanh(self):
-        """ hyperbolic sine """
-        with localcontext() as ctx:
-            ctx.prec += 2
-            result = self.sinh() / self.cosh()
-            return self.__class__(result)
+        """ hyperbolic tangent """
+        return self.__class__(core10.tanh(self))
 
 
     def atanh(self):
         """ inverse hyperbolic tangent """
-        if self >= self.__class__(1) or self <= self.__class__(-1):
-            raise ValueError("Math10 domain error")
-        with localcontext() as ctx:
-            ctx.prec += 2
-            result = ((1 + self) / (1 - self)).ln() / 2
-            return self.__class__(result)
+        return self.__class__(core10.atanh(self))
 
 
 class StdLibAdapter:
@@ -304,75 +348,87 @@ class StdLibAdapter:
         return Math10.e()
 
 
+    @staticmethod
+    def expm1(x):
+        """ functional form of expm1 """
+        return Math10(core10.expm1(Decimal(x)))
+
+
+    @staticmethod
+    def log1p(x):
+        """ functional form of log1p """
+        return Math10(core10.log1p(Decimal(x)))
+
+
     @staticmethod
     def cos(x):
         """ functional form of cos """
-        return Math10(x).cos()
+        return Math10(core10.cos(Decimal(x)))
 
 
     @staticmethod
     def sin(x):
         """ functional form of sin """
-        return Math10(x).sin()
+        return Math10(core10.sin(Decimal(x)))
 
 
     @staticmethod
     def tan(x):
         """ functional form of tan """
-        return Math10(x).tan()
+        return Math10(core10.tan(Decimal(x)))
 
 
     @staticmethod
     def acos(x):
         """ functional form of acos """
-        return Math10(x).acos()
+        return Math10(core10.acos(Decimal(x)))
 
 
     @staticmethod
     def asin(z):
         """ functional form of asin """
-        return Math10(z).asin()
+        return Math10(core10.asin(Decimal(z)))
 
 
     @staticmethod
     def atan(x):
         """ functional form of atan """
-        return Math10(x).atan()
+        return Math10(core10.atan(Decimal(x)))
 
 
     @staticmethod
     def cosh(x):
         """ functional form of cosh """
-        return Math10(x).cosh()
+        return Math10(core10.cosh(Decimal(x)))
 
 
     @staticmethod
     def acosh(x):
         """ functional form of acosh """
-        return Math10(x).acosh()
+        return Math10(core10.acosh(Decimal(x)))
 
 
     @staticmethod
     def sinh(x):
         """ functional form of sinh """
-        return Math10(x).sinh()
+        return Math10(core10.sinh(Decimal(x)))
 
 
     @staticmethod
     def asinh(x):
         """ functional form of asinh """
-        return Math10(x).asinh()
+        return Math10(core10.asinh(Decimal(x)))
 
 
     @staticmethod
     def tanh(x):
         """ functional form of tanh """
-        return Math10(x).tanh()
+        return Math10(core10.tanh(Decimal(x)))
 
     @staticmethod
     def atanh(x):
         """ functional form of tanh """
-        return Math10(x).atanh()
+        return Math10(core10.atanh(Decimal(x)))
 
     @staticmethod
     def atan2(y, x):
@@ -380,6 +436,246 @@ class StdLibAdapter:
         return Math10.atan2(y, x)
 
 
+class CorrectlyRoundedAdapter(StdLibAdapter):
+    """ StdLibAdapter whose results are correctly rounded to the
+        context precision (see correctly_rounded) """
+
+    @staticmethod
+    def pi():
+        """ correctly rounded pi """
+        return correctly_rounded(Math10.pi)
+
+
+    @staticmethod
+    def e():
+        """ correctly rounded e """
+        return correctly_rounded(Math10.e)
+
+
+    @staticmethod
+    def expm1(x):
+        """ correctly rounded expm1 """
+        return correctly_rounded(lambda: Math10(x).expm1())
+
+
+    @staticmethod
+    def log1p(x):
+        """ correctly rounded log1p """
+        return correctly_rounded(lambda: Math10(x).log1p())
+
+
+    @staticmethod
+    def cos(x):
+        """ correctly rounded cos """
+        return correctly_rounded(lambda: Math10(x).cos(), absolute=True)
+
+
+    @staticmethod
+    def sin(x):
+        """ correctly rounded sin """
+        return correctly_rounded(lambda: Math10(x).sin(), absolute=True)
+
+
+    @staticmethod
+    def tan(x):
+        """ correctly rounded tan """
+        return correctly_rounded(lambda: Math10(x).tan(), absolute=True)
+
+
+    @staticmethod
+    def acos(x):
+        """ correctly rounded acos """
+        return correctly_rounded(lambda: Math10(x).acos(), absolute=True)
+
+
+    @staticmethod
+    def asin(z):
+        """ correctly rounded asin """
+        return correctly_rounded(lambda: Math10(z).asin())
+
+
+    @staticmethod
+    def atan(x):
+        """ correctly rounded atan """
+        return correctly_rounded(lambda: Math10(x).atan())
+
+
+    @staticmethod
+    def cosh(x):
+        """ correctly rounded cosh """
+        return correctly_rounded(lambda: Math10(x).cosh())
+
+
+    @staticmethod
+    def acosh(x):
+        """ correctly rounded acosh """
+        return correctly_rounded(lambda: Math10(x).acosh(), absolute=True)
+
+
+    @staticmethod
+    def sinh(x):
+        """ correctly rounded sinh """
+        return correctly_rounded(lambda: Math10(x).sinh(), absolute=True)
+
+
+    @staticmethod
+    def asinh(x):
+        """ correctly rounded asinh """
+        return correctly_rounded(lambda: Math10(x).asinh(), absolute=True)
+
+
+    @staticmethod
+    def tanh(x):
+        """ correctly rounded tanh """
+        return correctly_rounded(lambda: Math10(x).tanh(), absolute=True)
+
+
+    @staticmethod
+    def atanh(x):
+        """ correctly rounded atanh """
+        return correctly_rounded(lambda: Math10(x).atanh(), absolute=True)
+
+
+    @staticmethod
+    def atan2(y, x):
+        """ correctly rounded atan2 """
+        return correctly_rounded(lambda: Math10.atan2(y, x), absolute=True)
+
+
+class FastPathAdapter(CorrectlyRoundedAdapter):
+    """ CorrectlyRoundedAdapter that tries the float math library
+        first when the precision is FLOAT_FAST_DIGITS or less, and
+        keeps the float result only if its rounding is certain """
+
+
+    @staticmethod
+    def expm1(x):
+        """ expm1, through float when that is exact enough """
+        return float_fast_path(
+                math.expm1, lambda v, fv: v * math.exp(v) / fv,
+                x, CorrectlyRoundedAdapter.expm1)
+
+
+    @staticmethod
+    def log1p(x):
+        """ log1p, through float when that is exact enough """
+        return float_fast_path(
+                math.log1p, lambda v, fv: v / ((1 + v) * fv),
+                x, CorrectlyRoundedAdapter.log1p)
+
+
+    @staticmethod
+    def cos(x):
+        """ cos, through float when that is exact enough """
+        return float_fast_path(
+                math.cos, lambda v, fv: v * math.sin(v) / fv,
+                x, CorrectlyRoundedAdapter.cos)
+
+
+    @staticmethod
+    def sin(x):
+        """ sin, through float when that is exact enough """
+        return float_fast_path(
+                math.sin, lambda v, fv: v * math.cos(v) / fv,
+                x, CorrectlyRoundedAdapter.sin)
+
+
+    @staticmethod
+    def tan(x):
+        """ tan, through float when that is exact enough """
+        return float_fast_path(
+                math.tan, lambda v, fv: v / (math.sin(v) * math.cos(v)),
+                x, CorrectlyRoundedAdapter.tan)
+
+
+    @staticmethod
+    def acos(x):
+        """ acos, through float when that is exact enough """
+        return float_fast_path(
+                math.acos, lambda v, fv: v / (math.sqrt(1 - v * v) * fv),
+                x, CorrectlyRoundedAdapter.acos)
+
+
+    @staticmethod
+    def asin(z):
+        """ asin, through float when that is exact enough """
+        return float_fast_path(
+                math.asin, lambda v, fv: v / (math.sqrt(1 - v * v) * fv),
+                z, CorrectlyRoundedAdapter.asin)
+
+
+    @staticmethod
+    def atan(x):
+        """ atan, through float when that is exact enough """
+        return float_fast_path(
+                math.atan, lambda v, fv: v / ((1 + v * v) * fv),
+                x, CorrectlyRoundedAdapter.atan)
+
+
+    @staticmethod
+    def cosh(x):
+        """ cosh, through float when that is exact enough """
+        return float_fast_path(
+                math.cosh, lambda v, fv: v * math.tanh(v),
+                x, CorrectlyRoundedAdapter.cosh)
+
+
+    @staticmethod
+    def acosh(x):
+        """ acosh, through float when that is exact enough """
+        return float_fast_path(
+                math.acosh, lambda v, fv: v / (math.sqrt(v * v - 1) * fv),
+                x, CorrectlyRoundedAdapter.acosh)
+
+
+    @staticmethod
+    def sinh(x):
+        """ sinh, through float when that is exact enough """
+        return float_fast_path(
+                math.sinh, lambda v, fv: v / math.tanh(v),
+                x, CorrectlyRoundedAdapter.sinh)
+
+
+    @staticmethod
+    def asinh(x):
+        """ asinh, through float when that is exact enough """
+        return float_fast_path(
+                math.asinh, lambda v, fv: v / (math.sqrt(1 + v * v) * fv),
+                x, CorrectlyRoundedAdapter.asinh)
+
+
+    @staticmethod
+    def tanh(x):
+        """ tanh, through float when that is exact enough """
+        return float_fast_path(
+                math.tanh, lambda v, fv: v * (1 - fv * fv) / fv,
+                x, CorrectlyRoundedAdapter.tanh)
+
+
+    @staticmethod
+    def atanh(x):
+        """ atanh, through float when that is exact enough """
+        return float_fast_path(
+                math.atanh, lambda v, fv: v / ((1 - v * v) * fv),
+                x, CorrectlyRoundedAdapter.atanh)
+
+
+    @staticmethod
+    def atan2(y, x):
+        """ atan2, through float when that is exact enough """
+        if getcontext().prec <= FLOAT_FAST_DIGITS:
+            yf, xf = float_arg(y), float_arg(x)
+            if yf and xf:
+                fv = math.atan2(yf, xf)
+                # d atan2 = (x dy - y dx) / r^2, |dx|, |dy| <= eps
+                slope = 2 * abs(xf * yf) / (xf * xf + yf * yf)
+                rounded = float_result(
+                        fv, 2 * (slope + FLOAT_ULPS * abs(fv)) * 2.0 ** -53)
+                if rounded is not None:
+                    return Math10(rounded)
+        return CorrectlyRoundedAdapter.atan2(y, x)
+
+
 def main():
     """ simple smoke test """
     print("Smoke test is now in ssmoke.py.")
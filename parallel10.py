@@ -0,0 +1,50 @@
+""" Batch evaluation of Math10 and CMath10 functions on a thread pool.
+
+Each worker thread runs under a copy of the caller's decimal context,
+so every result is computed at the precision (and rounding) that was
+in force when the batch was submitted, whichever thread runs it.
+
+On a standard (GIL) interpreter this helps only when the work
+releases the GIL; on a free-threaded build the workers run in
+parallel.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from concurrent.futures import ThreadPoolExecutor
+from decimal import getcontext, localcontext
+import sys
+
+
+def gil_enabled():
+    """ True unless running on a free-threaded build with the GIL off """
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def evaluate_many(func, args, max_workers=None, context=None):
+    """ return [func(a) for a in args], computed on a thread pool
+
+        context defaults to the caller's decimal context; results
+        come back in the order of args. """
+    ctx = (context if context is not None else getcontext()).copy()
+
+    def run(arg):
+        with localcontext(ctx):
+            return func(arg)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, args))
+
+
+def main():
+    """ report the interpreter flavor """
+    print(f"GIL enabled: {gil_enabled()}")
+
+
+if __name__ == '__main__':
+    main()
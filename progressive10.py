@@ -0,0 +1,111 @@
+""" Progressive (anytime) evaluation of Math10 and CMath10 functions.
+
+    for value in refine(Math10.atan, Math10(2)):
+        show(value)
+
+refine() yields the result at 16, 32, 64, ... digits.  A caller can
+show the first answer at once and stop as soon as enough digits have
+settled (see agreeing_digits()).
+
+Where the function has an inverse that is cheaper than the function
+itself (asin, complex log), each step refines the previous iterate
+with one Newton step, which doubles the number of correct digits,
+instead of starting again from scratch.  Everything else is simply
+re-evaluated at the higher precision.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import Decimal, getcontext, localcontext
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10, StdLibAdapter as CAdapter
+from math10 import Math10, StdLibAdapter
+
+# Extra digits carried by the hidden iterate, so that one Newton step
+# from p digits reliably reaches 2p.
+GUARD = 4
+
+
+def _asin_step(y, x):
+    """ Newton for sin(y) = x; ill-conditioned near |x| = 1 """
+    x = Math10(x)
+    if abs(x) > Decimal('0.9'):
+        return None
+    return y - (Math10(y).sin() - x) / Math10(y).cos()
+
+
+def _clog_step(y, z):
+    """ Newton for exp(y) = z """
+    one = CMath10(1, 0)
+    return y.sub(one).add(z.div(y.exp()))
+
+
+_NEWTON_STEPS = {
+    Math10.asin: _asin_step,
+    StdLibAdapter.asin: _asin_step,
+    CMath10.log: _clog_step,
+    CAdapter.log: _clog_step,
+}
+
+
+def _round(value, kind):
+    """ value (scalar or complex) rounded to the current precision, as
+        a kind (a Newton step may return a plain Decimal) """
+    if isinstance(value, CMath10):
+        return kind(+value.real, +value.imag)
+    return kind(+value)
+
+
+def refine(func, arg, start=16, stop=None, factor=2):
+    """ yield func(arg) at precisions start, start*factor, ...
+        up to and including stop (forever if stop is None) """
+    step = _NEWTON_STEPS.get(func)
+    prec = start
+    iterate = kind = None
+    while stop is None or prec <= stop:
+        with localcontext() as ctx:
+            ctx.prec = prec + GUARD
+            if iterate is not None and step is not None:
+                iterate = step(iterate, arg)
+            if iterate is None or step is None:
+                iterate = func(arg)
+                kind = kind or type(iterate)
+            ctx.prec = prec
+            result = _round(iterate, kind)
+        yield result
+        prec *= factor
+
+
+def agreeing_digits(a, b, prec=None):
+    """ number of leading significant digits on which a and b agree
+        (for CMath10 values, the smaller of the two components); equal
+        values, zeros included, agree to prec digits, by default the
+        current precision """
+    if isinstance(a, CMath10):
+        return min(agreeing_digits(a.real, b.real, prec),
+                   agreeing_digits(a.imag, b.imag, prec))
+    if a == b:
+        return getcontext().prec if prec is None else prec
+    scale = max(abs(a), abs(b))
+    return max(0, (scale.adjusted() - (abs(a - b)).adjusted()))
+
+
+def settle(func, arg, digits, start=16, stop=None):
+    """ return the first refinement whose leading digits have stopped
+        changing from one step to the next; ArithmeticError if none
+        has by precision stop (by default 64 times digits) """
+    stop = max(start, 64 * digits) if stop is None else stop
+    previous = None
+    prec = start
+    for value in refine(func, arg, start, stop):
+        if previous is not None and agreeing_digits(previous, value, prec // 2) >= digits:
+            return value
+        previous = value
+        prec *= 2
+    raise ArithmeticError(f"{digits} digits did not settle by precision {stop}")
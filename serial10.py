@@ -0,0 +1,244 @@
+""" Compact binary storage for CMath10 values.
+
+    serial10.write('data.c10', values)
+    with serial10.Reader('data.c10') as data:
+        z = data[123456]
+
+Each component (real, then imaginary) is stored as a varint head
+holding the sign, the kind (finite, infinite, NaN) and the zigzagged
+exponent, followed by the coefficient as a length-prefixed unsigned
+big-endian integer.  0.1 takes three bytes, a 50-digit value 23.
+
+A file is the magic bytes, the records, an index of 8-byte record
+offsets, and a footer giving the record count and the index position.
+Reader maps the file into memory and decodes a record only when it is
+indexed, so a file far larger than memory can be scanned.  dumps()
+and loads() use the same layout in memory.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from array import array
+from decimal import Decimal
+import io
+import mmap
+import struct
+import sys
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10
+from math10 import EXACT_CONTEXT
+
+MAGIC = b'C10\x01'
+
+_FOOTER = struct.Struct('<QQ')
+_OFFSET = struct.Struct('<Q')
+
+# kinds, in the low two bits of a component's head
+_FINITE, _INFINITE, _NAN, _SNAN = range(4)
+
+
+# ----- varints ----- #
+
+def _put_varint(out, n):
+    """ append the unsigned LEB128 encoding of n to the bytearray out """
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _get_varint(data, pos):
+    """ (value, next position) of the varint at data[pos] """
+    n = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+# ----- components ----- #
+
+def _put_decimal(out, x):
+    """ append the encoding of the Decimal x """
+    sign, digits, exponent = x.as_tuple()
+    if exponent == 'F':
+        _put_varint(out, sign << 2 | _INFINITE)
+        return
+    if exponent in ('n', 'N'):
+        kind = _NAN if exponent == 'n' else _SNAN
+        _put_varint(out, sign << 2 | kind)
+        coefficient = int(''.join(map(str, digits))) if digits else 0
+    else:
+        zigzag = exponent * 2 if exponent >= 0 else -exponent * 2 - 1
+        _put_varint(out, (zigzag << 1 | sign) << 2 | _FINITE)
+        coefficient = int(x.copy_abs().scaleb(-exponent, EXACT_CONTEXT))
+    size = (coefficient.bit_length() + 7) // 8
+    _put_varint(out, size)
+    out += coefficient.to_bytes(size, 'big')
+
+
+def _get_decimal(data, pos):
+    """ (Decimal, next position) of the component at data[pos] """
+    head, pos = _get_varint(data, pos)
+    kind = head & 3
+    if kind == _INFINITE:
+        return Decimal('-Infinity' if head >> 2 else 'Infinity'), pos
+    size, pos = _get_varint(data, pos)
+    coefficient = int.from_bytes(data[pos:pos + size], 'big')
+    pos += size
+    if kind == _FINITE:
+        sign, zigzag = head >> 2 & 1, head >> 3
+        exponent = zigzag >> 1 if not zigzag & 1 else -(zigzag + 1 >> 1)
+        text = f"{'-' if sign else ''}{coefficient}E{exponent}"
+    else:
+        payload = coefficient if coefficient else ''
+        text = f"{'-' if head >> 2 else ''}{'s' if kind == _SNAN else ''}NaN{payload}"
+    return Decimal(text), pos
+
+
+# ----- values ----- #
+
+def _put(out, z):
+    """ append the encoding of a CMath10 (or real) value """
+    if isinstance(z, CMath10):
+        _put_decimal(out, z.real)
+        _put_decimal(out, z.imag)
+    else:
+        _put_decimal(out, Decimal(z))
+        _put_decimal(out, Decimal(0))
+
+
+def _get(data, pos):
+    """ (CMath10, next position) of the value at data[pos] """
+    real, pos = _get_decimal(data, pos)
+    imag, pos = _get_decimal(data, pos)
+    return CMath10(real, imag), pos
+
+
+def encode(z):
+    """ the bytes of one CMath10 (or real) value """
+    out = bytearray()
+    _put(out, z)
+    return bytes(out)
+
+
+def decode(data):
+    """ the CMath10 value encoded in data """
+    z, pos = _get(data, 0)
+    if pos != len(data):
+        raise ValueError("trailing bytes after encoded value")
+    return z
+
+
+# ----- containers ----- #
+
+def _write_records(stream, values):
+    """ write the magic, records, index and footer to a binary stream """
+    stream.write(MAGIC)
+    offsets = array('Q')
+    position = len(MAGIC)
+    out = bytearray()
+    for z in values:
+        offsets.append(position)
+        del out[:]
+        _put(out, z)
+        stream.write(out)
+        position += len(out)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    stream.write(offsets.tobytes())
+    stream.write(_FOOTER.pack(len(offsets), position))
+
+
+def dumps(values):
+    """ the container bytes for a sequence of values """
+    buffer = io.BytesIO()
+    _write_records(buffer, values)
+    return buffer.getvalue()
+
+
+def write(path, values):
+    """ store the values (any iterable) in the file at path """
+    with open(path, 'wb') as stream:
+        _write_records(stream, values)
+
+
+class Reader:
+    """ Lazy random access to the values in container bytes, or in a
+        file, which is memory mapped. """
+
+
+    def __init__(self, source):
+        """ source is a path, or bytes-like container data """
+        self._file = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._data = source
+        else:
+            self._file = open(source, 'rb')    # pylint: disable=R1732
+            self._data = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        if self._data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError("not a serial10 container")
+        self._count, self._index = _FOOTER.unpack_from(
+                self._data, len(self._data) - _FOOTER.size)
+
+
+    def __len__(self):
+        return self._count
+
+
+    def __getitem__(self, i):
+        """ the i'th value, decoded now """
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("serial10 index out of range")
+        (pos,) = _OFFSET.unpack_from(self._data, self._index + 8 * i)
+        return _get(self._data, pos)[0]
+
+
+    def __iter__(self):
+        """ every value in order, decoded one at a time """
+        pos = len(MAGIC)
+        for _ in range(self._count):
+            z, pos = _get(self._data, pos)
+            yield z
+
+
+    def close(self):
+        """ release the mapping and the file """
+        if self._file is not None:
+            self._data.close()
+            self._file.close()
+            self._file = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def loads(data):
+    """ every value in container bytes, as a list """
+    return list(Reader(data))
+
+
+def read(path):
+    """ every value in the file at path, as a list """
+    with Reader(path) as reader:
+        return list(reader)
@@ -0,0 +1,286 @@
+""" Sweeps of exp, sin and cos along arithmetic progressions.
+
+    for value in sweep10.sweep(CMath10.exp, z0, h, 100000):
+        plot(value)
+    real, imag = sweep10.sweep_columns(CMath10.sin, z0, h, 100000)
+
+sweep() yields func(start + k * step) for k < count, each rounded once
+to the context in force when it was called.  The grid points are formed
+exactly.  exp steps by one multiplication by exp(step); sin and cos
+step together by the addition formulas, and for a complex argument
+x + iy so do sinh y and cosh y, which combine with them part by part.
+So a point costs a few multiplications instead of a series.
+
+The recurrence is carried at guard digits, and every interval(prec)
+points the value is evaluated afresh from the grid point, so the error
+of the steps never builds up beyond the guard.  The interval grows with
+the precision, since a full evaluation costs more multiplications the
+more digits it has.  exp is accurate relative to its value; sin and cos
+are accurate relative to the larger of |sin| and |cos| (and sinh y to
+cosh y), as the fft10 twiddles are, so a part very close to a zero of
+sin, cos or sinh may lose digits where the grid crosses it.  A part
+that does not move along the grid (y for a real step) is exact to the
+precision.
+
+Any other function is simply evaluated at every point.
+
+Started 2026-10-19
+
+SPDX-License-Identifier: MIT
+Copyright (C) 2026 NYGeek LLC
+
+"""
+
+# ----- Python libraries ----- #
+from decimal import Decimal, getcontext, localcontext
+
+# ----- Local libraries ----- #
+from cmath10 import CMath10, StdLibAdapter as CAdapter
+from math10 import EXACT_CONTEXT, Math10, StdLibAdapter, checkpoint
+
+# Guard digits beyond the digits of the re-anchoring interval
+GUARD = 3
+
+# Points between fresh evaluations, per digit of precision, and bounds
+INTERVAL_PER_DIGIT = 2
+MIN_INTERVAL = 32
+MAX_INTERVAL = 4096
+
+
+def interval(prec):
+    """ points between fresh evaluations at precision prec """
+    return max(MIN_INTERVAL, min(MAX_INTERVAL, INTERVAL_PER_DIGIT * prec))
+
+
+def _guard(prec):
+    """ guard digits for a sweep at precision prec """
+    return GUARD + len(str(interval(prec)))
+
+
+# ----- exact arithmetic ----- #
+
+def _real_point(start, step, k):
+    """ start + k * step, exactly """
+    return EXACT_CONTEXT.fma(k, step, start)
+
+
+def _complex_point(start, step, k):
+    """ start + k * step, exactly """
+    return CMath10(_real_point(start.real, step.real, k),
+                   _real_point(start.imag, step.imag, k))
+
+
+def _times(ctx, a, b):
+    """ the complex product a * b, each part rounded once in ctx """
+    (ar, ai), (br, bi) = a, b
+    return (ctx.subtract(EXACT_CONTEXT.multiply(ar, br),
+                         EXACT_CONTEXT.multiply(ai, bi)),
+            ctx.add(EXACT_CONTEXT.multiply(ar, bi),
+                    EXACT_CONTEXT.multiply(ai, br)))
+
+
+def _rotate(ctx, pair, by):
+    """ (sin, cos) of a + b from pair = (sin a, cos a), by = (sin b, cos b) """
+    (s, c), (sb, cb) = pair, by
+    return (ctx.add(EXACT_CONTEXT.multiply(s, cb), EXACT_CONTEXT.multiply(c, sb)),
+            ctx.subtract(EXACT_CONTEXT.multiply(c, cb), EXACT_CONTEXT.multiply(s, sb)))
+
+
+def _stretch(ctx, pair, by):
+    """ (sinh, cosh) of a + b from pair = (sinh a, cosh a), by = (sinh b, cosh b) """
+    (s, c), (sb, cb) = pair, by
+    return (ctx.add(EXACT_CONTEXT.multiply(s, cb), EXACT_CONTEXT.multiply(c, sb)),
+            ctx.add(EXACT_CONTEXT.multiply(c, cb), EXACT_CONTEXT.multiply(s, sb)))
+
+
+def _parts(z):
+    """ (real, imag) of a CMath10 as Decimals """
+    return Decimal(z.real), Decimal(z.imag)
+
+
+# ----- recurrences at the working precision ----- #
+# each yields the values in the working context, evaluating afresh
+# every `every` points
+
+def _real_exp(work, start, step, count, every):
+    """ exp(start + k step) """
+    with localcontext(work):
+        factor = Decimal(Math10(step).exp())
+    value = None
+    for k in range(count):
+        if k % every:
+            value = work.multiply(value, factor)
+        else:
+            with localcontext(work):
+                value = Decimal(Math10(_real_point(start, step, k)).exp())
+        yield value
+
+
+def _complex_exp(work, start, step, count, every):
+    """ (real, imag) of exp(start + k step) """
+    with localcontext(work):
+        factor = _parts(step.exp())
+    value = None
+    for k in range(count):
+        if k % every:
+            value = _times(work, value, factor)
+        else:
+            with localcontext(work):
+                value = _parts(_complex_point(start, step, k).exp())
+        yield value
+
+
+def _real_sin_cos(work, start, step, count, every):
+    """ (sin, cos) of start + k step """
+    with localcontext(work):
+        by = (Decimal(Math10(step).sin()), Decimal(Math10(step).cos()))
+    pair = None
+    for k in range(count):
+        if k % every:
+            pair = _rotate(work, pair, by)
+        else:
+            with localcontext(work):
+                x = Math10(_real_point(start, step, k))
+                pair = (Decimal(x.sin()), Decimal(x.cos()))
+        yield pair
+
+
+def _sin_cos_sinh_cosh(x, y):
+    """ ((sin x, cos x), (sinh y, cosh y)) as Decimals """
+    x, y = Math10(x), Math10(y)
+    return ((Decimal(x.sin()), Decimal(x.cos())),
+            (Decimal(y.sinh()), Decimal(y.cosh())))
+
+
+def _complex_sin_cos(work, start, step, count, every):
+    """ ((sin x, cos x), (sinh y, cosh y)) of x + iy = start + k step """
+    with localcontext(work):
+        by, hyperbolic_by = _sin_cos_sinh_cosh(step.real, step.imag)
+    circular = hyperbolic = None
+    for k in range(count):
+        if k % every:
+            circular = _rotate(work, circular, by)
+            hyperbolic = _stretch(work, hyperbolic, hyperbolic_by)
+        else:
+            with localcontext(work):
+                z = _complex_point(start, step, k)
+                circular, hyperbolic = _sin_cos_sinh_cosh(z.real, z.imag)
+        yield circular, hyperbolic
+
+
+# ----- from the recurrences to results ----- #
+# each maps a working value to the parts of the result, rounded in ctx
+
+def _real_value(ctx, value):
+    """ a real value """
+    return (ctx.plus(value),)
+
+
+def _sin_of_pair(ctx, pair):
+    """ sin from (sin, cos) """
+    return (ctx.plus(pair[0]),)
+
+
+def _cos_of_pair(ctx, pair):
+    """ cos from (sin, cos) """
+    return (ctx.plus(pair[1]),)
+
+
+def _complex_value(ctx, value):
+    """ a complex value """
+    return ctx.plus(value[0]), ctx.plus(value[1])
+
+
+def _complex_sin(ctx, pairs):
+    """ sin(x + iy) = sin x cosh y + i cos x sinh y """
+    (sin, cos), (sinh, cosh) = pairs
+    return ctx.multiply(sin, cosh), ctx.multiply(cos, sinh)
+
+
+def _complex_cos(ctx, pairs):
+    """ cos(x + iy) = cos x cosh y - i sin x sinh y """
+    (sin, cos), (sinh, cosh) = pairs
+    return ctx.multiply(cos, cosh), ctx.minus(ctx.multiply(sin, sinh))
+
+
+# func: (complex arguments, recurrence, result)
+_SWEEPS = {
+    Math10.exp: (False, _real_exp, _real_value),
+    Math10.sin: (False, _real_sin_cos, _sin_of_pair),
+    Math10.cos: (False, _real_sin_cos, _cos_of_pair),
+    StdLibAdapter.sin: (False, _real_sin_cos, _sin_of_pair),
+    StdLibAdapter.cos: (False, _real_sin_cos, _cos_of_pair),
+    CMath10.exp: (True, _complex_exp, _complex_value),
+    CMath10.sin: (True, _complex_sin_cos, _complex_sin),
+    CMath10.cos: (True, _complex_sin_cos, _complex_cos),
+    CAdapter.exp: (True, _complex_exp, _complex_value),
+    CAdapter.sin: (True, _complex_sin_cos, _complex_sin),
+    CAdapter.cos: (True, _complex_sin_cos, _complex_cos),
+}
+
+
+def _as_complex(z):
+    """ z as a CMath10 """
+    return z if isinstance(z, CMath10) else CMath10(z, 0)
+
+
+def _parts_of(func, start, step, count, ctx):
+    """ yield the parts of func(start + k step), rounded in ctx """
+    is_complex, recurrence, result = _SWEEPS[func]
+    if is_complex:
+        start, step = _as_complex(start), _as_complex(step)
+    else:
+        start, step = Decimal(start), Decimal(step)
+    work = ctx.copy()
+    work.prec += _guard(ctx.prec)
+    for value in recurrence(work, start, step, count, interval(ctx.prec)):
+        checkpoint()
+        yield result(ctx, value)
+
+
+def _direct(func, start, step, count, ctx):
+    """ yield func(start + k step), evaluated at every point in ctx """
+    complex_arguments = isinstance(start, CMath10) or isinstance(step, CMath10)
+    for k in range(count):
+        with localcontext(ctx):
+            if complex_arguments:
+                point = _complex_point(_as_complex(start), _as_complex(step), k)
+            else:
+                point = Math10(_real_point(Decimal(start), Decimal(step), k))
+            value = func(point)
+        yield value
+
+
+def _results(func, start, step, count, ctx):
+    """ yield func(start + k step) as Math10 or CMath10 """
+    if _SWEEPS[func][0]:
+        for real, imag in _parts_of(func, start, step, count, ctx):
+            yield CMath10(real, imag)
+    else:
+        for (value,) in _parts_of(func, start, step, count, ctx):
+            yield Math10(value)
+
+
+def sweep(func, start, step, count):
+    """ a generator of func(start + k * step) for k < count,
+        rounded to the current context """
+    ctx = getcontext().copy()
+    if func not in _SWEEPS:
+        return _direct(func, start, step, count, ctx)
+    return _results(func, start, step, count, ctx)
+
+
+def sweep_columns(func, start, step, count):
+    """ func(start + k * step) for k < count as a list of Decimals, or
+        for a complex func a pair of lists (real, imag) """
+    ctx = getcontext().copy()
+    if func not in _SWEEPS:
+        values = list(_direct(func, start, step, count, ctx))
+        if values and isinstance(values[0], CMath10):
+            return ([Decimal(z.real) for z in values],
+                    [Decimal(z.imag) for z in values])
+        return [Decimal(value) for value in values]
+    parts = list(zip(*_parts_of(func, start, step, count, ctx)))
+    if _SWEEPS[func][0]:
+        return (list(parts[0]), list(parts[1])) if parts else ([], [])
+    return list(parts[0]) if parts else []
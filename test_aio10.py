@@ -0,0 +1,96 @@
+""" Unit test suite for aio10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+import asyncio
+from concurrent.futures import CancelledError
+from decimal import localcontext
+import threading
+import time
+import unittest
+
+import aio10
+from cmath10 import CMath10
+from math10 import Math10, cancel_scope, clear_constant_cache
+
+
+class Aio10Tests(unittest.TestCase):
+    """asyncio wrappers: results, precision, cancellation, bounds."""
+
+    def setUp(self):
+        self.limit = aio10.max_concurrency()
+
+    def tearDown(self):
+        aio10.set_max_concurrency(self.limit)
+
+    def test_matches_sync(self):
+        """awaited results equal the direct method calls."""
+        z = CMath10(1, 2)
+        got = asyncio.run(aio10.exp(z))
+        expected = z.exp()
+        self.assertEqual((got.real, got.imag), (expected.real, expected.imag))
+        self.assertEqual(asyncio.run(aio10.log(2)), Math10(2).ln())
+
+    def test_prec(self):
+        """prec= sets the working precision of the worker only."""
+        got = asyncio.run(aio10.pi(prec=60))
+        with localcontext() as ctx:
+            ctx.prec = 60
+            self.assertEqual(got, Math10.pi())
+        self.assertEqual(len(str(asyncio.run(aio10.e(prec=12)))), 13)
+
+    def test_cancel_scope(self):
+        """series loops raise once the scope's event is set."""
+        clear_constant_cache()
+        event = threading.Event()
+        event.set()
+        with cancel_scope(event):
+            self.assertRaises(CancelledError, Math10(1).sin)
+        self.assertIsInstance(Math10(1).sin(), Math10)
+
+    def test_cancel_stops_worker(self):
+        """cancelling the task frees its slot promptly."""
+        aio10.set_max_concurrency(1)
+
+        async def scenario():
+            clear_constant_cache()
+            # past the anchors sin sums its series, checking for
+            # cancellation at each term: about 20 seconds uncancelled
+            task = asyncio.ensure_future(aio10.sin(1, prec=20000))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            start = time.perf_counter()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # the single slot must come back long before that sine
+            # could have been finished
+            await aio10.sin(1, prec=20)
+            return time.perf_counter() - start
+
+        self.assertLess(asyncio.run(scenario()), 2.0)
+
+    def test_bounded(self):
+        """no more than max_concurrency() calls run at once."""
+        aio10.set_max_concurrency(2)
+        state = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                state['now'] += 1
+                state['peak'] = max(state['peak'], state['now'])
+            time.sleep(0.02)
+            with lock:
+                state['now'] -= 1
+
+        async def scenario():
+            await asyncio.gather(*(aio10.run(work) for _ in range(8)))
+
+        asyncio.run(scenario())
+        self.assertEqual(state['peak'], 2)
+        self.assertRaises(ValueError, aio10.set_max_concurrency, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+""" Unit test suite for ball10.py
+
+Each ball computed at 20 digits must contain the value computed by
+Math10/CMath10 at 60 digits, and must be narrow.
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import Decimal, localcontext
+import unittest
+
+from ball10 import Ball, CBall, certify
+from cmath10 import CMath10
+from math10 import Math10
+
+REAL_CASES = {
+    'exp': ['-3', '0.5', '20'],
+    'ln': ['0.001', '1.5', '1e10'],
+    'log10': ['3', '1234.5'],
+    'sqrt': ['2', '0.01'],
+    'sin': ['0.3', '-2', '100'],
+    'cos': ['0.3', '-2', '100'],
+    'tan': ['0.3', '-1.5', '3'],
+    'asin': ['-0.99', '0.5'],
+    'acos': ['-0.5', '0.9'],
+    'atan': ['-7', '0.2', '0.9'],
+    'sinh': ['-2', '0.1'],
+    'cosh': ['-2', '0.1'],
+    'tanh': ['-0.7', '3'],
+    'asinh': ['-3', '0.25'],
+    'acosh': ['1.5', '10'],
+    'atanh': ['-0.9', '0.3'],
+}
+
+COMPLEX_CASES = ['exp', 'log', 'log10', 'sqrt', 'sin', 'cos', 'tan',
+                 'sinh', 'cosh', 'tanh', 'asin', 'acos', 'atan',
+                 'asinh', 'acosh', 'atanh']
+
+
+def reference(func, x):
+    """func at 60 digits"""
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return func(x)
+
+
+class Ball10Tests(unittest.TestCase):
+    """Balls enclose the true value and are tight."""
+
+    def test_arithmetic(self):
+        """+ - * / enclose the exact result."""
+        with localcontext() as ctx:
+            ctx.prec = 10
+            third = Ball(1) / 3
+            total = third + third + third
+            self.assertTrue(total.contains(1))
+            self.assertTrue((third * 3 - 1).contains(0))
+            self.assertTrue((2 - Ball('0.5', '0.1')).contains('1.6'))
+            self.assertGreaterEqual(third.accurate_digits(), 8)
+            self.assertRaises(ZeroDivisionError, Ball(1).__truediv__,
+                              Ball(0, '0.1'))
+
+    def test_real_functions(self):
+        """every real function encloses the 60-digit value."""
+        for name, args in REAL_CASES.items():
+            for arg in args:
+                with localcontext() as ctx:
+                    ctx.prec = 20
+                    ball = getattr(Ball(arg), name)()
+                expected = reference(getattr(Math10, name), Math10(arg))
+                self.assertTrue(ball.contains(expected),
+                                f"{name}({arg}): {ball!r} vs {expected}")
+                self.assertGreaterEqual(ball.accurate_digits(), 16,
+                                        f"{name}({arg}): {ball!r}")
+
+    def test_radius_propagates(self):
+        """an uncertain input widens the output accordingly."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            ball = Ball('1', '1e-5').exp()
+            self.assertTrue(ball.contains(Math10('1.00001').exp()))
+            self.assertTrue(ball.contains(Math10('0.99999').exp()))
+            self.assertLessEqual(ball.accurate_digits(), 5)
+
+    def test_domains(self):
+        """balls that leave the domain raise ValueError."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            self.assertRaises(ValueError, Ball('1', '0.1').asin)
+            self.assertRaises(ValueError, Ball('0', '0.1').ln)
+            self.assertRaises(ValueError, Ball('1.5', '0.2').tan)
+            self.assertRaises(ValueError, CBall(-1, Ball(0, '0.1')).log)
+
+    def test_complex_functions(self):
+        """every complex function encloses the 60-digit value."""
+        for name in COMPLEX_CASES:
+            for z in (CMath10('0.3', '0.4'), CMath10(-2, '1.5'),
+                      CMath10('1.5', '-0.25')):
+                with localcontext() as ctx:
+                    ctx.prec = 20
+                    ball = getattr(CBall(z.real, z.imag), name)()
+                expected = reference(getattr(CMath10, name), z)
+                self.assertTrue(ball.contains(expected),
+                                f"{name}({z}): {ball!r} vs {expected}")
+                self.assertGreaterEqual(ball.accurate_digits(), 14,
+                                        f"{name}({z}): {ball!r}")
+
+    def test_certify(self):
+        """certify reaches the requested accuracy."""
+        ball = certify(Ball.exp, Decimal(1), 30)
+        self.assertGreaterEqual(ball.accurate_digits(), 30)
+        self.assertTrue(str(ball.mid).startswith("2.7182818284590452353602874713"))
+        zball = certify(CBall.log, CMath10(3, 4), 25)
+        self.assertGreaterEqual(zball.accurate_digits(), 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+""" Unit test suite for cheb10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import Decimal, localcontext
+import os
+import tempfile
+import unittest
+
+import cheb10
+import core10
+
+
+class Cheb10Tests(unittest.TestCase):
+    """Generating the Chebyshev tables."""
+
+    def test_coefficients(self):
+        """the truncated series reproduces the reduced function."""
+        coefficients = cheb10.chebyshev('cos', 12)
+        self.assertLess(len(coefficients), 12)
+        with localcontext() as ctx:
+            ctx.prec = 15
+            for s in ('-0.9', '0', '0.3', '1'):
+                s = Decimal(s)
+                value = core10.clenshaw(coefficients, s)
+                ctx.prec = 40
+                exact = cheb10.REDUCED['cos'](s)
+                ctx.prec = 15
+                self.assertLess(abs(value - exact), Decimal('1E-13'), s)
+
+    def test_write_tables(self):
+        """the generator reproduces the shipped tables."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tables.txt')
+            cheb10.write_tables(path)
+            with open(path, encoding='ascii') as stream:
+                written = stream.read()
+        with open(core10._data_paths(core10.CHEBYSHEV_FILE)[0],  # pylint: disable=W0212
+                  encoding='ascii') as stream:
+            self.assertEqual(written, stream.read())
+
+    def test_report(self):
+        """the tables stay within a unit of the last place."""
+        results = cheb10.report(12, count=50)
+        self.assertEqual(set(results), set(cheb10.REDUCED))
+        for name, (degree, worst, series, table) in results.items():
+            self.assertGreater(degree, 0, name)
+            self.assertLess(worst, 1, name)
+            self.assertGreater(series, 0, name)
+            self.assertGreater(table, 0, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,11 +9,19 @@ Uses mathdata/cmath_testcases.txt; comparison is via CMath10.isclose().
 SPDX-License-Identifier: MIT
 """
 
+import copy
 import os
+import pickle
 import unittest
+import cmath as builtin_cmath
 import math as builtin_math
+from decimal import Context, Decimal, InvalidOperation, getcontext, localcontext
 
-from cmath10 import CMath10, StdLibAdapter as c
+from cmath10 import CMath10, StdLibAdapter as c, isclose_many
+from cmath10 import GAUSS_DIGITS, RECIPROCAL_DIGITS
+from cmath10 import dot, format_many, fsum
+from cmath10 import CorrectlyRoundedAdapter as cr
+from cmath10 import FastPathAdapter as fast
 from math10 import Math10
 
 # Tolerances for complex Decimal vs float expected
@@ -54,6 +62,17 @@ def parse_testfile(fname):
             )
 
 
+def on_branch_cut(fn, z):
+    """True if complex z lies on a branch cut of cmath function fn."""
+    if fn in ('asin', 'acos', 'atanh'):
+        return z.imag == 0 and abs(z.real) > 1
+    if fn in ('asinh', 'atan'):
+        return z.real == 0 and abs(z.imag) > 1
+    if fn in ('log', 'log10', 'sqrt'):
+        return z.imag == 0 and z.real < 0
+    return False
+
+
 def make_z(real, imag):
     """Build CMath10 from float real, imag."""
     return CMath10(real, imag)
@@ -157,6 +176,25 @@ class CMath10Tests(unittest.TestCase):
                     f"{fn_name}({v}): imag part should be 0"
                 )
 
+    def test_axis_dispatch(self):
+        """Real- and imaginary-axis shortcuts agree with cmath."""
+        values = [0.0, 0.25, -0.5, 0.9, 1.0, -1.0, 2.0, -3.5]
+        for fn_name in sorted(CMATH10_FUNCTIONS):
+            for v in values:
+                for z in (complex(v, 0.0), complex(0.0, v)):
+                    try:
+                        expected = getattr(builtin_cmath, fn_name)(z)
+                        got = getattr(c, fn_name)(make_z(z.real, z.imag))
+                    except (ValueError, ZeroDivisionError, InvalidOperation):
+                        continue
+                    # CMath10 ignores the sign of zero on a branch cut,
+                    # and its acosh takes the other branch for Re z <= 0
+                    ignore = fn_name == 'acosh' or on_branch_cut(fn_name, z)
+                    err = result_check_complex(
+                            expected.real, expected.imag, got,
+                            ignore_real_sign=ignore, ignore_imag_sign=ignore)
+                    self.assertIsNone(err, f"{fn_name}({z}): {err}")
+
     @unittest.skipUnless(os.path.isfile(CMATH_TESTCASES),\
             "mathdata/cmath_testcases.txt not found")
     # pylint: disable=R0913, R0917
@@ -190,6 +228,57 @@ class CMath10Tests(unittest.TestCase):
                 self.fail(f"{id_} {fn}(complex({ar!r},{ai!r})): {err}")
         self.assertGreater(run, 0, "no test cases ran (check mathdata/cmath_testcases.txt)")
 
+    def test_context_untouched(self):
+        """CMath10 computes at, and never changes, the context precision."""
+        with localcontext() as ctx:
+            ctx.prec = 40
+            z = CMath10(1, 1).exp()
+            self.assertEqual(getcontext().prec, 40)
+            self.assertEqual(z.precision, 40)
+            self.assertTrue(z.isclose(CMath10(
+                "1.468693939915885157138967597326604261326",
+                "2.287355287178842391208171906700501808955"),
+                rel_tol=1e-38))
+
+    def test_correctly_rounded(self):
+        """Ziv adapter equals a much more precise result, rounded."""
+        for prec in (10, 16, 28):
+            for fn_name in sorted(CMATH10_FUNCTIONS):
+                for z in (CMath10('0.3', '0.4'), CMath10(-2, '1.5'),
+                          CMath10('1e-9', 2)):
+                    with localcontext() as ctx:
+                        ctx.prec = prec + 40
+                        try:
+                            expected = getattr(c, fn_name)(z)
+                        except (ValueError, InvalidOperation):
+                            continue
+                        ctx.prec = prec
+                        got = getattr(cr, fn_name)(z)
+                        self.assertEqual(
+                            (got.real, got.imag),
+                            (+expected.real, +expected.imag),
+                            f"{fn_name}({z}) @ {prec}")
+
+    @unittest.skipUnless(os.path.isfile(CMATH_TESTCASES),\
+            "mathdata/cmath_testcases.txt not found")
+    def test_fast_path(self):
+        """float fast path agrees with the decimal path on the test file."""
+        for prec in (12, 15):
+            for (id_, fn, ar, ai, _, _, _) in parse_testfile(CMATH_TESTCASES):
+                if fn not in CMATH10_FUNCTIONS:
+                    continue
+                z = make_z(ar, ai)
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    try:
+                        expected = getattr(cr, fn)(z)
+                    except (ValueError, ZeroDivisionError, InvalidOperation):
+                        continue
+                    got = getattr(fast, fn)(z)
+                self.assertEqual((got.real, got.imag),
+                                 (expected.real, expected.imag),
+                                 f"{id_} {fn}({ar}, {ai}) @ {prec}")
+
     def test_phase(self):
         """phase(z) = arg z (real result)."""
         self.assertAlmostEqual(float(c.phase(make_z(1, 0)).real), 0.0)
@@ -204,5 +293,352 @@ class CMath10Tests(unittest.TestCase):
         self.assertAlmostEqual(float(c.abs(make_z(1, 0)).real), 1.0)
 
 
+class IscloseTests(unittest.TestCase):
+    """PEP 485 closeness on the complex magnitude."""
+
+    def test_isclose(self):
+        """relative and absolute tolerances, both sides of the bound."""
+        z = CMath10(3, 4)
+        self.assertTrue(z.isclose(CMath10(3, '4.0000000049')))
+        self.assertFalse(z.isclose(CMath10(3, '4.0000000051')))
+        self.assertTrue(z.isclose(CMath10(3, '4.00004'), rel_tol=1e-5))
+        self.assertFalse(CMath10(0, 0).isclose(CMath10('1e-20', 0)))
+        self.assertTrue(CMath10(0, 0).isclose(CMath10('1e-20', 0),
+                                              abs_tol=1e-15))
+        self.assertTrue(CMath10(2, 0).isclose(2))
+        self.assertTrue(CMath10('2.0000000001', 0).isclose(Decimal(2)))
+
+    def test_non_finite(self):
+        """NaN is close to nothing, infinity only to itself."""
+        inf = CMath10('Infinity', 0)
+        self.assertTrue(inf.isclose(CMath10('Infinity', 0)))
+        self.assertFalse(inf.isclose(CMath10('-Infinity', 0)))
+        self.assertFalse(inf.isclose(CMath10(1, 0), abs_tol=1e300))
+        self.assertFalse(CMath10('NaN', 0).isclose(CMath10('NaN', 0)))
+
+    def test_isclose_many(self):
+        """pairwise and broadcast forms agree with isclose."""
+        zs = [CMath10(1, 1), CMath10(1, '1.0001'), CMath10(-1, 1)]
+        ws = [CMath10(1, 1), CMath10(1, 1), CMath10(1, 1)]
+        want = [z.isclose(w, rel_tol=1e-6) for z, w in zip(zs, ws)]
+        self.assertEqual(isclose_many(zs, ws, rel_tol=1e-6), want)
+        self.assertEqual(isclose_many(zs, CMath10(1, 1), rel_tol=1e-6), want)
+        self.assertEqual(isclose_many(zs, CMath10(1, 1), rel_tol=1e-3),
+                         [True, True, False])
+        self.assertRaises(ValueError, isclose_many, zs, ws[:2])
+        self.assertRaises(ValueError, isclose_many, zs[:2], iter(ws))
+
+
+class StringTests(unittest.TestCase):
+    """parsing and formatting of '(a+bi)' text."""
+
+    def test_from_string(self):
+        """cmath-style and calculator-style literals."""
+        cases = {
+            '(1+2i)': ('1', '2'), '1-2j': ('1', '-2'), '3': ('3', '0'),
+            '(-1.5E+3-2.5e-7I)': ('-1.5E+3', '-2.5E-7'), '-j': ('0', '-1'),
+            'i': ('0', '1'), ' ( 1 + 2.50i ) ': ('1', '2.50'),
+            '(Infinity-0i)': ('Infinity', '-0'),
+            '0.1000000000000000000000000000001': ('0.1000000000000000000000000000001', '0'),
+        }
+        for text, (real, imag) in cases.items():
+            z = CMath10.from_string(text)
+            self.assertEqual((str(z.real), str(z.imag)), (real, imag), text)
+        self.assertEqual(CMath10('(1+2i)'), CMath10(1, 2))
+        self.assertRaises(InvalidOperation, CMath10.from_string, '1+2k')
+        self.assertRaises(InvalidOperation, CMath10.from_string, '')
+
+    def test_parse_many(self):
+        """one value per non-blank line."""
+        lines = ['(1+2i)\n', '\n', '-3.5\n', '(0-1e-40i)']
+        self.assertEqual(CMath10.parse_many(lines),
+                         [CMath10(1, 2), CMath10('-3.5', 0),
+                          CMath10(0, '-1e-40')])
+
+    def test_repr_round_trip(self):
+        """repr keeps every digit; str hides what precision hides."""
+        for z in (CMath10('0.1', '-1e-50'), CMath10('-0', '-0'),
+                  CMath10('1.23456789012345678901234567890123456789', 2)):
+            w = eval(repr(z))    # pylint: disable=W0123
+            self.assertEqual((str(w.real), str(w.imag)),
+                             (str(z.real), str(z.imag)))
+        with localcontext() as ctx:
+            ctx.prec = 28
+            self.assertEqual(str(CMath10('0.1', '-1e-50')), '(0.1+0i)')
+            self.assertEqual(str(CMath10('-1e-50', '-2')), '(0-2i)')
+            self.assertEqual(format_many([CMath10(1, 2), CMath10(0, '-1e-30')]),
+                             ['(1+2i)', '(0+0i)'])
+
+
+class SummationTests(unittest.TestCase):
+    """exact fsum and dot over CMath10 sequences."""
+
+    def test_fsum(self):
+        """components accumulate exactly; reals are accepted."""
+        with localcontext() as ctx:
+            ctx.prec = 10
+            zs = [CMath10('1e30', 1), CMath10(1, '1e-20'), 2,
+                  CMath10('-1e30', -1)]
+            self.assertEqual(fsum(zs), CMath10(3, '1e-20'))
+            self.assertEqual(fsum(CMath10('0.1', '-0.1') for _ in range(1000)),
+                             CMath10(100, -100))
+            self.assertEqual(fsum([]), 0)
+
+    def test_dot(self):
+        """complex products without conjugation, rounded once."""
+        with localcontext() as ctx:
+            ctx.prec = 5
+            a = [CMath10('1.0001', 1), CMath10(-1, 0)]
+            b = [CMath10('1.0001', -1), 2]
+            self.assertEqual(dot(a, b), CMath10('0.00020001', 0))
+            self.assertEqual(dot([CMath10(0, 1)], [CMath10(0, 1)]), -1)
+            self.assertRaises(ValueError, dot, a, b[:1])
+
+
+class MixedArithmeticTests(unittest.TestCase):
+    """CMath10 with int, Decimal and Math10 operands."""
+
+    def assert_same(self, got, real, imag):
+        """got == real + imag i exactly"""
+        self.assertEqual((got.real, got.imag), (Decimal(real), Decimal(imag)))
+
+    def test_scalar_operands(self):
+        """real operands are used directly on either side."""
+        z = CMath10('1.5', '-2')
+        self.assert_same(z + 1, '2.5', '-2')
+        self.assert_same(1 + z, '2.5', '-2')
+        self.assert_same(z - Decimal('0.5'), '1', '-2')
+        self.assert_same(Decimal('0.5') - z, '-1', '2')
+        self.assert_same(2 * z, '3', '-4')
+        self.assert_same(z * Math10('0.5'), '0.75', '-1')
+        self.assert_same(z / 2, '0.75', '-1')
+        self.assert_same(-z, '-1.5', '2')
+
+    def test_scalar_matches_promoted(self):
+        """scalar fast paths give the promoted results."""
+        z = CMath10('0.3', '0.7')
+        for s in (3, Decimal('-0.25'), Math10('7.125')):
+            w = CMath10(s, 0)
+            for got, want in ((z + s, z + w), (s + z, w + z),
+                              (z - s, z - w), (s - z, w - z),
+                              (z * s, z * w), (s * z, w * z),
+                              (z / s, z / w), (s / z, w / z)):
+                self.assertTrue(got.isclose(want, rel_tol=1e-25), f"{got} {want}")
+
+    def test_pow(self):
+        """integer, real and complex powers."""
+        z = CMath10(1, 1)
+        self.assert_same(z ** 2, '0', '2')
+        self.assert_same(z ** 0, '1', '0')
+        self.assertTrue((z ** -2).isclose(CMath10(0, '-0.5')))
+        self.assertTrue((z ** Decimal('0.5')).isclose(z.sqrt()))
+        self.assertTrue((z ** CMath10(0, 1)).isclose(
+            CMath10('0.4288290062943678', '0.1548717524642468')))
+        self.assertRaises(ZeroDivisionError, CMath10(0, 0).__pow__, -1)
+        # unsupported operands fall back to the reflected operator
+        self.assertRaises(TypeError, lambda: CMath10(2, 1) ** 1.5)
+        self.assertRaises(TypeError, pow, z, 2, 3)
+
+    def test_eq(self):
+        """value equality with complex and real operands."""
+        self.assertEqual(CMath10(2, 0), 2)
+        self.assertEqual(CMath10(2, 0), Decimal(2))
+        self.assertEqual(CMath10('2.0', '1'), CMath10(2, 1))
+        self.assertNotEqual(CMath10(2, 1), 2)
+        self.assertNotEqual(CMath10(2, 0), "2")
+
+    def test_unsupported(self):
+        """floats are refused, as decimal refuses them."""
+        z = CMath10(1, 1)
+        self.assertRaises(TypeError, lambda: z + 1.5)
+        self.assertRaises(TypeError, lambda: 1.5 * z)
+
+
+class ImmutableTests(unittest.TestCase):
+    """CMath10 values are immutable, hashable and interned."""
+
+    def test_immutable(self):
+        """attributes cannot be assigned or deleted."""
+        z = CMath10(1, 2)
+        with self.assertRaises(AttributeError):
+            z.real = Math10(3)
+        with self.assertRaises(AttributeError):
+            z.extra = 1
+        with self.assertRaises(AttributeError):
+            del z.imag
+        self.assertEqual(z, CMath10(1, 2))
+
+    def test_hash(self):
+        """equal values hash alike, including real numbers."""
+        self.assertEqual(hash(CMath10('2.0', 0)), hash(2))
+        self.assertEqual(hash(CMath10(1, 2)), hash(CMath10('1.00', '2')))
+        self.assertEqual(len({CMath10(1, 2), CMath10(1, 2), CMath10(2, 0), 2}), 2)
+
+    def test_copy_and_pickle(self):
+        """copies and pickles round-trip through the constructor."""
+        z = CMath10('1.25', '-3', precision=12)
+        for clone in (copy.copy(z), copy.deepcopy(z),
+                      pickle.loads(pickle.dumps(z))):
+            self.assertEqual(clone, z)
+            self.assertEqual(clone.precision, 12)
+
+    def test_interned(self):
+        """one shared instance per class and value."""
+
+        class Sub(CMath10):
+            """subclass with its own interned constants."""
+
+        self.assertIs(CMath10.interned(0, 1), CMath10.interned(0, 1))
+        self.assertIs(type(Sub.interned(0, 1)), Sub)
+        self.assertIsNot(Sub.interned(0, 1), CMath10.interned(0, 1))
+        self.assertIs(type(Sub('0.5', '0.5').atan()), Sub)
+
+    def test_complex_arguments(self):
+        """CMath10(z, w) is z + w i, as for complex()."""
+        with self.assertWarns(DeprecationWarning):
+            z = CMath10(CMath10(1, 2), 3)
+        self.assertEqual(z, CMath10(1, 5))
+        with self.assertWarns(DeprecationWarning):
+            z = CMath10(CMath10(1, 2), CMath10(0, 1))
+        self.assertEqual(z, CMath10(0, 2))
+
+
+class PrecisionTests(unittest.TestCase):
+    """Results are rounded once to the caller's precision."""
+
+    def test_digits(self):
+        """no result carries more digits than the context."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            z = CMath10('0.3', '0.4')
+            w = CMath10('1.23456789012345678901234567', '-2.5')
+            results = [getattr(z, name)() for name in sorted(CMATH10_FUNCTIONS)]
+            results += [z + w, z - w, z * w, z / w, 3 - w, 3 / w,
+                        z ** 3, z ** w, w + Decimal('1.2345678901234567890123')]
+            for r in results:
+                for part in (r.real, r.imag):
+                    self.assertLessEqual(len(part.as_tuple().digits), 20, r)
+
+    def test_single_rounding(self):
+        """products and quotients are rounded once, not twice."""
+        with localcontext() as ctx:
+            ctx.prec = 5
+            a = CMath10('1.0001', '1')
+            # exactly 0.00020001 + 2.0002i; rounding the products first
+            # would give 0.0002
+            self.assertEqual(a * a, CMath10('0.00020001', '2.0002'))
+            self.assertEqual(CMath10(1, 3) / CMath10(1, 1), CMath10(2, 1))
+
+    def test_high_precision_kernels(self):
+        """Gauss products and reciprocal quotients round exactly as
+        the four-multiplication and two-division forms do."""
+        exact = Context(prec=10000)
+        for prec in (GAUSS_DIGITS, RECIPROCAL_DIGITS, 1000):
+            with localcontext() as ctx:
+                ctx.prec = prec
+                z = CMath10(Decimal(10) / 7, Decimal(-30) / 11)
+                w = CMath10(Decimal(2) / 3, Decimal(5) / 13)
+                a, b, x, y = z.real, z.imag, w.real, w.imag
+                product, quotient = z * w, z / w
+                mul = exact.multiply
+                self.assertEqual(product.real,
+                                 ctx.subtract(mul(a, x), mul(b, y)))
+                self.assertEqual(product.imag, ctx.add(mul(a, y), mul(b, x)))
+                den = exact.add(mul(x, x), mul(y, y))
+                self.assertEqual(quotient.real,
+                                 ctx.divide(exact.add(mul(a, x), mul(b, y)), den))
+                self.assertEqual(quotient.imag,
+                                 ctx.divide(exact.subtract(mul(b, x), mul(a, y)), den))
+
+    def test_reciprocal_tie(self):
+        """an exact halfway quotient falls back to exact division."""
+        with localcontext() as ctx:
+            ctx.prec = RECIPROCAL_DIGITS
+            x = 1 + Decimal(5).scaleb(-RECIPROCAL_DIGITS)
+            q = CMath10(x, x).div(CMath10(1, 1))
+            self.assertEqual((q.real, q.imag), (Decimal(1), Decimal(0)))
+
+    def test_signed_zero(self):
+        """rounding keeps the sign of a zero part."""
+        z = CMath10('-0', '-0') + 0
+        self.assertEqual(z.imag.as_tuple().sign, 1)
+        self.assertEqual(CMath10(0, '-0').exp().imag.as_tuple().sign, 1)
+        self.assertEqual((1 - CMath10(0, 0)).imag.as_tuple().sign, 1)
+        # cos(x + iy) = cos x cosh y - i sin x sinh y, as cmath signs it
+        axes = [(0, 2), (0, -2), ('-0', 2), ('-0', -2)]
+        axes += [(x, y) for x in (4, 1, -4, -1, 7, -22) for y in ('0', '-0')]
+        for x, y in axes:
+            want = builtin_cmath.cos(complex(float(x), float(y))).imag
+            got = CMath10(x, y).cos().imag
+            self.assertEqual(got.is_signed(), builtin_math.copysign(1, want) < 0, (x, y))
+
+    def test_tangents(self):
+        """tan and tanh match the closed form, past overflow and near poles."""
+        def closed(x, y):
+            with localcontext() as ctx:
+                ctx.prec += 20
+                den = (2 * x).exp() / 2 + (-2 * x).exp() / 2 + CMath10(0, 2 * y).exp().real
+                num = (2 * x).exp() / 2 - (-2 * x).exp() / 2
+                return num / den, CMath10(0, 2 * y).exp().imag / den
+        with localcontext() as ctx:
+            ctx.prec = 30
+            for x, y in (('0.3', '2.1'), ('-1.5', '0.2'), ('2', '1.5707963'),
+                         ('0.001', '-40'), ('-60', '3'), ('1E-12', '1E-12')):
+                x, y = Decimal(x), Decimal(y)
+                real, imag = closed(x, y)
+                z = CMath10(x, y).tanh()
+                self.assertLessEqual(abs(z.real - real), abs(+real) * Decimal('1E-29'), (x, y))
+                self.assertLessEqual(abs(z.imag - imag), abs(+imag) * Decimal('1E-29'), (x, y))
+                w = CMath10(-y, x).tan()
+                self.assertEqual((w.real, w.imag), (-z.imag, z.real))
+            # far from the real axis the real part is tiny, not zero
+            z = CMath10(3, 10 ** 6).tan()
+            self.assertEqual(z.imag, 1)
+            tiny = 2 * CMath10(0, 6).exp().imag * Decimal(-2 * 10 ** 6).exp()
+            self.assertLessEqual(abs(z.real - tiny), abs(tiny) * Decimal('1E-29'))
+
+    def test_near_zero(self):
+        """expm1, log1p, atanh and log keep their digits near 0 and 1."""
+        with localcontext() as ctx:
+            ctx.prec = 30
+            one = CMath10(1, 0)
+            cases = [('expm1', lambda z: z.exp() - one), ('log1p', lambda z: (z + one).log()),
+                     ('atanh', lambda z: ((one + z) / (one - z)).log() / 2)]
+            for x, y in (('1E-20', '3E-21'), ('-2E-9', '5E-12'), ('0.3', '-0.4')):
+                z = CMath10(x, y)
+                for name, reference in cases:
+                    value = getattr(z, name)()
+                    ctx.prec = 130
+                    exact = reference(z)
+                    ctx.prec = 30
+                    for got, full in ((value.real, exact.real), (value.imag, exact.imag)):
+                        self.assertLessEqual(abs(got - full), abs(+full) * Decimal('1E-29'),
+                                             (name, x, y))
+            # on the unit circle, off by one part in 10**25
+            z = CMath10('0.6', '0.8000000000000000000000000001')
+            ctx.prec = 80
+            exact = z.scalar_abs().ln()
+            ctx.prec = 30
+            self.assertLessEqual(abs(z.log().real - exact), abs(+exact) * Decimal('1E-29'))
+            self.assertEqual(CMath10(0, 0).log().real, Decimal('-Infinity'))
+            self.assertRaises(ValueError, CMath10(1, 0).atanh)
+            # 1 - x² - y² of order x² is past the exponent range of x
+            z = CMath10('1E-600000', 1).atanh()
+            self.assertEqual(z.imag, +(Math10.pi() / 4))
+            self.assertEqual(z.real, Decimal('5E-600001'))
+            self.assertEqual(CMath10('-1E-600000', -1).atanh().imag, -(Math10.pi() / 4))
+            self.assertEqual(c.expm1(CMath10('0.5', 0)), CMath10('0.5', 0).expm1())
+
+    def test_chain_stays_bounded(self):
+        """a long iteration keeps operands at the context precision."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            z, w = CMath10('0.1', '0.2'), CMath10('0.7', '0.3')
+            for _ in range(100):
+                z = (z * w + 1).tanh()
+            self.assertLessEqual(len(z.real.as_tuple().digits), 20)
+            self.assertLessEqual(len(z.imag.as_tuple().digits), 20)
+
+
 if __name__ == '__main__':
     unittest.main()
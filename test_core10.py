@@ -0,0 +1,435 @@
+""" Unit test suite for core10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, localcontext
+import math
+import os
+import tempfile
+import unittest
+
+import core10
+import math10
+from math10 import Math10
+
+FUNCTIONS = ('cos', 'sin', 'tan', 'acos', 'asin', 'atan',
+             'cosh', 'acosh', 'sinh', 'asinh', 'tanh', 'atanh',
+             'expm1', 'log1p')
+
+
+class Core10Tests(unittest.TestCase):
+    """The plain Decimal functions under Math10."""
+
+    def test_plain_decimals(self):
+        """results are Decimals, rounded to the context."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            for name in FUNCTIONS:
+                x = Decimal('1.5') if name == 'acosh' else Decimal('0.3')
+                result = getattr(core10, name)(x)
+                self.assertIs(type(result), Decimal, name)
+                self.assertLessEqual(len(result.as_tuple().digits), 20, name)
+                self.assertAlmostEqual(float(result), getattr(math, name)(float(x)),
+                                       places=14, msg=name)
+
+    def test_facade(self):
+        """Math10 methods return the core results, as Math10."""
+        with localcontext() as ctx:
+            ctx.prec = 30
+            x = Math10('0.7')
+            for name in FUNCTIONS:
+                if name == 'acosh':
+                    continue
+                result = getattr(x, name)()
+                self.assertIsInstance(result, Math10)
+                self.assertEqual(result, getattr(core10, name)(Decimal('0.7')))
+            self.assertEqual(Math10.atan2(1, -2),
+                             core10.atan2(Decimal(1), Decimal(-2)))
+
+    def test_atan2_quadrants(self):
+        """atan2 follows the signs of both arguments."""
+        with localcontext() as ctx:
+            ctx.prec = 16
+            for y, x in ((1, 2), (1, -2), (-1, -2), (-1, 2), (1, 0), (-1, 0), (0, 0)):
+                self.assertAlmostEqual(float(core10.atan2(Decimal(y), Decimal(x))),
+                                       math.atan2(y, x), places=14)
+
+    def test_domain(self):
+        """arguments outside the domain raise ValueError."""
+        self.assertRaises(ValueError, core10.asin, Decimal('1.5'))
+        self.assertRaises(ValueError, core10.acos, Decimal('-1.5'))
+        self.assertRaises(ValueError, core10.acosh, Decimal('0.5'))
+        self.assertRaises(ValueError, core10.atanh, Decimal(1))
+
+    def test_acos_near_ends(self):
+        """acos keeps its digits as x nears 1 or -1, and asin does not
+        bounce between x and sqrt(1-x^2) just past 0.7."""
+        for text in ('0.9999999999', '0.99999999999999999999999', '0.6', '-0.99999999', '-0.6'):
+            x = Decimal(text)
+            with localcontext() as ctx:
+                ctx.prec = 60
+                exact = 2 * core10.asin(((1 - x) / 2).sqrt())
+                ctx.prec = 28
+                ulp = Decimal(1).scaleb(exact.adjusted() - 27)
+                self.assertLessEqual(abs(core10.acos(x) - exact), ulp, text)
+        self.assertEqual(core10.acos(Decimal(1)), 0)
+        with localcontext() as ctx:
+            ctx.prec = 28
+            self.assertEqual(core10.acos(Decimal(-1)), +core10.pi())
+            self.assertAlmostEqual(float(core10.asin(Decimal('0.705'))),
+                                   math.asin(0.705), places=14)
+
+    def test_asin_rounded_once(self):
+        """asin is within half an ulp (and a little) of atan(x/sqrt(1-x^2))
+        on both sides of the reflection at 0.75 and next to 1."""
+        for prec, text in ((5, '0.73946'), (12, '0.747243245427'),
+                           (17, '0.74887852823234580'), (30, '0.74'), (30, '0.7500001'),
+                           (16, '0.9999999993299369'), (30, '0.999999999999999926')):
+            x = Decimal(text)
+            with localcontext() as ctx:
+                ctx.prec = prec + 40
+                exact = core10.atan(x / (1 - x * x).sqrt())
+                ctx.prec = prec
+                ulp = Decimal(1).scaleb(exact.adjusted() - prec + 1)
+                self.assertLessEqual(abs(core10.asin(x) - exact), ulp * Decimal('0.6'),
+                                     (prec, text))
+
+    def test_hyperbolic_large(self):
+        """sinh and cosh of large arguments with more digits than the
+        precision, whose condition number is about |x|."""
+        for prec, x in ((12, 203.4662329838271), (5, 242.31707859228), (5, -318.0417262315),
+                        (12, -286.1867641617163), (5, -198.53215090763695)):
+            x = Decimal(x)
+            with localcontext() as ctx:
+                ctx.prec = prec + 40
+                exact = {'sinh': (x.exp() - x.copy_negate().exp()) / 2,
+                         'cosh': (x.exp() + x.copy_negate().exp()) / 2}
+                ctx.prec = prec
+                for name, full in exact.items():
+                    ulp = Decimal(1).scaleb(full.adjusted() - prec + 1)
+                    self.assertLessEqual(abs(getattr(core10, name)(x) - full),
+                                         ulp * Decimal('0.6'), (prec, name, x))
+
+    def test_signed_zero(self):
+        """odd functions keep the sign of a zero argument."""
+        for name in ('sin', 'tan', 'asin', 'atan'):
+            self.assertEqual(getattr(core10, name)(Decimal('-0')).as_tuple().sign, 1, name)
+
+    def test_shared_state(self):
+        """math10 re-exports the cache and cancellation of core10."""
+        self.assertIs(math10.cached_constant, core10.cached_constant)
+        self.assertIs(math10.checkpoint, core10.checkpoint)
+        with localcontext() as ctx:
+            ctx.prec = 25
+            self.assertIs(core10.pi(), core10.pi())
+            math10.clear_constant_cache()
+            self.assertEqual(core10.pi(), Math10.pi())
+
+
+class ChebyshevTableTests(unittest.TestCase):
+    """sin, cos and atan from the tables at low precision."""
+
+    def test_matches_series(self):
+        """the tables agree with the series worked to more digits."""
+        for prec in (10, 12, 16):
+            for name in ('sin', 'cos', 'atan'):
+                for text in ('0.1', '-0.7', '2.5', '-4', '31.4159', '1E-8', '123456'):
+                    x = Decimal(text)
+                    with localcontext() as ctx:
+                        ctx.prec = prec
+                        self.assertIsNotNone(core10.chebyshev_table(name))
+                        value = getattr(core10, name)(x)
+                        ctx.prec = prec + 20
+                        exact = getattr(core10, name)(x)
+                        ulp = Decimal(1).scaleb(exact.adjusted() - prec + 1)
+                        self.assertLessEqual(abs(value - exact), ulp, (prec, name, text))
+
+    def test_beyond_tables(self):
+        """past CHEBYSHEV_DIGITS the series is used."""
+        with localcontext() as ctx:
+            ctx.prec = core10.CHEBYSHEV_DIGITS + 1
+            self.assertIsNone(core10.chebyshev_table('sin'))
+            self.assertIsNone(core10.chebyshev_table('no such function'))
+
+    def test_special_values(self):
+        """zeros keep their sign; quarter turns land on the axes."""
+        with localcontext() as ctx:
+            ctx.prec = 12
+            self.assertEqual(core10.sin(Decimal('-0')).as_tuple().sign, 1)
+            self.assertEqual(core10.atan(Decimal('-0')).as_tuple().sign, 1)
+            self.assertEqual(core10.cos(Decimal(0)), 1)
+            ctx.prec = 40
+            quarter = core10.pi() / 4
+            ctx.prec = 12
+            self.assertEqual(core10.atan(Decimal(1)), +quarter)
+            self.assertEqual(core10.atan(Decimal('-Infinity')), -2 * quarter)
+
+
+class AnchorTests(unittest.TestCase):
+    """sin, cos and exp from the anchor tables."""
+
+    def test_matches_series(self):
+        """sin and cos from the anchors agree with the series."""
+        for prec in (32, 64, 256):
+            for text in ('0.3', '-0.7', '2.5', '-4', '31.4159', '1E-20', '123456'):
+                x = Decimal(text)
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    values = [core10.sin(x), core10.cos(x)]
+                    saved = core10.ANCHOR_DIGITS
+                    core10.ANCHOR_DIGITS = 0
+                    try:
+                        ctx.prec = prec + 20
+                        exact = [core10.sin(x), core10.cos(x)]
+                    finally:
+                        core10.ANCHOR_DIGITS = saved
+                    ctx.prec = prec
+                    self.assertEqual(values, [+v for v in exact], (prec, text))
+
+    def test_exp_matches_decimal(self):
+        """exp is decimal's own, in any rounding mode."""
+        for prec in (32, 256, 1000):
+            for text in ('0.5', '-0.001', '7.25', '-88.8', '1E-30', '0', '999'):
+                x = Decimal(text)
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    expected = x.exp()
+                    self.assertEqual(core10.exp(x), expected, (prec, text))
+                    ctx.rounding = ROUND_FLOOR
+                    self.assertEqual(core10.exp(x), expected, (prec, text))
+        self.assertIsInstance(Math10('0.5').exp(), Math10)
+
+    def test_directed_rounding(self):
+        """the reductions round to the nearest anchor in every mode."""
+        for prec in (12, 64):
+            for text in ('0.8', '-2.3', '40'):
+                x = Decimal(text)
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    near = [core10.sin(x), core10.cos(x), core10.atan(x)]
+                    ctx.rounding = ROUND_FLOOR
+                    for value, floor in zip(near, [core10.sin(x), core10.cos(x),
+                                                   core10.atan(x)]):
+                        self.assertLessEqual(abs(value - floor), abs(value.next_plus() - value),
+                                             (prec, text))
+
+    def test_tables(self):
+        """the anchors are built once per precision, to a fixed size."""
+        with localcontext() as ctx:
+            ctx.prec = 300
+            step, anchors = core10._sin_cos_anchors()   # pylint: disable=W0212
+            self.assertIs(core10._sin_cos_anchors()[1], anchors)  # pylint: disable=W0212
+            self.assertEqual(len(anchors), 2 ** (core10.ANCHOR_BITS - 2) + 1)
+            self.assertEqual(anchors[-1][0], +core10.sin(step * (len(anchors) - 1)))
+            powers = core10._exp_anchors()              # pylint: disable=W0212
+            self.assertEqual(powers[-1] * powers[1], 1)
+            self.assertEqual(len(powers), 179)
+
+
+class TangentTests(unittest.TestCase):
+    """tan and tanh from one continued fraction."""
+
+    def test_matches_quotients(self):
+        """tan and tanh are sin / cos and sinh / cosh, correctly rounded."""
+        for prec in (12, 30, 100):
+            for text in ('0.3', '-0.7', '1.5707963', '2.5', '-40', '1E-20', '0.5', '12'):
+                x = Decimal(text)
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    values = [core10.tan(x), core10.tanh(x)]
+                    ctx.prec = prec + 20
+                    exact = [core10.sin(x) / core10.cos(x), core10.sinh(x) / core10.cosh(x)]
+                    ctx.prec = prec
+                    for value, full in zip(values, exact):
+                        ulp = Decimal(1).scaleb(full.adjusted() - prec + 1)
+                        self.assertLessEqual(abs(value - full), ulp, (prec, text))
+
+    def test_series_branch(self):
+        """past TAN_ANCHOR_DIGITS tan takes sin and cos from the series."""
+        with localcontext() as ctx:
+            ctx.prec = 50
+            expected = [core10.tan(Decimal(text)) for text in ('0.7', '-2', '100')]
+            saved = core10.TAN_ANCHOR_DIGITS
+            core10.TAN_ANCHOR_DIGITS = 0
+            try:
+                values = [core10.tan(Decimal(text)) for text in ('0.7', '-2', '100')]
+            finally:
+                core10.TAN_ANCHOR_DIGITS = saved
+            self.assertEqual(values, expected)
+
+    def test_near_poles(self):
+        """tan keeps its digits next to a multiple of pi/2."""
+        with localcontext() as ctx:
+            ctx.prec = 100
+            half = core10.pi() / 2
+            ctx.prec = 30
+            x = +half
+            value = core10.tan(x)
+            ctx.prec = 100
+            exact = -1 / (x - half)
+            ctx.prec = 30
+            self.assertEqual(value, +exact)
+
+    def test_special_values(self):
+        """zeros keep their sign and tanh saturates at infinity."""
+        self.assertEqual(core10.tanh(Decimal('-0')).as_tuple().sign, 1)
+        self.assertEqual(core10.tanh(Decimal('Infinity')), 1)
+        self.assertEqual(core10.tanh(Decimal('-Infinity')), -1)
+        self.assertEqual(core10.tanh(Decimal(5000)), 1)
+
+
+class NearZeroTests(unittest.TestCase):
+    """expm1, log1p and the functions built on them near zero."""
+
+    @staticmethod
+    def references(x):
+        """ {name: value} from the plain formulas, at the current precision """
+        e = x.exp()
+        return {'expm1': e - 1, 'log1p': (1 + x).ln(),
+                'sinh': (e - 1 / e) / 2, 'tanh': (e * e - 1) / (e * e + 1),
+                'asinh': (x + (x * x + 1).sqrt()).ln(),
+                'atanh': ((1 + x) / (1 - x)).ln() / 2,
+                'asin': None, 'atan': None}
+
+    def test_matches_references(self):
+        """small arguments keep every digit at the base precision."""
+        for prec in (12, 30, 100):
+            for text in ('0.3', '-0.02', '7E-9', '-3.3E-17', '1E-40', '0.9'):
+                x = Decimal(text)
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    near_one = 1 + abs(x)
+                    ctx.prec = prec + 100
+                    exact = self.references(x)
+                    exact['asin'] = core10.asin(x)
+                    exact['atan'] = core10.atan(x)
+                    exact['acosh'] = core10.acosh(near_one)
+                    ctx.prec = prec
+                    for name, full in exact.items():
+                        value = getattr(core10, name)(near_one if name == 'acosh' else x)
+                        ulp = Decimal(1).scaleb(full.adjusted() - prec + 1)
+                        self.assertLessEqual(abs(value - full), ulp, (prec, name, text))
+
+    def test_special_values(self):
+        """zeros keep their sign; the limits and the domain."""
+        for name in ('expm1', 'log1p', 'sinh', 'asinh', 'atanh'):
+            self.assertEqual(getattr(core10, name)(Decimal('-0')).as_tuple().sign, 1, name)
+        self.assertEqual(core10.expm1(Decimal('-Infinity')), -1)
+        self.assertEqual(core10.log1p(Decimal('Infinity')), Decimal('Infinity'))
+        self.assertEqual(core10.sinh(Decimal('-Infinity')), Decimal('-Infinity'))
+        self.assertRaises(ValueError, core10.log1p, Decimal(-1))
+        self.assertEqual(core10.acosh(Decimal(1)), 0)
+
+
+class StoredConstantTests(unittest.TestCase):
+    """pi, e, ln2 and ln10 from the precomputed digits."""
+
+    def test_matches_computed(self):
+        """stored constants are the correctly rounded values."""
+        computed = {'e': lambda: Decimal(1).exp(),
+                    'ln2': lambda: Decimal(2).ln(),
+                    'ln10': lambda: Decimal(10).ln()}
+        for prec in (10, 28, 500):
+            with localcontext() as ctx:
+                for name, compute in computed.items():
+                    ctx.prec = prec
+                    self.assertEqual(core10.stored_constant(name), compute(), name)
+                ctx.prec = prec + 20
+                pi = core10._compute_pi()     # pylint: disable=W0212
+                ctx.prec = prec
+                self.assertEqual(core10.stored_constant('pi'), +pi)
+
+    def test_directed_rounding(self):
+        """the stored digits bracket the constant in every mode."""
+        with localcontext() as ctx:
+            ctx.prec = 30
+            ctx.rounding = ROUND_FLOOR
+            low = core10.stored_constant('pi')
+            ctx.rounding = ROUND_CEILING
+            self.assertEqual(core10.stored_constant('pi'), low.next_plus())
+
+    def test_beyond_stored(self):
+        """past the stored digits the constant must be computed."""
+        with localcontext() as ctx:
+            ctx.prec = core10.STORED_DIGITS - core10.STORED_GUARD
+            self.assertIsNotNone(core10.stored_constant('ln2'))
+            # deciding the rounding takes a digit beyond the precision
+            ctx.prec = core10.STORED_DIGITS
+            self.assertIsNone(core10.stored_constant('ln2'))
+            self.assertIsNone(core10.stored_constant('no such constant'))
+
+    def test_write_constants(self):
+        """the generator reproduces the shipped file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'constants.txt')
+            core10.write_constants(path, 300)
+            with open(path, encoding='ascii') as stream:
+                written = stream.read().split("\n")[1:-1]
+        with open(core10._data_paths(core10.CONSTANTS_FILE)[0], encoding='ascii') as stream:  # pylint: disable=W0212
+            shipped = stream.read().split("\n")[1:-1]
+        self.assertEqual(len(written), len(shipped))
+        for line, full in zip(written, shipped):
+            self.assertTrue(full.startswith(line), line[:20])
+
+
+class AGMTests(unittest.TestCase):
+    """ln, exp and pi from the arithmetic-geometric mean."""
+
+    def test_ln_matches_decimal(self):
+        """the AGM ln is decimal's correctly rounded ln."""
+        texts = ('2', '0.001', '7.389', '1E+300', '3E-200', '0.999999', '1.0000000000000000000001')
+        for prec in (core10.AGM_DIGITS + 1, 700):
+            with localcontext() as ctx:
+                ctx.prec = prec
+                ctx.rounding = ROUND_FLOOR
+                for text in texts:
+                    x = Decimal(text)
+                    self.assertEqual(core10.ln(x), x.ln(), (prec, text))
+                    self.assertEqual(Math10(x).ln(), x.ln())
+                self.assertIsInstance(Math10(3).ln(), Math10)
+                for text in ('0', '1', 'Infinity'):
+                    self.assertEqual(core10.ln(Decimal(text)), Decimal(text).ln())
+
+    def test_exp_matches_decimal(self):
+        """Newton's method on the AGM ln gives decimal's exp."""
+        with localcontext() as ctx:
+            ctx.prec = core10.AGM_EXP_DIGITS + 1
+            for text in ('1', '-0.75', '23.5', '-1000.125'):
+                x = Decimal(text)
+                self.assertEqual(core10.exp(x), x.exp(), text)
+            huge = Decimal('1E+7')
+            self.assertEqual(core10.exp(-huge), (-huge).exp())
+
+    def test_constants_against_stored(self):
+        """pi and ln 10 from the AGM agree with the stored digits."""
+        with localcontext() as ctx:
+            ctx.prec = 3000
+            agm_rounded = core10._agm_rounded      # pylint: disable=W0212
+            self.assertEqual(agm_rounded(core10._agm_pi),  # pylint: disable=W0212
+                             core10.stored_constant('pi'))
+            self.assertEqual(agm_rounded(core10._agm_ln10),  # pylint: disable=W0212
+                             core10.stored_constant('ln10'))
+
+    def test_sqrt(self):
+        """the Newton square root is within an ulp of decimal's."""
+        sqrt = core10._sqrt                         # pylint: disable=W0212
+        with localcontext() as ctx:
+            ctx.prec = 1000
+            for text in ('2', '0.5', '1E+99', '123456.789'):
+                x = Decimal(text)
+                root = x.sqrt()
+                ulp = Decimal(1).scaleb(root.adjusted() - ctx.prec + 1)
+                self.assertLessEqual(abs(sqrt(x) - root), ulp, text)
+
+    def test_shared_prec(self):
+        """nearby precisions meet on one rung of the ladder."""
+        shared = core10._shared_prec                # pylint: disable=W0212
+        self.assertEqual(shared(100), 100)
+        self.assertEqual(shared(100010), shared(100020))
+        self.assertGreaterEqual(shared(100010), 100010)
+        self.assertLess(shared(100010), 100010 * 65 // 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+""" Unit test suite for fft10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+import cmath
+from decimal import Decimal, localcontext
+import unittest
+
+from cmath10 import CMath10
+from fft10 import fft, fft_columns, ifft, ifft_columns
+from math10 import clear_constant_cache
+
+
+def naive_dft(values):
+    """the O(n^2) definition, in floats"""
+    n = len(values)
+    return [sum(x * cmath.exp(-2j * cmath.pi * j * k / n)
+                for k, x in enumerate(values)) for j in range(n)]
+
+
+class FFT10Tests(unittest.TestCase):
+    """Radix-2 and Bluestein transforms against the definition."""
+
+    def check(self, n):
+        """fft of a length-n sequence matches the float DFT"""
+        values = [complex((3 * k) % 7 - 3, (5 * k) % 11 / 4) for k in range(n)]
+        with localcontext() as ctx:
+            ctx.prec = 30
+            got = fft([CMath10(Decimal(z.real), Decimal(z.imag)) for z in values])
+        for j, want in enumerate(naive_dft(values)):
+            self.assertTrue(cmath.isclose(complex(float(got[j].real),
+                                                  float(got[j].imag)),
+                                          want, abs_tol=1e-9), f"{n} {j}")
+
+    def test_radix2(self):
+        """power-of-two lengths."""
+        for n in (1, 2, 4, 8, 16, 64):
+            self.check(n)
+
+    def test_bluestein(self):
+        """other lengths."""
+        for n in (3, 5, 6, 12, 17, 30):
+            self.check(n)
+
+    def test_round_trip(self):
+        """ifft(fft(x)) == x at the working precision."""
+        with localcontext() as ctx:
+            ctx.prec = 40
+            for n in (8, 12):
+                values = [CMath10(Decimal(k) / 7, -k) for k in range(n)]
+                back = ifft(fft(values))
+                for z, w in zip(values, back):
+                    self.assertTrue(z.isclose(w, rel_tol=1e-37, abs_tol=1e-37))
+
+    def test_exact_impulse(self):
+        """an impulse transforms to all ones and back, exactly."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            real, imag = fft_columns([1] + [0] * 15, [0] * 16)
+            self.assertEqual(real, [1] * 16)
+            self.assertEqual(imag, [0] * 16)
+            real, imag = ifft_columns(real, imag)
+            self.assertEqual(real, [1] + [0] * 15)
+
+    def test_twiddle_cache(self):
+        """cached twiddles give the same answer as fresh ones."""
+        values = [CMath10(k, 1) for k in range(32)]
+        with localcontext() as ctx:
+            ctx.prec = 25
+            first = fft(values)
+            clear_constant_cache()
+            self.assertEqual(fft(values), first)
+
+    def test_errors(self):
+        """empty input and mismatched columns."""
+        self.assertEqual(fft([]), [])
+        self.assertRaises(ValueError, fft_columns, [1, 2], [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+""" Unit test suite for linalg10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import Decimal, localcontext
+import unittest
+
+from cmath10 import CMath10
+from linalg10 import Matrix, matmul
+
+
+def sample(n):
+    """a well-conditioned complex n x n matrix"""
+    return Matrix([[CMath10(n if i == j else Decimal((i * 7 + j * 3) % 5) / 4,
+                            (i - j) % 3) for j in range(n)] for i in range(n)])
+
+
+class Linalg10Tests(unittest.TestCase):
+    """Products, factorizations and solves."""
+
+    def assert_close(self, a, b, tol=1e-25):
+        """entrywise closeness of two matrices"""
+        self.assertEqual(a.shape, b.shape)
+        for row_a, row_b in zip(a.rows(), b.rows()):
+            for z, w in zip(row_a, row_b):
+                self.assertTrue(z.isclose(w, rel_tol=tol, abs_tol=tol), f"{z} {w}")
+
+    def test_from_parts(self):
+        """a Matrix built from its rows of real and imaginary parts."""
+        m = Matrix.from_parts([[Decimal(1), Decimal(2)]], [[Decimal(0), Decimal(-1)]])
+        self.assertEqual(m, Matrix([[1, CMath10(2, -1)]]))
+        self.assertEqual(m.shape, (1, 2))
+        self.assertEqual(Matrix.from_parts([], []).shape, (0, 0))
+
+    def test_matmul(self):
+        """small exact products, and the single rounding."""
+        a = Matrix([[1, CMath10(0, 1)], [2, 3]])
+        b = Matrix([[CMath10(0, 1), 1], [1, 0]])
+        self.assertEqual(a @ b, Matrix([[CMath10(0, 2), 1],
+                                        [CMath10(3, 2), 2]]))
+        with localcontext() as ctx:
+            ctx.prec = 5
+            row = Matrix([[Decimal('1.0001'), -1]])
+            col = Matrix([[Decimal('1.0001')], [1]])
+            self.assertEqual(matmul(row, col)[0, 0], Decimal('0.00020001'))
+        self.assertRaises(ValueError, matmul, a, Matrix([[1, 2, 3]]))
+
+    def test_solve(self):
+        """a @ solve(b) reproduces b."""
+        with localcontext() as ctx:
+            ctx.prec = 30
+            for n in (1, 2, 5, 12):
+                a = sample(n)
+                b = [CMath10(k, -k) for k in range(n)]
+                x = a.solve(b)
+                self.assert_close(a @ Matrix([[z] for z in x]),
+                                  Matrix([[z] for z in b]))
+
+    def test_pivoting(self):
+        """a zero leading entry needs a row exchange."""
+        a = Matrix([[0, 1], [1, 0]])
+        self.assertEqual(a.solve([2, 3]), [CMath10(3, 0), CMath10(2, 0)])
+        self.assertEqual(a.det(), CMath10(-1, 0))
+
+    def test_det(self):
+        """known determinants."""
+        a = Matrix([[CMath10(1, 1), 2], [3, CMath10(4, -1)]])
+        self.assertEqual(a.det(), CMath10(-1, 3))
+        self.assertEqual(Matrix.identity(4).det(), 1)
+        self.assertRaises(ValueError, Matrix([[1, 2], [2, 4]]).det)
+
+    def test_inverse(self):
+        """a @ inverse(a) is the identity."""
+        with localcontext() as ctx:
+            ctx.prec = 30
+            a = sample(6)
+            self.assert_close(a @ a.inverse(), Matrix.identity(6))
+            lu = a.lu()
+            self.assertEqual(lu.solve(Matrix.identity(6)), a.inverse())
+
+    def test_shapes(self):
+        """rectangular input is rejected where it cannot work."""
+        self.assertRaises(ValueError, Matrix, [[1, 2], [3]])
+        self.assertRaises(ValueError, Matrix([[1, 2]]).lu)
+        self.assertEqual(Matrix([[1, 2], [3, 4]]).transpose(),
+                         Matrix([[1, 3], [2, 4]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
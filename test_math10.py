@@ -13,9 +13,12 @@
 import os
 import unittest
 import math as builtin_math
+from decimal import Decimal, localcontext
 
 from math10 import StdLibAdapter as m
-from math10 import Math10
+from math10 import CorrectlyRoundedAdapter as cr
+from math10 import FastPathAdapter as fast
+from math10 import Math10, cached_constant, correctly_rounded, dot, finalize, fsum
 
 # Tolerances for Decimal vs float expected (PEP 485 style)
 REL_TOL = 1e-12
@@ -96,6 +99,18 @@ class Math10Tests(unittest.TestCase):
         self.ftest('pi', m.pi(), 3.141592653589793238462643)
         self.ftest('e', m.e(), 2.718281828459045235360287)
 
+    def test_constant_cache(self):
+        """constants are cached per precision"""
+        with localcontext() as ctx:
+            ctx.prec = 50
+            self.assertEqual(str(m.pi()),
+                    "3.1415926535897932384626433832795028841971693993751")
+            self.assertIs(cached_constant('pi', None),
+                          cached_constant('pi', None))
+            ctx.prec = 10
+            self.assertEqual(str(m.pi()), "3.141592654")
+            self.assertEqual(str(m.e()), "2.718281828")
+
     def test_acos(self):
         """inverse cosine"""
         self.ftest('acos(-1)', m.acos(-1), builtin_math.pi)
@@ -139,6 +154,21 @@ class Math10Tests(unittest.TestCase):
         self.assertRaises(ValueError, m.atanh, 1)
         self.assertRaises(ValueError, m.atanh, -1)
 
+    def test_expm1(self):
+        """e ** x - 1"""
+        self.ftest('expm1(0)', m.expm1(0), 0)
+        self.ftest('expm1(1e-10)', m.expm1(1e-10), builtin_math.expm1(1e-10))
+        self.ftest('expm1(-2)', m.expm1(-2), builtin_math.expm1(-2))
+        self.assertIsInstance(Math10('1E-30').expm1(), Math10)
+
+    def test_log1p(self):
+        """ln(1 + x)"""
+        self.ftest('log1p(0)', m.log1p(0), 0)
+        self.ftest('log1p(1e-10)', m.log1p(1e-10), builtin_math.log1p(1e-10))
+        self.ftest('log1p(3)', m.log1p(3), builtin_math.log1p(3))
+        self.assertRaises(ValueError, m.log1p, -1)
+        self.assertIsInstance(Math10('1E-30').log1p(), Math10)
+
     def test_atan2(self):
         """inverse tan2"""
         self.ftest('atan2(-1, 0)', m.atan2(-1, 0), -builtin_math.pi / 2)
@@ -180,6 +210,82 @@ class Math10Tests(unittest.TestCase):
         self.ftest('tanh(0)', m.tanh(0), 0)
         self.ftest('tanh(1)', m.tanh(1), 0.76159415595576485)
 
+    def test_correctly_rounded(self):
+        """Ziv adapter equals a much more precise result, rounded"""
+        names = ['cos', 'sin', 'tan', 'acos', 'asin', 'atan', 'cosh',
+                 'acosh', 'sinh', 'asinh', 'tanh', 'atanh', 'expm1', 'log1p']
+        for prec in (10, 16, 28):
+            for name in names:
+                for x in ['0.1', '-0.7', '0.999', '1e-8', '1.5', '25']:
+                    with localcontext() as ctx:
+                        ctx.prec = prec + 40
+                        try:
+                            expected = getattr(m, name)(Decimal(x))
+                        except ValueError:
+                            continue
+                        ctx.prec = prec
+                        self.assertEqual(getattr(cr, name)(Decimal(x)),
+                                         +expected, f"{name}({x}) @ {prec}")
+
+    def test_correctly_rounded_midpoint(self):
+        """an exact tie still terminates, rounding half even"""
+        with localcontext() as ctx:
+            ctx.prec = 2
+            self.assertEqual(correctly_rounded(Decimal('1.5625').sqrt),
+                             Decimal('1.2'))
+
+    def test_fsum(self):
+        """exact accumulation, one rounding at the end"""
+        with localcontext() as ctx:
+            ctx.prec = 10
+            self.assertEqual(fsum([Decimal('1e30'), 1, Decimal('-1e30')]), 1)
+            self.assertEqual(fsum(Decimal('0.1') for _ in range(1000)), 100)
+            self.assertEqual(fsum([Decimal('1.000000000'), Decimal('5e-10'),
+                                   Decimal('1e-30')]), Decimal('1.000000001'))
+            self.assertEqual(fsum([]), 0)
+            self.assertIsInstance(fsum([1, 2]), Math10)
+
+    def test_dot(self):
+        """exact products and sum, one rounding at the end"""
+        with localcontext() as ctx:
+            ctx.prec = 5
+            a = [Decimal('1.0001'), Decimal('-1.0001')]
+            self.assertEqual(dot(a, [Decimal('1.0001'), 1]), Decimal('0.00010001'))
+            self.assertEqual(dot(iter([1, 2, 3]), iter([4, 5, 6])), 32)
+            self.assertRaises(ValueError, dot, [1, 2], [1])
+
+    def test_result_digits(self):
+        """results are rounded once to the context precision"""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            x = Math10('0.3')
+            for name in sorted(MATH10_FUNCTIONS - {'acosh'}):
+                result = getattr(x, name)()
+                self.assertIsInstance(result, Math10)
+                self.assertLessEqual(len(result.as_tuple().digits), 20, name)
+            self.assertLessEqual(len(Math10.atan2(x, Math10(3)).as_tuple().digits), 20)
+            self.assertEqual(finalize(Math10('-0')).as_tuple().sign, 1)
+
+    @unittest.skipUnless(os.path.isfile(CMATH_TESTCASES), "mathdata/cmath_testcases.txt not found")
+    def test_fast_path(self):
+        """float fast path agrees with the decimal path on the test file"""
+        for prec in (12, 15):
+            for (id_, fn, arg_real, arg_imag, _, _, _) in\
+                    parse_testfile(CMATH_TESTCASES):
+                if fn not in MATH10_FUNCTIONS or arg_imag != 0.0:
+                    continue
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    try:
+                        expected = getattr(cr, fn)(arg_real)
+                    except ValueError:
+                        continue
+                    got = getattr(fast, fn)(arg_real)
+                self.assertEqual(got, expected, f"{id_} {fn}({arg_real}) @ {prec}")
+        with localcontext() as ctx:
+            ctx.prec = 12
+            self.assertEqual(fast.atan2(1, -1), cr.atan2(1, -1))
+
     @unittest.skipUnless(os.path.isfile(CMATH_TESTCASES), "mathdata/cmath_testcases.txt not found")
     def test_mtestcases(self):
         """Run real-axis cases from cmath_testcases.txt for math10 functions."""
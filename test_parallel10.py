@@ -0,0 +1,65 @@
+""" Unit test suite for parallel10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import getcontext, localcontext
+import threading
+import unittest
+
+from cmath10 import CMath10
+from math10 import Math10
+from parallel10 import evaluate_many, gil_enabled
+
+PI_50 = "3.1415926535897932384626433832795028841971693993751"
+
+
+class Parallel10Tests(unittest.TestCase):
+    """Thread-pool evaluation and per-thread precision."""
+
+    def test_matches_serial(self):
+        """evaluate_many gives the serial results, in order."""
+        args = [CMath10(k, -k) for k in range(12)]
+        expected = [z.exp() for z in args]
+        got = evaluate_many(CMath10.exp, args, max_workers=4)
+        for e, g in zip(expected, got):
+            self.assertEqual((e.real, e.imag), (g.real, g.imag))
+
+    def test_caller_context(self):
+        """Workers compute at the submitting thread's precision."""
+        with localcontext() as ctx:
+            ctx.prec = 50
+            got = evaluate_many(lambda _: Math10.pi(), range(8), 4)
+        for value in got:
+            self.assertEqual(str(value), PI_50)
+
+    def test_threads_at_different_precisions(self):
+        """Concurrent threads at different precisions do not interfere."""
+        results = {}
+
+        def work(prec):
+            getcontext().prec = prec
+            for _ in range(20):
+                z = CMath10(1, 1).exp()
+                results.setdefault(prec, set()).add(
+                    (str(Math10.pi()), str(z.real), getcontext().prec))
+
+        threads = [threading.Thread(target=work, args=(p,))
+                   for p in (16, 28, 40, 60) * 2]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for prec, seen in results.items():
+            self.assertEqual(len(seen), 1, f"prec {prec}: {seen}")
+            pi, _, ctx_prec = seen.pop()
+            self.assertEqual(ctx_prec, prec)
+            self.assertEqual(len(pi.replace('.', '')), prec)
+
+    def test_gil_enabled(self):
+        """gil_enabled reports a bool on every interpreter."""
+        self.assertIsInstance(gil_enabled(), bool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+""" Unit test suite for progressive10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import localcontext
+import unittest
+
+from cmath10 import CMath10
+from math10 import Math10
+from progressive10 import agreeing_digits, refine, settle
+
+
+class Progressive10Tests(unittest.TestCase):
+    """Each refinement matches a direct evaluation at its precision."""
+
+    def check(self, func, arg, stop=256):
+        """compare refine() against func(arg) at every precision"""
+        precs = []
+        for value in refine(func, arg, stop=stop):
+            with localcontext() as ctx:
+                ctx.prec = 16 * 2 ** len(precs)
+                expected = func(arg)
+            precs.append(ctx.prec)
+            self.assertGreaterEqual(agreeing_digits(value, expected, ctx.prec),
+                                    ctx.prec - 1, f"{func.__name__} {ctx.prec}")
+        self.assertEqual(precs, [16, 32, 64, 128, 256])
+
+    def test_series(self):
+        """functions without a Newton step are re-evaluated."""
+        self.check(Math10.sin, Math10(1))
+        self.check(CMath10.exp, CMath10(1, 2))
+
+    def test_newton(self):
+        """Newton refinement keeps full accuracy."""
+        self.check(Math10.asin, Math10('0.3'))
+        self.check(Math10.asin, Math10('-0.95'))
+        self.check(CMath10.log, CMath10(3, 4))
+
+    def test_digits_grow(self):
+        """every refinement carries more digits than the last."""
+        lengths = [len(str(v)) for v in refine(Math10.atan, Math10(2), stop=64)]
+        self.assertEqual(lengths, sorted(lengths))
+        self.assertEqual(len(lengths), 3)
+
+    def test_settle(self):
+        """settle stops once enough leading digits agree."""
+        value = settle(Math10.atan, Math10(2), 20)
+        self.assertTrue(str(value).startswith("1.10714871779409050301"))
+
+    def test_agreeing_digits(self):
+        """leading-digit agreement count."""
+        self.assertEqual(agreeing_digits(Math10('1.2345'), Math10('1.2346')), 4)
+        with localcontext() as ctx:
+            ctx.prec = 30
+            self.assertEqual(agreeing_digits(Math10('5'), Math10('5')), 30)
+        self.assertEqual(agreeing_digits(CMath10(2, 0), CMath10('2.001', 0), 50), 3)
+
+    def test_settle_exact_parts(self):
+        """an exact zero part agrees fully, and settle has a bound."""
+        value = settle(CMath10.exp, CMath10(1, 0), 20)
+        self.assertTrue(str(value.real).startswith("2.7182818284590452353"))
+        self.assertRaises(ArithmeticError, settle, Math10.atan, Math10(2), 40, stop=32)
+
+    def test_newton_keeps_type(self):
+        """Newton refinements come back as the type of the first."""
+        kinds = {type(v) for v in refine(Math10.asin, Math10('0.5'), stop=64)}
+        self.assertEqual(kinds, {Math10})
+
+
+if __name__ == '__main__':
+    unittest.main()
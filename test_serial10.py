@@ -0,0 +1,77 @@
+""" Unit test suite for serial10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import Decimal
+import os
+import tempfile
+import unittest
+
+from cmath10 import CMath10
+import serial10
+
+VALUES = [CMath10('0.1', '-2.5'), CMath10('Infinity', '-0'),
+          CMath10('-Infinity', 'NaN'), CMath10('1E+999', '-1.00E-999'),
+          CMath10('123456789012345678901234567890.123456789', 7), 3,
+          Decimal('-0.000')]
+
+
+def components(z):
+    """(real, imag) as strings, so NaNs, zeros and trailing zeros
+    compare exactly"""
+    if not isinstance(z, CMath10):
+        z = CMath10(z, 0)
+    return str(Decimal(z.real)), str(Decimal(z.imag))
+
+
+class Serial10Tests(unittest.TestCase):
+    """Round trips through bytes and files."""
+
+    def test_encode(self):
+        """single values keep sign, exponent and digits."""
+        for z in VALUES:
+            self.assertEqual(components(serial10.decode(serial10.encode(z))),
+                             components(z))
+        self.assertEqual(len(serial10.encode(CMath10('0.1', 0))), 5)
+        self.assertRaises(ValueError, serial10.decode,
+                          serial10.encode(1) + b'\x00')
+
+    def test_nan_payloads(self):
+        """quiet and signaling NaNs keep their payloads."""
+        z = CMath10(Decimal('NaN123'), Decimal('-sNaN'))
+        self.assertEqual(components(serial10.decode(serial10.encode(z))),
+                         ('NaN123', '-sNaN'))
+
+    def test_dumps(self):
+        """bulk bytes round trip and random access."""
+        data = serial10.dumps(VALUES)
+        self.assertEqual([components(z) for z in serial10.loads(data)],
+                         [components(z) for z in VALUES])
+        reader = serial10.Reader(data)
+        self.assertEqual(len(reader), len(VALUES))
+        self.assertEqual(components(reader[-3]), components(VALUES[-3]))
+        self.assertEqual([components(z) for z in reader[1:3]],
+                         [components(z) for z in VALUES[1:3]])
+        self.assertRaises(IndexError, reader.__getitem__, len(VALUES))
+        self.assertEqual(serial10.loads(serial10.dumps([])), [])
+
+    def test_file(self):
+        """a file is mapped and decoded lazily."""
+        values = [CMath10(k, -k) / 7 for k in range(1000)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'values.c10')
+            serial10.write(path, iter(values))
+            with serial10.Reader(path) as reader:
+                self.assertEqual(len(reader), 1000)
+                self.assertEqual(reader[567], values[567])
+                self.assertEqual(list(reader), values)
+            self.assertEqual(serial10.read(path), values)
+
+    def test_not_a_container(self):
+        """foreign data is rejected."""
+        self.assertRaises(ValueError, serial10.Reader, b'nonsense' * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+""" Unit test suite for sweep10.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from decimal import Decimal, localcontext
+import unittest
+
+from cmath10 import CMath10, StdLibAdapter as CAdapter
+from math10 import Math10, StdLibAdapter
+from sweep10 import MAX_INTERVAL, MIN_INTERVAL, interval, sweep, sweep_columns
+
+
+def ulps(value, want, scale, prec):
+    """|value - want| in units of the last place of scale"""
+    return abs(value - want) / Decimal(1).scaleb(scale.adjusted() - prec + 1)
+
+
+class Sweep10Tests(unittest.TestCase):
+    """Recurrences against one evaluation per point."""
+
+    prec = 30
+
+    def count(self):
+        """enough points to cross several fresh evaluations"""
+        return 3 * interval(self.prec) + 7
+
+    def check_real(self, func, start, step, relative):
+        """sweep of a real func matches func at each point"""
+        with localcontext() as ctx:
+            ctx.prec = self.prec
+            for k, value in enumerate(sweep(func, start, step, self.count())):
+                want = func(Math10(start + k * step))
+                scale = abs(want) if relative else Decimal(1)
+                self.assertLessEqual(ulps(value, want, scale, self.prec), 1, f"{func} {k}")
+                self.assertIsInstance(value, Math10)
+
+    def check_complex(self, func, start, step):
+        """sweep of a complex func matches func at each point"""
+        with localcontext() as ctx:
+            ctx.prec = self.prec
+            for k, value in enumerate(sweep(func, start, step, self.count())):
+                want = func(start.add(step.mul(CMath10(k, 0))))
+                scale = max(abs(want.real), abs(want.imag))
+                self.assertLessEqual(ulps(value.real, want.real, scale, self.prec), 1)
+                self.assertLessEqual(ulps(value.imag, want.imag, scale, self.prec), 1)
+                self.assertIsInstance(value, CMath10)
+
+    def test_real(self):
+        """exp relative to its value, sin and cos relative to 1."""
+        start, step = Decimal('-3.7'), Decimal('0.0123456789')
+        self.check_real(Math10.exp, start, step, True)
+        self.check_real(Math10.sin, start, step, False)
+        self.check_real(Math10.cos, start, step, False)
+        self.check_real(StdLibAdapter.sin, start, step, False)
+
+    def test_complex(self):
+        """exp, sin and cos of a complex grid."""
+        start = CMath10(Decimal('-1.3'), Decimal('2.1'))
+        step = CMath10(Decimal('0.0071'), Decimal('-0.0033'))
+        for func in (CMath10.exp, CMath10.sin, CMath10.cos, CAdapter.exp):
+            self.check_complex(func, start, step)
+
+    def test_off_real_axis(self):
+        """a small imaginary part keeps its own digits."""
+        start = CMath10(1, Decimal('1E-20'))
+        step = CMath10(Decimal('0.001'), 0)
+        with localcontext() as ctx:
+            ctx.prec = 28
+            for func in (CMath10.sin, CMath10.cos):
+                for k, value in enumerate(sweep(func, start, step, 3 * interval(28))):
+                    want = func(start.add(step.mul(CMath10(k, 0))))
+                    self.assertLessEqual(ulps(value.real, want.real, abs(want.real), 28), 1)
+                    self.assertLessEqual(ulps(value.imag, want.imag, abs(want.imag), 28), 1)
+
+    def test_columns(self):
+        """sweep_columns holds the same values as sweep."""
+        with localcontext() as ctx:
+            ctx.prec = 25
+            values = list(sweep(Math10.exp, 1, Decimal('0.5'), 10))
+            self.assertEqual(sweep_columns(Math10.exp, 1, Decimal('0.5'), 10), values)
+            start, step = CMath10(0, 1), CMath10(Decimal('0.25'), 0)
+            real, imag = sweep_columns(CMath10.sin, start, step, 10)
+            values = list(sweep(CMath10.sin, start, step, 10))
+            self.assertEqual(real, [z.real for z in values])
+            self.assertEqual(imag, [z.imag for z in values])
+            self.assertEqual(sweep_columns(Math10.sin, 0, 1, 0), [])
+            self.assertEqual(sweep_columns(CMath10.exp, start, step, 0), ([], []))
+
+    def test_other_functions(self):
+        """a function without a recurrence is evaluated at each point."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            got = list(sweep(Math10.atan, Decimal('0.5'), Decimal('0.25'), 5))
+            self.assertEqual(got, [Math10(Decimal('0.5') + k * Decimal('0.25')).atan()
+                                   for k in range(5)])
+            real, _ = sweep_columns(CMath10.log, CMath10(1, 1), CMath10(1, 0), 3)
+            self.assertEqual(real[2], CMath10(3, 1).log().real)
+
+    def test_context_at_call(self):
+        """results are rounded to the context of the call."""
+        with localcontext() as ctx:
+            ctx.prec = 20
+            values = sweep(Math10.exp, 0, Decimal('0.1'), 3)
+            ctx.prec = 50
+            self.assertEqual([len(v.as_tuple().digits) for v in values][1:], [20, 20])
+
+    def test_interval(self):
+        """fresh evaluations grow further apart with the precision."""
+        self.assertEqual(interval(1), MIN_INTERVAL)
+        self.assertEqual(interval(10 ** 6), MAX_INTERVAL)
+        self.assertLess(interval(100), interval(1000))
+
+
+if __name__ == '__main__':
+    unittest.main()